@@ -9,6 +9,7 @@ development and production environments with appropriate defaults and security m
 import os
 import logging
 from typing import Optional, Dict, Any, List
+from datetime import date
 from dataclasses import dataclass, field
 from enum import Enum
 import boto3
@@ -101,19 +102,54 @@ class MarketDataConfig:
     finnhub_api_key: str
     finnhub_base_url: str = "https://finnhub.io/api/v1"
     cache_ttl_seconds: int = 60
+    cache_hard_ttl_seconds: int = 300
+    cache_extended_ttl_seconds: int = 300
+    cache_extended_hard_ttl_seconds: int = 1800
+    cache_closed_hard_ttl_seconds: int = 345600
+    extra_market_holidays: List[str] = field(default_factory=list)
     rate_limit_per_minute: int = 60
     timeout_seconds: int = 10
+    circuit_failure_threshold: int = 5
+    circuit_recovery_seconds: int = 60
+    circuit_half_open_calls: int = 1
+    circuit_error_rate_threshold: float = 0.5
+    circuit_window_seconds: int = 60
+    profile_cache_ttl_seconds: int = 86400
+    profile_cache_path: Optional[str] = None
+    profile_cache_save_delay_seconds: float = 5.0
+    symbol_universe_path: Optional[str] = None
+    symbol_universe_reload_seconds: int = 300
+    redis_url: str = "redis://localhost:6379/0"
+    redis_max_connections: int = 20
+    streaming_enabled: bool = False
+    streaming_url: str = "wss://ws.finnhub.io"
     
     def __post_init__(self):
         """Validate market data configuration."""
         if not self.finnhub_api_key:
             raise ValueError("Finnhub API key is required")
+        if self.circuit_half_open_calls < 1:
+            raise ValueError("Circuit breaker half-open calls must be at least 1")
+        if not 0 < self.circuit_error_rate_threshold <= 1:
+            raise ValueError("Circuit breaker error rate must be between 0 and 1")
+        if self.cache_hard_ttl_seconds < self.cache_ttl_seconds:
+            raise ValueError("Market data hard cache TTL must not be shorter than the cache TTL")
+        if self.cache_extended_hard_ttl_seconds < self.cache_extended_ttl_seconds:
+            raise ValueError("Extended-hours hard cache TTL must not be shorter than the extended-hours cache TTL")
+        for holiday in self.extra_market_holidays:
+            try:
+                date.fromisoformat(holiday)
+            except ValueError:
+                raise ValueError(f"Invalid extra market holiday (expected YYYY-MM-DD): {holiday}")
         
         if self.rate_limit_per_minute <= 0:
             raise ValueError("Rate limit must be positive")
         
         if self.timeout_seconds <= 0:
             raise ValueError("Timeout must be positive")
+        
+        if self.symbol_universe_reload_seconds <= 0:
+            raise ValueError("Symbol universe reload interval must be positive")
 
 
 @dataclass
@@ -126,6 +162,10 @@ class TradingConfig:
     supported_symbols: List[str] = field(default_factory=lambda: [
         "AAPL", "GOOGL", "MSFT", "AMZN", "TSLA", "META", "NVDA", "NFLX"
     ])
+    execution_history_size: int = 10000
+    execution_spill_path: Optional[str] = None
+    order_workers: int = 4
+    order_queue_size: int = 1000
     
     def __post_init__(self):
         """Validate trading configuration."""
@@ -137,6 +177,15 @@ class TradingConfig:
         
         if self.max_trade_value <= 0:
             raise ValueError("Maximum trade value must be positive")
+        
+        if self.execution_history_size <= 0:
+            raise ValueError("Execution history size must be positive")
+        
+        if self.order_workers <= 0:
+            raise ValueError("Order worker count must be positive")
+        
+        if self.order_queue_size <= 0:
+            raise ValueError("Order queue size must be positive")
 
 
 @dataclass
@@ -344,8 +393,29 @@ class ConfigurationManager:
                 finnhub_api_key=self._get_required_env('FINNHUB_API_KEY'),
                 finnhub_base_url=os.getenv('FINNHUB_BASE_URL', 'https://finnhub.io/api/v1'),
                 cache_ttl_seconds=int(os.getenv('MARKET_DATA_CACHE_TTL', '60')),
+                cache_hard_ttl_seconds=int(os.getenv('MARKET_DATA_CACHE_HARD_TTL', '300')),
+                cache_extended_ttl_seconds=int(os.getenv('MARKET_DATA_CACHE_EXTENDED_TTL', '300')),
+                cache_extended_hard_ttl_seconds=int(os.getenv('MARKET_DATA_CACHE_EXTENDED_HARD_TTL', '1800')),
+                cache_closed_hard_ttl_seconds=int(os.getenv('MARKET_DATA_CACHE_CLOSED_HARD_TTL', '345600')),
+                extra_market_holidays=[
+                    day.strip() for day in os.getenv('MARKET_DATA_EXTRA_HOLIDAYS', '').split(',') if day.strip()
+                ],
                 rate_limit_per_minute=int(os.getenv('MARKET_DATA_RATE_LIMIT', '60')),
-                timeout_seconds=int(os.getenv('MARKET_DATA_TIMEOUT', '10'))
+                timeout_seconds=int(os.getenv('MARKET_DATA_TIMEOUT', '10')),
+                circuit_failure_threshold=int(os.getenv('MARKET_DATA_CIRCUIT_FAILURE_THRESHOLD', '5')),
+                circuit_recovery_seconds=int(os.getenv('MARKET_DATA_CIRCUIT_RECOVERY_SECONDS', '60')),
+                circuit_half_open_calls=int(os.getenv('MARKET_DATA_CIRCUIT_HALF_OPEN_CALLS', '1')),
+                circuit_error_rate_threshold=float(os.getenv('MARKET_DATA_CIRCUIT_ERROR_RATE', '0.5')),
+                circuit_window_seconds=int(os.getenv('MARKET_DATA_CIRCUIT_WINDOW_SECONDS', '60')),
+                profile_cache_ttl_seconds=int(os.getenv('MARKET_DATA_PROFILE_TTL', '86400')),
+                profile_cache_path=os.getenv('MARKET_DATA_PROFILE_CACHE_PATH') or None,
+                profile_cache_save_delay_seconds=float(os.getenv('MARKET_DATA_PROFILE_SAVE_DELAY', '5')),
+                symbol_universe_path=os.getenv('MARKET_DATA_SYMBOL_UNIVERSE_PATH') or None,
+                symbol_universe_reload_seconds=int(os.getenv('MARKET_DATA_SYMBOL_UNIVERSE_RELOAD', '300')),
+                redis_url=os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+                redis_max_connections=int(os.getenv('MARKET_DATA_REDIS_MAX_CONNECTIONS', '20')),
+                streaming_enabled=os.getenv('MARKET_DATA_STREAMING_ENABLED', 'false').lower() == 'true',
+                streaming_url=os.getenv('MARKET_DATA_STREAMING_URL', 'wss://ws.finnhub.io')
             )
             
             # Load trading configuration
@@ -355,7 +425,11 @@ class ConfigurationManager:
                 execution_delay_seconds=float(os.getenv('EXECUTION_DELAY_SECONDS', '1.0')),
                 max_position_size=int(os.getenv('MAX_POSITION_SIZE', '10000')),
                 max_trade_value=float(os.getenv('MAX_TRADE_VALUE', '1000000.0')),
-                supported_symbols=[s.strip().upper() for s in supported_symbols]
+                supported_symbols=[s.strip().upper() for s in supported_symbols],
+                execution_history_size=int(os.getenv('EXECUTION_HISTORY_SIZE', '10000')),
+                execution_spill_path=os.getenv('EXECUTION_SPILL_PATH') or None,
+                order_workers=int(os.getenv('ORDER_WORKERS', '4')),
+                order_queue_size=int(os.getenv('ORDER_QUEUE_SIZE', '1000'))
             )
             
             # Load security configuration
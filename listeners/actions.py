@@ -48,6 +48,10 @@ from config.settings import get_config
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Streaming interest for a trade modal lapses after this long if the modal is
+# abandoned without being closed through the app
+MODAL_STREAM_TTL_SECONDS = 1800
+
 
 class ActionType(Enum):
     """Enumeration of supported action types."""
@@ -497,8 +501,11 @@ class ActionHandler:
             loading_modal = self.trade_widget.create_trade_modal(widget_context)
             await self._update_modal(client, action_context.view_id, loading_modal)
             
-            # Fetch market data
+            # Fetch market data and keep it streaming while the modal is open
             market_quote = await self.market_data_service.get_quote(symbol)
+            await self.market_data_service.watch_symbols(
+                f"modal:{action_context.view_id}", [symbol], ttl_seconds=MODAL_STREAM_TTL_SECONDS
+            )
             
             # Update modal with market data
             widget_context.market_quote = market_quote
@@ -639,48 +646,34 @@ class ActionHandler:
             submitting_modal = self.trade_widget.create_trade_modal(widget_context)
             await self._update_modal(client, action_context.view_id, submitting_modal)
             
-            # Log trade to database
-            await self.db_service.log_trade(trade)
-            
             # Submit trade to trading API
-            execution_result = await self.trading_api_service.execute_trade(trade)
-            
-            # Update trade status based on execution result
+            try:
+                execution_result = await self.trading_api_service.execute_trade(trade)
+            except Exception as e:
+                # Keep a record of the attempt before surfacing the error
+                trade.mark_failed(str(e))
+                await self._settle_failed_trade(trade)
+                raise
+            
+            # Record the outcome on the trade
             if execution_result.success:
-                trade.status = TradeStatus.EXECUTED
-                trade.execution_id = execution_result.execution_id
-                
-                # Update position
-                await self.db_service.update_position(
-                    trade.user_id,
-                    trade.symbol,
-                    trade.quantity if trade.trade_type == TradeType.BUY else -trade.quantity,
-                    trade.price,
-                    trade.trade_id
+                trade.mark_executed(
+                    execution_result.execution_id,
+                    execution_result.execution_price,
+                    execution_result.execution_timestamp
                 )
-                
-                # Send success notification
+            else:
+                trade.mark_failed(execution_result.error_message)
+            
+            # Persist trade record, position change and status in one transaction
+            await self.db_service.settle_trade(trade)
+            
+            # Send notification
+            if execution_result.success:
                 await self._send_trade_success_notification(client, action_context, trade, execution_result)
-                
             else:
-                trade.status = TradeStatus.FAILED
-                
-                # Send failure notification
                 await self._send_trade_failure_notification(client, action_context, trade, execution_result.error_message)
             
-            # Update trade in database
-            await self.db_service.update_trade_status(
-                trade.user_id,
-                trade.trade_id,
-                trade.status,
-                {
-                    'execution_id': execution_result.execution_id,
-                    'execution_price': str(execution_result.execution_price) if execution_result.execution_price else None,
-                    'execution_timestamp': execution_result.execution_timestamp.isoformat() if execution_result.execution_timestamp else None,
-                    'error_message': execution_result.error_message
-                }
-            )
-            
             # Close modal
             await self._close_modal(client, action_context.view_id)
             
@@ -701,6 +694,13 @@ class ActionHandler:
             logger.error(f"Unexpected error submitting trade: {str(e)}")
             raise ActionProcessingError(f"Failed to submit trade: {str(e)}", "TRADE_SUBMIT_FAILED")
     
+    async def _settle_failed_trade(self, trade: Trade) -> None:
+        """Persist a trade whose execution raised, without masking the execution error."""
+        try:
+            await self.db_service.settle_trade(trade)
+        except Exception as e:
+            logger.error(f"Failed to record failed trade {trade.trade_id}: {str(e)}")
+    
     async def _handle_confirm_high_risk(self, action_context: ActionContext, client: WebClient) -> None:
         """Handle high-risk trade confirmation action."""
         try:
@@ -885,6 +885,8 @@ class ActionHandler:
     
     async def _close_modal(self, client: WebClient, view_id: str) -> None:
         """Close modal."""
+        await self.market_data_service.unwatch_symbols(f"modal:{view_id}")
+        
         try:
             await asyncio.to_thread(
                 client.views_update,
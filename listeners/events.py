@@ -514,6 +514,11 @@ class EventHandler:
             total_value = sum(pos.current_value for pos in positions)
             total_pnl = sum(pos.unrealized_pnl for pos in positions)
             
+            # Keep held symbols streaming while the user has positions
+            await self.market_data_service.watch_symbols(
+                f"positions:{user.user_id}", [position.symbol for position in positions]
+            )
+            
             # Get market data for positions
             position_quotes = {}
             for position in positions:
@@ -31,6 +31,11 @@ from .portfolio import (
     PortfolioValidationError
 )
 
+from .snapshot import (
+    SnapshotMixin,
+    FrozenSnapshotError
+)
+
 __all__ = [
     # Trade models
     'Trade',
@@ -53,5 +58,9 @@ __all__ = [
     'PositionType',
     'PortfolioStatus',
     'RiskMetricType',
-    'PortfolioValidationError'
+    'PortfolioValidationError',
+    
+    # Snapshot support
+    'SnapshotMixin',
+    'FrozenSnapshotError'
 ]
\ No newline at end of file
@@ -15,6 +15,8 @@ import json
 import statistics
 from collections import defaultdict
 
+from .snapshot import SnapshotMixin
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -52,7 +54,7 @@ class PortfolioValidationError(Exception):
 
 
 @dataclass
-class Position:
+class Position(SnapshotMixin):
     """
     Individual position within a portfolio with comprehensive tracking and analytics.
     
@@ -208,7 +210,7 @@ class Position:
             price: Trade price per share
             commission: Commission paid
         """
-        self.trade_history.append(trade_id)
+        self._writable('trade_history').append(trade_id)
         self.commission_paid += commission
         
         old_quantity = self.quantity
@@ -319,7 +321,7 @@ class Position:
                     )
                     metrics['volatility'] = volatility
         
-        self.risk_metrics.update(metrics)
+        self._writable('risk_metrics').update(metrics)
         return metrics
     
     def to_dict(self) -> Dict[str, Any]:
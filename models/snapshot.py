@@ -0,0 +1,199 @@
+"""
+Immutable snapshot support for cached data models.
+
+Models that mix in SnapshotMixin can be frozen into read-only snapshots that
+are safe to share between callers, for example by the database query cache.
+Freezing replaces list, dict and set attributes with read-only subclasses, so
+the snapshot still passes ``isinstance`` checks and serializes unchanged.
+
+``thaw()`` returns a cheap mutable copy of a snapshot without re-parsing or
+re-validating it. The copy shares the snapshot's read-only containers until
+it writes to them: model methods obtain containers through ``_writable()``,
+which swaps a shared container for a private copy on first write.
+"""
+
+from typing import Any, Dict, Iterable, List, TypeVar
+
+S = TypeVar('S', bound='SnapshotMixin')
+
+
+class FrozenSnapshotError(AttributeError):
+    """Raised when a frozen snapshot or one of its containers is modified."""
+    pass
+
+
+def _read_only(self, *args, **kwargs):
+    raise FrozenSnapshotError(f"{type(self).__name__} is read-only")
+
+
+class FrozenList(list):
+    """Read-only list used inside frozen snapshots."""
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self) -> 'FrozenList':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'FrozenList':
+        return self
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+class FrozenDict(dict):
+    """Read-only dict used inside frozen snapshots."""
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> 'FrozenDict':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'FrozenDict':
+        return self
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenSet(set):
+    """Read-only set used inside frozen snapshots."""
+    __ior__ = __iand__ = __isub__ = __ixor__ = _read_only
+    add = discard = remove = pop = clear = update = _read_only
+    difference_update = intersection_update = symmetric_difference_update = _read_only
+
+    def __copy__(self) -> 'FrozenSet':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'FrozenSet':
+        return self
+
+    def __reduce__(self):
+        return (FrozenSet, (set(self),))
+
+
+_FROZEN_TYPES = (FrozenList, FrozenDict, FrozenSet)
+
+
+def freeze_value(value: Any) -> Any:
+    """
+    Convert a value to its read-only equivalent.
+
+    Args:
+        value: Attribute value to freeze
+
+    Returns:
+        Read-only container, frozen snapshot, or the value unchanged
+    """
+    if isinstance(value, _FROZEN_TYPES):
+        return value
+    if isinstance(value, SnapshotMixin):
+        return value.freeze()
+    if isinstance(value, list):
+        return FrozenList(freeze_value(v) for v in value)
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze_value(v)) for k, v in value.items())
+    if isinstance(value, set):
+        return FrozenSet(freeze_value(v) for v in value)
+    return value
+
+
+def _mutable_copy(value: Any) -> Any:
+    """Private one-level mutable copy of a shared read-only container."""
+    if isinstance(value, FrozenList):
+        return list(value)
+    if isinstance(value, FrozenDict):
+        return dict(value)
+    if isinstance(value, FrozenSet):
+        return set(value)
+    return value
+
+
+class SnapshotMixin:
+    """
+    Mixin adding freeze/thaw snapshot semantics to dataclass models.
+
+    A frozen instance rejects attribute assignment. Call ``thaw()`` to obtain
+    a mutable copy; mutating methods must use ``_writable()`` for container
+    attributes so that shared snapshot containers are copied before writing.
+    """
+
+    _frozen = False
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise FrozenSnapshotError(
+                f"{type(self).__name__} snapshot is read-only; call thaw() for a mutable copy"
+            )
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if self._frozen:
+            raise FrozenSnapshotError(f"{type(self).__name__} snapshot is read-only")
+        object.__delattr__(self, name)
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether this instance is a read-only snapshot."""
+        return self._frozen
+
+    def freeze(self: S) -> S:
+        """
+        Make this instance an immutable snapshot in place.
+
+        Returns:
+            This instance, now frozen
+        """
+        if not self._frozen:
+            for name, value in vars(self).items():
+                object.__setattr__(self, name, freeze_value(value))
+            object.__setattr__(self, '_frozen', True)
+        return self
+
+    def thaw(self: S) -> S:
+        """
+        Get a mutable copy of a frozen snapshot without re-validation.
+
+        Container attributes stay shared with the snapshot until written.
+
+        Returns:
+            Mutable copy, or this instance if it is not frozen
+        """
+        if not self._frozen:
+            return self
+
+        clone = object.__new__(type(self))
+        state = clone.__dict__
+        for name, value in vars(self).items():
+            if name == '_frozen':
+                continue
+            state[name] = value.thaw() if isinstance(value, SnapshotMixin) else value
+        return clone
+
+    def _writable(self, name: str) -> Any:
+        """
+        Get a container attribute for in-place modification.
+
+        Replaces a container shared with a snapshot by a private copy first.
+
+        Args:
+            name: Attribute name
+
+        Returns:
+            Mutable container stored on this instance
+        """
+        value = getattr(self, name)
+        if isinstance(value, _FROZEN_TYPES):
+            value = _mutable_copy(value)
+            setattr(self, name, value)
+        return value
+
+
+def freeze_all(items: Iterable[SnapshotMixin]) -> tuple:
+    """Freeze each model and return them as a tuple suitable for caching."""
+    return tuple(item.freeze() for item in items)
+
+
+def thaw_all(snapshots: Iterable[SnapshotMixin]) -> List[Any]:
+    """Return mutable copies of cached snapshots."""
+    return [snapshot.thaw() for snapshot in snapshots]
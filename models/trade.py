@@ -14,6 +14,8 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 import json
 
+from .snapshot import SnapshotMixin
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -51,7 +53,7 @@ class TradeValidationError(Exception):
 
 
 @dataclass
-class Trade:
+class Trade(SnapshotMixin):
     """
     Comprehensive Trade model with validation, serialization, and business logic.
     
@@ -373,6 +375,10 @@ class Trade:
             if 'risk_level' in data and isinstance(data['risk_level'], str):
                 data['risk_level'] = RiskLevel(data['risk_level'])
             
+            # DynamoDB returns all numbers as Decimal
+            if isinstance(data.get('quantity'), Decimal):
+                data['quantity'] = int(data['quantity'])
+            
             # Convert string decimals back to Decimal
             for field in ['price', 'execution_price', 'commission']:
                 if field in data and data[field] is not None:
@@ -12,6 +12,8 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 import json
 
+from .snapshot import SnapshotMixin
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -68,7 +70,7 @@ class UserValidationError(Exception):
 
 
 @dataclass
-class UserProfile:
+class UserProfile(SnapshotMixin):
     """
     User profile information and preferences.
     
@@ -108,7 +110,7 @@ class UserProfile:
 
 
 @dataclass
-class User:
+class User(SnapshotMixin):
     """
     Comprehensive User model with role-based permissions and authentication.
     
@@ -263,11 +265,12 @@ class User:
         }
         
         # Assign base role permissions
-        self.permissions.update(role_permissions.get(self.role, set()))
+        permissions = self._writable('permissions')
+        permissions.update(role_permissions.get(self.role, set()))
         
         # Add permissions from additional roles
         for additional_role in self.additional_roles:
-            self.permissions.update(role_permissions.get(additional_role, set()))
+            permissions.update(role_permissions.get(additional_role, set()))
     
     def has_permission(self, permission: Permission) -> bool:
         """
@@ -376,7 +379,7 @@ class User:
             channel_id: Slack channel ID to add
         """
         if channel_id not in self.channel_restrictions:
-            self.channel_restrictions.append(channel_id)
+            self._writable('channel_restrictions').append(channel_id)
             self._log_audit_event("channel_access_added", {"channel_id": channel_id})
     
     def remove_channel_access(self, channel_id: str) -> None:
@@ -387,7 +390,7 @@ class User:
             channel_id: Slack channel ID to remove
         """
         if channel_id in self.channel_restrictions:
-            self.channel_restrictions.remove(channel_id)
+            self._writable('channel_restrictions').remove(channel_id)
             self._log_audit_event("channel_access_removed", {"channel_id": channel_id})
     
     def update_profile(self, **kwargs) -> None:
@@ -411,7 +414,7 @@ class User:
         Args:
             preferences: Dictionary of preference updates
         """
-        self.profile.trading_preferences.update(preferences)
+        self.profile._writable('trading_preferences').update(preferences)
         self.profile.updated_at = datetime.now(timezone.utc)
         self._log_audit_event("trading_preferences_updated", {"preferences": preferences})
     
@@ -422,24 +425,25 @@ class User:
         Args:
             preferences: Dictionary of notification preference updates
         """
-        self.profile.notification_preferences.update(preferences)
+        self.profile._writable('notification_preferences').update(preferences)
         self.profile.updated_at = datetime.now(timezone.utc)
         self._log_audit_event("notification_preferences_updated", {"preferences": preferences})
     
     def record_login(self) -> None:
         """Record user login."""
         self.profile.last_login = datetime.now(timezone.utc)
-        self.security_settings["failed_login_attempts"] = 0
+        self._writable('security_settings')["failed_login_attempts"] = 0
         self._log_audit_event("user_login", {})
     
     def record_failed_login(self) -> None:
         """Record failed login attempt."""
-        self.security_settings["failed_login_attempts"] += 1
+        security_settings = self._writable('security_settings')
+        security_settings["failed_login_attempts"] += 1
         
         # Lock account after 5 failed attempts
-        if self.security_settings["failed_login_attempts"] >= 5:
+        if security_settings["failed_login_attempts"] >= 5:
             lock_until = datetime.now(timezone.utc).timestamp() + 3600  # 1 hour
-            self.security_settings["account_locked_until"] = lock_until
+            security_settings["account_locked_until"] = lock_until
             self._log_audit_event("account_locked", {"reason": "failed_login_attempts"})
     
     def is_account_locked(self) -> bool:
@@ -451,8 +455,9 @@ class User:
         current_time = datetime.now(timezone.utc).timestamp()
         if current_time > lock_until:
             # Unlock account
-            self.security_settings["account_locked_until"] = None
-            self.security_settings["failed_login_attempts"] = 0
+            security_settings = self._writable('security_settings')
+            security_settings["account_locked_until"] = None
+            security_settings["failed_login_attempts"] = 0
             return False
         
         return True
@@ -491,7 +496,7 @@ class User:
             "details": details
         }
         
-        self.audit_trail.append(audit_entry)
+        self._writable('audit_trail').append(audit_entry)
         
         # Keep only last 100 audit entries
         if len(self.audit_trail) > 100:
@@ -529,6 +534,11 @@ class User:
         data['permissions'] = [perm.value for perm in self.permissions]
         data['additional_roles'] = [role.value for role in self.additional_roles]
         
+        # Convert profile datetimes to ISO strings (from_dict parses them back)
+        for field_name in ['last_login', 'created_at', 'updated_at']:
+            if data['profile'].get(field_name) is not None:
+                data['profile'][field_name] = data['profile'][field_name].isoformat()
+        
         return data
     
     @classmethod
@@ -0,0 +1,194 @@
+"""
+Buffered, batched audit log writer for the Slack Trading Bot.
+
+Audit and security events are appended to an in-memory buffer and written to
+the audit table in BatchWriteItem-sized batches (25 items). A background task
+flushes the buffer when a full batch is ready or when the flush interval
+elapses, retries unprocessed items with exponential backoff, and applies
+backpressure to producers when the buffer is full.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# DynamoDB BatchWriteItem limit
+MAX_BATCH_SIZE = 25
+
+WriteBatchFunc = Callable[[List[Dict[str, Any]]], Awaitable[List[Dict[str, Any]]]]
+
+
+class AuditWriter:
+    """
+    Asynchronous buffered writer for audit entries.
+
+    The writer is transport-agnostic: it is given a ``write_batch`` coroutine
+    that persists up to 25 items and returns the items that were not processed.
+    """
+
+    def __init__(self, write_batch: WriteBatchFunc, batch_size: int = MAX_BATCH_SIZE,
+                 flush_interval: float = 1.0, max_buffer_size: int = 5000,
+                 max_retries: int = 5, base_backoff: float = 0.05):
+        """
+        Initialize the audit writer.
+
+        Args:
+            write_batch: Coroutine writing a batch and returning unprocessed items
+            batch_size: Items per write (capped at the BatchWriteItem limit of 25)
+            flush_interval: Maximum seconds an entry waits in the buffer
+            max_buffer_size: Buffer size at which producers are made to wait
+            max_retries: Attempts per batch before unprocessed items are dropped
+            base_backoff: Initial retry delay in seconds
+        """
+        self._write_batch = write_batch
+        self.batch_size = min(batch_size, MAX_BATCH_SIZE)
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._space_available: Optional[asyncio.Event] = None
+        self._closed = False
+
+        self._metrics = {
+            'entries_submitted': 0,
+            'entries_written': 0,
+            'entries_dropped': 0,
+            'batches_written': 0,
+            'retries': 0,
+            'backpressure_waits': 0
+        }
+
+    @property
+    def pending(self) -> int:
+        """Number of entries waiting to be written."""
+        return len(self._buffer)
+
+    async def submit(self, entry: Dict[str, Any]) -> None:
+        """
+        Queue an audit entry for writing.
+
+        Returns immediately unless the buffer is full, in which case the caller
+        waits until a flush frees space.
+
+        Args:
+            entry: Audit item to store
+        """
+        if self._closed:
+            logger.warning("Audit writer is closed - entry dropped")
+            self._metrics['entries_dropped'] += 1
+            return
+
+        self._ensure_started()
+
+        while len(self._buffer) >= self.max_buffer_size:
+            self._metrics['backpressure_waits'] += 1
+            self._space_available.clear()
+            self._batch_ready.set()
+            await self._space_available.wait()
+
+        self._buffer.append(entry)
+        self._metrics['entries_submitted'] += 1
+
+        if len(self._buffer) >= self.batch_size:
+            self._batch_ready.set()
+
+    async def flush(self) -> None:
+        """Write every buffered entry."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            while self._buffer:
+                batch = self._buffer[:self.batch_size]
+                del self._buffer[:self.batch_size]
+                if self._space_available is not None:
+                    self._space_available.set()
+                await self._write_with_retry(batch)
+
+    async def close(self) -> None:
+        """Stop the background flusher and drain the buffer."""
+        self._closed = True
+
+        # Wake the flusher and let it return instead of cancelling it: a
+        # cancellation landing just as the batch event fires is swallowed by
+        # asyncio.wait_for on Python < 3.12, which leaves the task running
+        if self._flush_task is not None and not self._flush_task.done():
+            self._batch_ready.set()
+            await self._flush_task
+        self._flush_task = None
+
+        await self.flush()
+        logger.info(f"Audit writer closed ({self._metrics['entries_written']} entries written)")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get writer metrics."""
+        metrics = self._metrics.copy()
+        metrics['pending'] = len(self._buffer)
+        return metrics
+
+    def _ensure_started(self) -> None:
+        """Create loop-bound primitives and the flusher task on first use."""
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+
+        if self._batch_ready is None:
+            self._batch_ready = asyncio.Event()
+            self._space_available = asyncio.Event()
+            self._space_available.set()
+
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Flush on a full batch or when the flush interval elapses, until closed."""
+        while not self._closed:
+            try:
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._batch_ready.clear()
+
+                if self._buffer:
+                    await self.flush()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Audit flush loop error: {str(e)}")
+
+    async def _write_with_retry(self, batch: List[Dict[str, Any]]) -> None:
+        """Write a batch, retrying unprocessed items with exponential backoff."""
+        pending = batch
+        attempt = 0
+
+        while pending:
+            try:
+                unprocessed = await self._write_batch(pending)
+            except Exception as e:
+                logger.warning(f"Audit batch write failed: {str(e)}")
+                unprocessed = pending
+
+            self._metrics['entries_written'] += len(pending) - len(unprocessed)
+            if len(unprocessed) < len(pending):
+                self._metrics['batches_written'] += 1
+
+            if not unprocessed:
+                return
+
+            attempt += 1
+            if attempt >= self.max_retries:
+                self._metrics['entries_dropped'] += len(unprocessed)
+                logger.error(f"Dropping {len(unprocessed)} audit entries after {attempt} attempts")
+                return
+
+            self._metrics['retries'] += 1
+            await asyncio.sleep(self.base_backoff * (2 ** (attempt - 1)))
+            pending = unprocessed
@@ -1079,8 +1079,8 @@ class AuthService:
                 'severity': self._get_event_severity(event_type)
             }
             
-            # Store in database asynchronously
-            asyncio.create_task(self._store_security_event(security_event))
+            # Queue for the buffered audit writer (only waits under backpressure)
+            await self._store_security_event(security_event)
             
             # Check for suspicious activity patterns
             await self._analyze_security_event(event_type, user_id, details)
@@ -1110,11 +1110,15 @@ class AuthService:
         """Store security event in database."""
         try:
             # This would typically store in a security events table
-            # For now, we'll use the audit logging functionality
+            # For now, we'll use the batched audit logging functionality
             await self.db._log_audit_event(
                 event['event_type'],
                 event['user_id'],
-                event['details']
+                {
+                    **event['details'],
+                    'security_event_id': event['event_id'],
+                    'severity': event['severity']
+                }
             )
         except Exception as e:
             logger.error(f"Failed to store security event: {e}")
@@ -8,24 +8,45 @@ with advanced features like query optimization, batch operations, and transactio
 """
 
 import asyncio
+import base64
+import heapq
+import inspect
+import itertools
 import logging
 import os
 import time
 import uuid
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
-from typing import Dict, Any, Optional, List, Union, Tuple
+from typing import Dict, Any, Optional, List, Set, Union, Tuple, AsyncIterator
 from dataclasses import asdict
 import json
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import boto3
 from botocore.exceptions import ClientError, BotoCoreError, NoCredentialsError
 from botocore.config import Config
+from boto3.dynamodb.types import TypeSerializer
 import backoff
 
+try:
+    import aioboto3
+    AIOBOTO3_AVAILABLE = True
+except ImportError:
+    aioboto3 = None
+    AIOBOTO3_AVAILABLE = False
+
 # Import our models
 from models.trade import Trade, TradeStatus, TradeType, RiskLevel, TradeValidationError
 from models.user import User, UserRole, UserStatus, Permission, UserProfile, UserValidationError
 from models.portfolio import Portfolio, Position, PortfolioStatus, PositionType, PortfolioValidationError
+from models.snapshot import freeze_all, thaw_all
+
+from services.audit_writer import AuditWriter
+from services.local_dynamodb import LocalDynamoDB, default_table_schemas
+from services.query_cache import QueryCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -61,6 +82,179 @@ class ConflictError(DatabaseError):
     pass
 
 
+def _to_dynamodb_types(value: Any) -> Any:
+    """Recursively convert floats to Decimal so values can be serialized for DynamoDB."""
+    if isinstance(value, float):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {k: _to_dynamodb_types(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_dynamodb_types(v) for v in value]
+    return value
+
+
+# Table verification strategies (see DatabaseService._initialize_tables)
+TABLE_INIT_MODES = ('lazy', 'parallel')
+
+# Storage backends: AWS DynamoDB (or a compatible endpoint) and the embedded store
+DATABASE_BACKENDS = ('dynamodb', 'local')
+
+# Tables verified to exist, keyed by (region, endpoint, table name). Shared by
+# every service instance in the process so warm Lambda containers skip
+# DescribeTable entirely.
+_known_tables: Set[Tuple[str, str, str]] = set()
+_known_tables_lock = threading.Lock()
+
+# Trade retention period (7 years)
+TRADE_RETENTION_DAYS = 2555
+
+# DynamoDB BatchWriteItem limit
+BATCH_WRITE_MAX_ITEMS = 25
+
+# DynamoDB key and bookkeeping attributes stored alongside trade data
+_TRADE_KEY_ATTRIBUTES = ('pk', 'sk', 'gsi1pk', 'gsi1sk', 'gsi2pk', 'gsi2sk', 'ttl', 'last_updated')
+
+# Most recent trade IDs kept on a position item (the full trail is in the trades table)
+POSITION_TRADE_HISTORY_LIMIT = 50
+
+# Versioned position writes attempted before a concurrent update is reported
+POSITION_WRITE_ATTEMPTS = 5
+
+
+def _elapsed_ms(started: float) -> float:
+    """Milliseconds since a time.perf_counter() reading."""
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def _to_utc_iso(value: datetime) -> str:
+    """Format a datetime as a UTC ISO-8601 string, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def build_trade_item(trade: Trade, ttl: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Convert a trade to a trades-table item with its key attributes.
+    
+    Args:
+        trade: Trade to store
+        ttl: Expiry epoch seconds (defaults to the retention period from now)
+        
+    Returns:
+        DynamoDB item
+    """
+    item = trade.to_dict()
+    item['pk'] = f"USER#{trade.user_id}"
+    item['sk'] = f"TRADE#{trade.trade_id}"
+    item['gsi1pk'] = f"SYMBOL#{trade.symbol}"
+    item['gsi1sk'] = _to_utc_iso(trade.timestamp)
+    item['gsi2pk'] = f"USER#{trade.user_id}"
+    item['gsi2sk'] = _to_utc_iso(trade.timestamp)
+    item['ttl'] = ttl if ttl is not None else trade_ttl()
+    return item
+
+
+def trade_ttl() -> int:
+    """Expiry timestamp for trades written now (7 years retention)."""
+    return int((datetime.now(timezone.utc) + timedelta(days=TRADE_RETENTION_DAYS)).timestamp())
+
+
+def _apply_position_fill(quantity: int, average_cost: Decimal, realized_pnl: Decimal,
+                         fill_quantity: int, price: Decimal) -> Tuple[int, Decimal, Decimal]:
+    """
+    Apply a fill to a position's quantity, cost basis and realized P&L.
+    
+    Same-side fills are averaged into the cost basis. Opposite-side fills
+    realize P&L on the closed shares; a fill that reverses the position opens
+    the remainder at the fill price, and a flat position has no cost basis.
+    
+    Args:
+        quantity: Signed quantity before the fill
+        average_cost: Average cost per share before the fill
+        realized_pnl: Realized P&L before the fill
+        fill_quantity: Signed fill quantity (positive for buy, negative for sell)
+        price: Fill price
+        
+    Returns:
+        New quantity, average cost and realized P&L
+    """
+    new_quantity = quantity + fill_quantity
+    if quantity == 0 or (quantity > 0) == (fill_quantity > 0):
+        cost_basis = average_cost * abs(quantity) + price * abs(fill_quantity)
+        return new_quantity, (cost_basis / abs(new_quantity)).quantize(Decimal('0.0001')), realized_pnl
+    
+    closed = min(abs(quantity), abs(fill_quantity))
+    per_share = price - average_cost if quantity > 0 else average_cost - price
+    realized_pnl += per_share * closed
+    
+    if new_quantity == 0:
+        average_cost = Decimal('0')
+    elif (new_quantity > 0) != (quantity > 0):
+        average_cost = price
+    return new_quantity, average_cost, realized_pnl
+
+
+def _interleave_by_partition(items: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Reorder items round-robin across partition keys.
+    
+    Consecutive 25-item batches then spread their writes over as many users
+    as possible instead of hammering one partition. Duplicate primary keys
+    keep only the last occurrence, since BatchWriteItem rejects a request
+    that writes the same key twice.
+    
+    Returns:
+        Tuple of (reordered items, number of duplicate items dropped)
+    """
+    by_partition: Dict[str, "OrderedDict[str, Dict[str, Any]]"] = OrderedDict()
+    for item in items:
+        by_partition.setdefault(item['pk'], OrderedDict())[item['sk']] = item
+    
+    queues = [list(partition.values()) for partition in by_partition.values()]
+    interleaved = []
+    for column in itertools.zip_longest(*queues):
+        interleaved.extend(item for item in column if item is not None)
+    return interleaved, len(items) - len(interleaved)
+
+
+def _key_condition_with_range(pk_name: str, pk_value: str, sk_name: str,
+                              start: Optional[datetime] = None,
+                              end: Optional[datetime] = None) -> Tuple[str, Dict[str, Any]]:
+    """Build a KeyConditionExpression with an optional timestamp range on the sort key."""
+    key_condition = f"{pk_name} = :pk"
+    expression_values: Dict[str, Any] = {':pk': pk_value}
+    if start and end:
+        key_condition += f" AND {sk_name} BETWEEN :start_date AND :end_date"
+        expression_values[':start_date'] = _to_utc_iso(start)
+        expression_values[':end_date'] = _to_utc_iso(end)
+    elif start:
+        key_condition += f" AND {sk_name} >= :start_date"
+        expression_values[':start_date'] = _to_utc_iso(start)
+    elif end:
+        key_condition += f" AND {sk_name} <= :end_date"
+        expression_values[':end_date'] = _to_utc_iso(end)
+    return key_condition, expression_values
+
+
+def _encode_cursor(key: Dict[str, Any]) -> str:
+    """Encode a DynamoDB key as an opaque URL-safe cursor."""
+    payload = json.dumps(key, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError) as e:
+        raise ValidationError("Invalid pagination cursor", "INVALID_CURSOR", e)
+    if not isinstance(key, dict):
+        raise ValidationError("Invalid pagination cursor", "INVALID_CURSOR")
+    return key
+
+
 class DatabaseService:
     """
     Comprehensive DynamoDB service with advanced features and error handling.
@@ -71,6 +265,7 @@ class DatabaseService:
     
     Features:
     - Automatic connection management with connection pooling
+    - Optional native asyncio data path (aioboto3) with sync boto3 fallback
     - Exponential backoff retry logic for transient failures
     - Batch operations for improved performance
     - Transaction support for data consistency
@@ -78,11 +273,12 @@ class DatabaseService:
     - Query optimization and caching
     - Metrics collection and monitoring
     - Data validation and sanitization
-    - Audit trail logging
+    - Audit trail logging with buffered batch writes
     """
     
     def __init__(self, region_name: str = 'us-east-1', endpoint_url: Optional[str] = None,
-                 max_retries: int = 3, timeout: int = 30):
+                 max_retries: int = 3, timeout: int = 30, use_async_client: Optional[bool] = None,
+                 table_init_mode: Optional[str] = None, backend: Optional[str] = None):
         """
         Initialize the database service.
         
@@ -91,29 +287,74 @@ class DatabaseService:
             endpoint_url: DynamoDB endpoint URL (for local development)
             max_retries: Maximum number of retry attempts
             timeout: Connection timeout in seconds
+            use_async_client: Use the aioboto3 data path (defaults to DYNAMODB_ASYNC_CLIENT env var)
+            table_init_mode: 'lazy' to verify tables on first use or 'parallel' to describe
+                them concurrently during init (defaults to DYNAMODB_TABLE_INIT env var)
+            backend: 'dynamodb' or 'local' for the embedded in-process store
+                (defaults to DATABASE_BACKEND env var)
         """
+        init_started = time.perf_counter()
         self.region_name = region_name
         self.endpoint_url = endpoint_url
         self.max_retries = max_retries
         self.timeout = timeout
         
+        # Storage backend; development with mock credentials runs on the embedded store
+        self.is_mock_mode = (os.getenv('ENVIRONMENT') == 'development' and
+                             os.getenv('AWS_ACCESS_KEY_ID') == 'mock-access-key-id')
+        backend = 'local' if self.is_mock_mode else (backend or os.getenv('DATABASE_BACKEND', 'dynamodb')).lower()
+        if backend not in DATABASE_BACKENDS:
+            logger.warning(f"Unknown database backend '{backend}' - using DynamoDB")
+            backend = 'dynamodb'
+        self.backend = backend
+        self.local_store: Optional[LocalDynamoDB] = None
+        
+        # Async data path selection
+        if use_async_client is None:
+            use_async_client = os.getenv('DYNAMODB_ASYNC_CLIENT', 'false').lower() == 'true'
+        if use_async_client and not AIOBOTO3_AVAILABLE:
+            logger.warning("aioboto3 not installed - falling back to synchronous DynamoDB client")
+            use_async_client = False
+        self.use_async_client = use_async_client and backend != 'local'
+        
+        # Table verification strategy
+        table_init_mode = (table_init_mode or os.getenv('DYNAMODB_TABLE_INIT', 'lazy')).lower()
+        if table_init_mode not in TABLE_INIT_MODES:
+            logger.warning(f"Unknown table init mode '{table_init_mode}' - using lazy initialization")
+            table_init_mode = 'lazy'
+        self.table_init_mode = table_init_mode
+        
         # Table names
-        self.trades_table_name = 'slack-trading-bot-trades'
-        self.positions_table_name = 'slack-trading-bot-positions'
-        self.users_table_name = 'slack-trading-bot-users'
-        self.channels_table_name = 'slack-trading-bot-channels'
-        self.portfolios_table_name = 'slack-trading-bot-portfolios'
-        self.audit_table_name = 'slack-trading-bot-audit'
+        self.table_prefix = 'slack-trading-bot'
+        self.trades_table_name = f'{self.table_prefix}-trades'
+        self.positions_table_name = f'{self.table_prefix}-positions'
+        self.users_table_name = f'{self.table_prefix}-users'
+        self.channels_table_name = f'{self.table_prefix}-channels'
+        self.portfolios_table_name = f'{self.table_prefix}-portfolios'
+        self.audit_table_name = f'{self.table_prefix}-audit'
         
         # Connection and client setup
         self._dynamodb_client = None
         self._dynamodb_resource = None
         self._tables = {}
+        self._table_lock = threading.Lock()
         self._connection_pool = {}
+        self._client_config: Optional[Config] = None
+        
+        # Shared aioboto3 resource (created lazily on first async operation)
+        self._async_session = None
+        self._async_resource = None
+        self._async_resource_context = None
+        self._async_tables = {}
+        self._async_init_lock: Optional[asyncio.Lock] = None
         
         # Performance and monitoring
-        self._query_cache = {}
         self._cache_ttl = 300  # 5 minutes
+        self._query_cache = QueryCache(
+            max_entries=1000,
+            max_bytes=int(os.getenv('DB_QUERY_CACHE_MAX_BYTES', str(16 * 1024 * 1024))),
+            default_ttl=self._cache_ttl
+        )
         self._metrics = {
             'queries_executed': 0,
             'cache_hits': 0,
@@ -124,70 +365,49 @@ class DatabaseService:
             'transactions': 0
         }
         
-        # Check if we should use mock mode for development
-        if os.getenv('ENVIRONMENT') == 'development' and os.getenv('AWS_ACCESS_KEY_ID') == 'mock-access-key-id':
-            self._use_mock_mode()
+        # Cold start timing breakdown (milliseconds), exposed via get_health_status
+        self._cold_start: Dict[str, Any] = {
+            'table_init_mode': self.table_init_mode,
+            'tables': {}
+        }
+        
+        # Buffered audit trail writer (flushed via BatchWriteItem)
+        self._audit_writer = AuditWriter(
+            self._write_audit_batch,
+            flush_interval=float(os.getenv('AUDIT_FLUSH_INTERVAL_SECONDS', '1.0')),
+            max_buffer_size=int(os.getenv('AUDIT_MAX_BUFFER_SIZE', '5000'))
+        )
+        
+        if self.backend == 'local':
+            self._initialize_local_backend()
         else:
             # Initialize connection
             self._initialize_connection()
         
+        self._cold_start['constructor_ms'] = _elapsed_ms(init_started)
         logger.info(f"DatabaseService initialized for region {region_name}")
     
-    def _use_mock_mode(self) -> None:
-        """Initialize mock database for development."""
-        self.mock_data = {
-            'users': {},
-            'trades': {},
-            'positions': {},
-            'portfolios': {}
-        }
-        self.is_mock_mode = True
-        logger.info("DatabaseService initialized in MOCK MODE for development")
-        
-        # Override methods with mock implementations
-        self.get_user = self._mock_get_user
-        self.create_user = self._mock_create_user
-        self.get_trade = self._mock_get_trade
-        self.log_trade = self._mock_log_trade
-        self.get_user_positions = self._mock_get_user_positions
-        self.update_position = self._mock_update_position
-    
-    async def _mock_get_user(self, user_id: str) -> Optional[User]:
-        """Mock implementation for get_user."""
-        return self.mock_data['users'].get(user_id)
-    
-    async def _mock_create_user(self, user: User) -> bool:
-        """Mock implementation for create_user."""
-        self.mock_data['users'][user.user_id] = user
-        return True
-    
-    async def _mock_get_trade(self, user_id: str, trade_id: str) -> Optional[Trade]:
-        """Mock implementation for get_trade."""
-        return self.mock_data['trades'].get(f"{user_id}:{trade_id}")
-    
-    async def _mock_log_trade(self, trade: Trade) -> bool:
-        """Mock implementation for log_trade."""
-        self.mock_data['trades'][f"{trade.user_id}:{trade.trade_id}"] = trade
-        return True
-    
-    async def _mock_get_user_positions(self, user_id: str, active_only: bool = True) -> List[Position]:
-        """Mock implementation for get_user_positions."""
-        return list(self.mock_data['positions'].get(user_id, {}).values())
-    
-    async def _mock_update_position(self, user_id: str, symbol: str, quantity: int, 
-                                  price: Decimal, trade_id: str, commission: Decimal = Decimal('0.00')) -> bool:
-        """Mock implementation for update_position."""
-        if user_id not in self.mock_data['positions']:
-            self.mock_data['positions'][user_id] = {}
-        
-        # Simple position update logic
-        self.mock_data['positions'][user_id][symbol] = {
-            'symbol': symbol,
-            'quantity': quantity,
-            'price': price,
-            'trade_id': trade_id
-        }
-        return True
+    def _initialize_local_backend(self) -> None:
+        """
+        Serve every operation from the embedded in-process store.
+        
+        The store exposes the same client and resource API as boto3, so all
+        service methods run their real code paths against indexed in-memory
+        tables instead of DynamoDB.
+        """
+        clients_started = time.perf_counter()
+        self.local_store = LocalDynamoDB(default_table_schemas(self.table_prefix))
+        self._dynamodb_client = self.local_store.client
+        self._dynamodb_resource = self.local_store.resource
+        self._cold_start['client_init_ms'] = _elapsed_ms(clients_started)
+        
+        tables_started = time.perf_counter()
+        self._initialize_tables()
+        self._cold_start['table_init_ms'] = _elapsed_ms(tables_started)
+        
+        if self.is_mock_mode:
+            logger.info("DatabaseService initialized in MOCK MODE for development")
+        logger.info("Embedded local database backend initialized")
     
     def _initialize_connection(self) -> None:
         """Initialize DynamoDB connection with proper configuration."""
@@ -203,8 +423,10 @@ class DatabaseService:
                 read_timeout=self.timeout * 2,
                 max_pool_connections=50
             )
+            self._client_config = config
             
             # Create client and resource
+            clients_started = time.perf_counter()
             if self.endpoint_url:
                 # Local development
                 self._dynamodb_client = boto3.client(
@@ -222,8 +444,12 @@ class DatabaseService:
                 self._dynamodb_client = boto3.client('dynamodb', config=config)
                 self._dynamodb_resource = boto3.resource('dynamodb', config=config)
             
+            self._cold_start['client_init_ms'] = _elapsed_ms(clients_started)
+            
             # Initialize table references
+            tables_started = time.perf_counter()
             self._initialize_tables()
+            self._cold_start['table_init_ms'] = _elapsed_ms(tables_started)
             
             logger.info("DynamoDB connection initialized successfully")
             
@@ -237,9 +463,17 @@ class DatabaseService:
             logger.error(error_msg)
             raise ConnectionError(error_msg, "CONNECTION_FAILED", e)
     
-    def _initialize_tables(self) -> None:
-        """Initialize table references and verify they exist."""
-        table_names = [
+    @property
+    def endpoint_label(self) -> str:
+        """Where requests are served: 'local', a custom endpoint URL or 'aws'."""
+        if self.backend == 'local':
+            return 'local'
+        return self.endpoint_url or 'aws'
+    
+    @property
+    def table_names(self) -> List[str]:
+        """Names of all tables used by the service."""
+        return [
             self.trades_table_name,
             self.positions_table_name,
             self.users_table_name,
@@ -247,28 +481,81 @@ class DatabaseService:
             self.portfolios_table_name,
             self.audit_table_name
         ]
+    
+    def _initialize_tables(self) -> None:
+        """
+        Resolve table references according to the table init mode.
+        
+        In lazy mode nothing is described here; each table is verified on
+        first use. In parallel mode every table is described concurrently so
+        the init phase costs one DescribeTable round trip instead of six.
+        """
+        if self.table_init_mode == 'lazy':
+            logger.debug("Deferring table verification until first use")
+            return
+        
+        table_names = self.table_names
+        with ThreadPoolExecutor(max_workers=len(table_names)) as executor:
+            existence = list(executor.map(lambda name: self._table_exists(name, 'init'), table_names))
+        
+        for table_name, exists in zip(table_names, existence):
+            self._register_table(table_name, exists)
+    
+    def _table_exists(self, table_name: str, phase: str) -> bool:
+        """
+        Check that a table exists, consulting the process-wide cache first.
+        
+        Uses the (thread-safe) low-level client so that several tables can be
+        described concurrently. Records the time taken in the cold start
+        breakdown.
+        
+        Args:
+            table_name: Name of the table
+            phase: 'init' or 'first_use', recorded in the timing breakdown
+            
+        Returns:
+            True if the table exists
+            
+        Raises:
+            ConnectionError: If the table cannot be described
+        """
+        started = time.perf_counter()
+        cache_key = (self.region_name, self.endpoint_label, table_name)
+        source = 'cache'
         
-        for table_name in table_names:
+        exists = cache_key in _known_tables
+        if not exists:
+            source = 'describe'
             try:
-                table = self._dynamodb_resource.Table(table_name)
-                # Verify table exists by checking its status
-                table.load()
-                self._tables[table_name] = table
-                logger.debug(f"Table {table_name} initialized successfully")
-                
+                self._dynamodb_client.describe_table(TableName=table_name)
+                exists = True
+                with _known_tables_lock:
+                    _known_tables.add(cache_key)
             except ClientError as e:
-                if e.response['Error']['Code'] == 'ResourceNotFoundException':
-                    logger.warning(f"Table {table_name} not found - it may need to be created")
-                    # Store None to indicate table doesn't exist
-                    self._tables[table_name] = None
-                else:
+                if e.response['Error']['Code'] != 'ResourceNotFoundException':
                     logger.error(f"Error accessing table {table_name}: {e}")
                     raise ConnectionError(f"Failed to access table {table_name}", "TABLE_ACCESS_ERROR", e)
+                logger.warning(f"Table {table_name} not found - it may need to be created")
+        
+        self._cold_start['tables'][table_name] = {
+            'phase': phase,
+            'source': source,
+            'exists': exists,
+            'ms': _elapsed_ms(started)
+        }
+        return exists
+    
+    def _register_table(self, table_name: str, exists: bool) -> None:
+        """Store the table reference, or None to indicate the table doesn't exist."""
+        self._tables[table_name] = self._dynamodb_resource.Table(table_name) if exists else None
+        logger.debug(f"Table {table_name} initialized successfully" if exists else f"Table {table_name} marked unavailable")
     
     def _get_table(self, table_name: str):
         """
         Get table reference with error handling.
         
+        Verifies the table on first use when it was not resolved during init.
+        
         Args:
             table_name: Name of the table
             
@@ -278,11 +565,83 @@ class DatabaseService:
         Raises:
             ConnectionError: If table is not available
         """
+        if table_name not in self._tables:
+            with self._table_lock:
+                if table_name not in self._tables:
+                    self._register_table(table_name, self._table_exists(table_name, 'first_use'))
+        
         table = self._tables.get(table_name)
         if table is None:
             raise ConnectionError(f"Table {table_name} is not available", "TABLE_NOT_FOUND")
         return table
     
+    async def _get_async_resource(self):
+        """
+        Get the shared aioboto3 DynamoDB resource, creating it on first use.
+        
+        The resource owns a pooled HTTP connector that is shared by every
+        request served by this service instance.
+        """
+        if self._async_resource is not None:
+            return self._async_resource
+        
+        if self._async_init_lock is None:
+            self._async_init_lock = asyncio.Lock()
+        
+        async with self._async_init_lock:
+            if self._async_resource is None:
+                try:
+                    self._async_session = aioboto3.Session(region_name=self.region_name)
+                    resource_kwargs = {'config': self._client_config}
+                    if self.endpoint_url:
+                        resource_kwargs['endpoint_url'] = self.endpoint_url
+                    
+                    context = self._async_session.resource('dynamodb', **resource_kwargs)
+                    self._async_resource = await context.__aenter__()
+                    self._async_resource_context = context
+                    logger.info("Async DynamoDB resource initialized")
+                    
+                except Exception as e:
+                    error_msg = f"Failed to initialize async DynamoDB resource: {str(e)}"
+                    logger.error(error_msg)
+                    raise ConnectionError(error_msg, "ASYNC_CONNECTION_FAILED", e)
+        
+        return self._async_resource
+    
+    async def _resolve_table(self, table_name: str):
+        """
+        Get the table reference for the active data path.
+        
+        Returns an aioboto3 table (awaitable operations) when the async client
+        is enabled, otherwise the synchronous boto3 table.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            DynamoDB table resource
+            
+        Raises:
+            ConnectionError: If table is not available
+        """
+        if table_name not in self._tables:
+            # Describe off the event loop on first use
+            loop = asyncio.get_running_loop()
+            exists = await loop.run_in_executor(None, self._table_exists, table_name, 'first_use')
+            if table_name not in self._tables:
+                self._register_table(table_name, exists)
+        
+        sync_table = self._get_table(table_name)
+        if not self.use_async_client:
+            return sync_table
+        
+        table = self._async_tables.get(table_name)
+        if table is None:
+            resource = await self._get_async_resource()
+            table = await resource.Table(table_name)
+            self._async_tables[table_name] = table
+        return table
+    
     @backoff.on_exception(
         backoff.expo,
         (ClientError, BotoCoreError),
@@ -304,6 +663,8 @@ class DatabaseService:
         try:
             self._metrics['queries_executed'] += 1
             result = operation(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
             return result
             
         except ClientError as e:
@@ -346,33 +707,27 @@ class DatabaseService:
     
     def _get_from_cache(self, cache_key: str) -> Optional[Any]:
         """Get result from cache if not expired."""
-        if cache_key in self._query_cache:
-            cached_data, timestamp = self._query_cache[cache_key]
-            if time.time() - timestamp < self._cache_ttl:
-                self._metrics['cache_hits'] += 1
-                return cached_data
-            else:
-                # Remove expired entry
-                del self._query_cache[cache_key]
+        operation = cache_key.split(':', 1)[0]
+        cached_data = self._query_cache.get(cache_key, operation=operation)
+        if cached_data is not None:
+            self._metrics['cache_hits'] += 1
+            return cached_data
         
         self._metrics['cache_misses'] += 1
         return None
     
-    def _set_cache(self, cache_key: str, data: Any) -> None:
-        """Store result in cache with timestamp."""
-        self._query_cache[cache_key] = (data, time.time())
-        
-        # Simple cache cleanup - remove oldest entries if cache gets too large
-        if len(self._query_cache) > 1000:
-            oldest_keys = sorted(self._query_cache.keys(), 
-                               key=lambda k: self._query_cache[k][1])[:100]
-            for key in oldest_keys:
-                del self._query_cache[key]
+    def _set_cache(self, cache_key: str, data: Any, user_id: Optional[str] = None) -> None:
+        """Store result in cache, indexed by owning user for invalidation."""
+        operation = cache_key.split(':', 1)[0]
+        self._query_cache.put(cache_key, data, operation=operation, user_id=user_id)
     
-    def _log_audit_event(self, event_type: str, user_id: str, details: Dict[str, Any]) -> None:
+    async def _log_audit_event(self, event_type: str, user_id: str, details: Dict[str, Any]) -> None:
         """
         Log audit event for compliance and monitoring.
         
+        Entries are buffered and written in batches; this only waits when the
+        audit buffer is full.
+        
         Args:
             event_type: Type of event (e.g., 'trade_created', 'user_updated')
             user_id: User who performed the action
@@ -388,20 +743,42 @@ class DatabaseService:
                 'ttl': int((datetime.now(timezone.utc) + timedelta(days=2555)).timestamp())  # 7 years retention
             }
             
-            # Store audit entry asynchronously to avoid blocking main operations
-            asyncio.create_task(self._store_audit_entry(audit_entry))
+            await self._audit_writer.submit(audit_entry)
             
         except Exception as e:
             logger.error(f"Failed to log audit event: {str(e)}")
             # Don't raise exception for audit logging failures
     
-    async def _store_audit_entry(self, audit_entry: Dict[str, Any]) -> None:
-        """Store audit entry in database."""
-        try:
-            table = self._get_table(self.audit_table_name)
-            await self._execute_with_retry(table.put_item, Item=audit_entry)
-        except Exception as e:
-            logger.error(f"Failed to store audit entry: {str(e)}")
+    async def _write_audit_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Write up to 25 audit entries with a single BatchWriteItem call.
+        
+        Args:
+            items: Audit entries to store
+            
+        Returns:
+            Entries DynamoDB reported as unprocessed
+        """
+        self._get_table(self.audit_table_name)
+        if self.use_async_client:
+            resource = await self._get_async_resource()
+        else:
+            resource = self._dynamodb_resource
+        
+        self._metrics['batch_operations'] += 1
+        response = await self._execute_with_retry(
+            resource.batch_write_item,
+            RequestItems={
+                self.audit_table_name: [{'PutRequest': {'Item': item}} for item in items]
+            }
+        )
+        
+        unprocessed = response.get('UnprocessedItems', {}).get(self.audit_table_name, [])
+        return [request['PutRequest']['Item'] for request in unprocessed]
+    
+    async def flush_audit_log(self) -> None:
+        """Stop the audit writer and write all buffered entries."""
+        await self._audit_writer.close()
     
     # Trade Management Methods
     
@@ -424,17 +801,10 @@ class DatabaseService:
             trade.validate()
             
             # Convert trade to DynamoDB item
-            item = trade.to_dict()
-            
-            # Add DynamoDB specific fields
-            item['pk'] = f"USER#{trade.user_id}"
-            item['sk'] = f"TRADE#{trade.trade_id}"
-            item['gsi1pk'] = f"SYMBOL#{trade.symbol}"
-            item['gsi1sk'] = trade.timestamp.isoformat()
-            item['ttl'] = int((datetime.now(timezone.utc) + timedelta(days=2555)).timestamp())  # 7 years retention
+            item = build_trade_item(trade)
             
             # Store in database
-            table = self._get_table(self.trades_table_name)
+            table = await self._resolve_table(self.trades_table_name)
             await self._execute_with_retry(
                 table.put_item,
                 Item=item,
@@ -442,7 +812,7 @@ class DatabaseService:
             )
             
             # Log audit event
-            self._log_audit_event('trade_created', trade.user_id, {
+            await self._log_audit_event('trade_created', trade.user_id, {
                 'trade_id': trade.trade_id,
                 'symbol': trade.symbol,
                 'quantity': trade.quantity,
@@ -477,9 +847,9 @@ class DatabaseService:
             cache_key = self._generate_cache_key('get_trade', user_id=user_id, trade_id=trade_id)
             cached_result = self._get_from_cache(cache_key)
             if cached_result is not None:
-                return Trade.from_dict(cached_result) if cached_result else None
+                return cached_result.thaw() if cached_result else None
             
-            table = self._get_table(self.trades_table_name)
+            table = await self._resolve_table(self.trades_table_name)
             response = await self._execute_with_retry(
                 table.get_item,
                 Key={
@@ -491,18 +861,18 @@ class DatabaseService:
             if 'Item' in response:
                 trade_data = response['Item']
                 # Remove DynamoDB specific fields
-                for key in ['pk', 'sk', 'gsi1pk', 'gsi1sk', 'ttl']:
+                for key in _TRADE_KEY_ATTRIBUTES:
                     trade_data.pop(key, None)
                 
                 trade = Trade.from_dict(trade_data)
                 
-                # Cache the result
-                self._set_cache(cache_key, trade_data)
+                # Cache an immutable snapshot; callers get mutable views
+                self._set_cache(cache_key, trade.freeze(), user_id=user_id)
                 
-                return trade
+                return trade.thaw()
             
             # Cache negative result
-            self._set_cache(cache_key, None)
+            self._set_cache(cache_key, None, user_id=user_id)
             return None
             
         except Exception as e:
@@ -514,7 +884,10 @@ class DatabaseService:
                             end_date: Optional[datetime] = None,
                             status_filter: Optional[TradeStatus] = None) -> List[Trade]:
         """
-        Get trades for a specific user with filtering and pagination.
+        Get the most recent trades for a specific user with filtering.
+        
+        Filters are applied before the limit, so up to ``limit`` matching
+        trades are returned even when they span several DynamoDB pages.
         
         Args:
             user_id: User ID to get trades for
@@ -524,7 +897,7 @@ class DatabaseService:
             status_filter: Filter by trade status
             
         Returns:
-            List of Trade objects
+            List of Trade objects, most recent first
         """
         try:
             # Build cache key
@@ -540,69 +913,308 @@ class DatabaseService:
             # Check cache
             cached_result = self._get_from_cache(cache_key)
             if cached_result is not None:
-                return [Trade.from_dict(trade_data) for trade_data in cached_result]
+                return thaw_all(cached_result)
             
-            table = self._get_table(self.trades_table_name)
+            trades = []
+            async for trade in self.iter_user_trades(
+                user_id,
+                page_size=limit,
+                start_date=start_date,
+                end_date=end_date,
+                status_filter=status_filter
+            ):
+                trades.append(trade)
+                if len(trades) >= limit:
+                    break
+            
+            # Cache immutable snapshots
+            snapshots = freeze_all(trades)
+            self._set_cache(cache_key, snapshots, user_id=user_id)
             
-            # Build query parameters
-            query_params = {
-                'KeyConditionExpression': 'pk = :pk',
-                'ExpressionAttributeValues': {':pk': f"USER#{user_id}"},
-                'ScanIndexForward': False,  # Most recent first
-                'Limit': limit
-            }
+            logger.info(f"Retrieved {len(trades)} trades for user {user_id}")
+            return thaw_all(snapshots)
             
-            # Add date filtering if specified
-            if start_date or end_date:
-                filter_expressions = []
-                if start_date:
-                    query_params['ExpressionAttributeValues'][':start_date'] = start_date.isoformat()
-                    filter_expressions.append('#timestamp >= :start_date')
-                if end_date:
-                    query_params['ExpressionAttributeValues'][':end_date'] = end_date.isoformat()
-                    filter_expressions.append('#timestamp <= :end_date')
-                
-                if filter_expressions:
-                    query_params['FilterExpression'] = ' AND '.join(filter_expressions)
-                    query_params['ExpressionAttributeNames'] = {'#timestamp': 'timestamp'}
-            
-            # Add status filtering if specified
-            if status_filter:
-                if 'FilterExpression' in query_params:
-                    query_params['FilterExpression'] += ' AND #status = :status'
-                else:
-                    query_params['FilterExpression'] = '#status = :status'
-                
-                query_params['ExpressionAttributeValues'][':status'] = status_filter.value
-                if 'ExpressionAttributeNames' not in query_params:
-                    query_params['ExpressionAttributeNames'] = {}
-                query_params['ExpressionAttributeNames']['#status'] = 'status'
+        except DatabaseError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get trades for user {user_id}: {str(e)}")
+            raise DatabaseError(f"Failed to retrieve user trades: {str(e)}", "USER_TRADES_GET_FAILED", e)
+    
+    async def iter_user_trades(self, user_id: str, page_size: int = 100,
+                               cursor: Optional[str] = None,
+                               start_date: Optional[datetime] = None,
+                               end_date: Optional[datetime] = None,
+                               status_filter: Optional[TradeStatus] = None,
+                               newest_first: bool = True) -> AsyncIterator[Trade]:
+        """
+        Stream a user's trades page by page in timestamp order.
+        
+        Queries the ``gsi2`` index (USER#<id> / trade timestamp) and follows
+        LastEvaluatedKey until the range is exhausted, so long histories are
+        read in constant memory. Date bounds are sort-key conditions; only the
+        status filter is applied as a FilterExpression. Results bypass the
+        query cache.
+        
+        Pass ``trade_cursor(trade)`` for the last trade consumed as ``cursor``
+        to resume immediately after it.
+        
+        Args:
+            user_id: User ID to get trades for
+            page_size: Items read per DynamoDB request
+            cursor: Opaque resume cursor from trade_cursor()
+            start_date: Only trades at or after this time
+            end_date: Only trades at or before this time
+            status_filter: Only trades with this status
+            newest_first: Iterate from the most recent trade backwards
             
-            response = await self._execute_with_retry(table.query, **query_params)
+        Yields:
+            Trade objects as pages arrive
+            
+        Raises:
+            ValidationError: If the cursor is invalid
+            DatabaseError: If a query fails
+        """
+        table = await self._resolve_table(self.trades_table_name)
+        
+        key_condition, expression_values = _key_condition_with_range(
+            'gsi2pk', f"USER#{user_id}", 'gsi2sk', start_date, end_date
+        )
+        
+        query_params = {
+            'IndexName': 'gsi2',
+            'KeyConditionExpression': key_condition,
+            'ExpressionAttributeValues': expression_values,
+            'ScanIndexForward': not newest_first,
+            'Limit': page_size
+        }
+        
+        if status_filter:
+            query_params['FilterExpression'] = '#status = :status'
+            query_params['ExpressionAttributeNames'] = {'#status': 'status'}
+            expression_values[':status'] = status_filter.value
+        
+        exclusive_start_key = _decode_cursor(cursor) if cursor else None
+        if exclusive_start_key and exclusive_start_key.get('gsi2pk') != f"USER#{user_id}":
+            raise ValidationError("Cursor does not belong to this user", "INVALID_CURSOR")
+        
+        async for trade in self._paginate_trades(table, query_params, exclusive_start_key):
+            yield trade
+    
+    @staticmethod
+    def trade_cursor(trade: Trade) -> str:
+        """
+        Build an opaque cursor that resumes iteration after a trade.
+        
+        Args:
+            trade: Last trade consumed from iter_user_trades
+            
+        Returns:
+            Cursor string for the ``cursor`` argument of iter_user_trades
+        """
+        return _encode_cursor({
+            'pk': f"USER#{trade.user_id}",
+            'sk': f"TRADE#{trade.trade_id}",
+            'gsi2pk': f"USER#{trade.user_id}",
+            'gsi2sk': _to_utc_iso(trade.timestamp)
+        })
+    
+    async def iter_trades_by_symbol(self, symbol: str,
+                                    start_date: Optional[datetime] = None,
+                                    end_date: Optional[datetime] = None,
+                                    page_size: int = 100,
+                                    newest_first: bool = True) -> AsyncIterator[Trade]:
+        """
+        Stream firm-wide trades in a symbol in timestamp order.
+        
+        Queries the ``gsi1`` index (SYMBOL#<sym> / trade timestamp) with
+        date bounds as sort-key conditions, following LastEvaluatedKey.
+        
+        Args:
+            symbol: Stock symbol
+            start_date: Only trades at or after this time
+            end_date: Only trades at or before this time
+            page_size: Items read per DynamoDB request
+            newest_first: Iterate from the most recent trade backwards
+            
+        Yields:
+            Trade objects as pages arrive
+        """
+        table = await self._resolve_table(self.trades_table_name)
+        
+        key_condition, expression_values = _key_condition_with_range(
+            'gsi1pk', f"SYMBOL#{symbol.upper()}", 'gsi1sk', start_date, end_date
+        )
+        query_params = {
+            'IndexName': 'gsi1',
+            'KeyConditionExpression': key_condition,
+            'ExpressionAttributeValues': expression_values,
+            'ScanIndexForward': not newest_first,
+            'Limit': page_size
+        }
+        
+        async for trade in self._paginate_trades(table, query_params):
+            yield trade
+    
+    async def get_trades_by_symbol(self, symbol: str,
+                                   start_date: Optional[datetime] = None,
+                                   end_date: Optional[datetime] = None,
+                                   limit: Optional[int] = None,
+                                   newest_first: bool = True) -> List[Trade]:
+        """
+        Get all users' trades in a symbol within a date range.
+        
+        Args:
+            symbol: Stock symbol
+            start_date: Only trades at or after this time
+            end_date: Only trades at or before this time
+            limit: Maximum number of trades to return (None for all)
+            newest_first: Return the most recent trades first
             
+        Returns:
+            List of Trade objects in timestamp order
+        """
+        try:
             trades = []
+            page_size = min(limit, 1000) if limit else 1000
+            async for trade in self.iter_trades_by_symbol(
+                symbol, start_date, end_date, page_size=page_size, newest_first=newest_first
+            ):
+                trades.append(trade)
+                if limit is not None and len(trades) >= limit:
+                    break
+            
+            logger.info(f"Retrieved {len(trades)} trades for symbol {symbol}")
+            return trades
+            
+        except DatabaseError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to get trades for symbol {symbol}: {str(e)}")
+            raise DatabaseError(f"Failed to retrieve symbol trades: {str(e)}", "SYMBOL_TRADES_GET_FAILED", e)
+    
+    async def get_trades_by_symbols(self, symbols: List[str],
+                                    start_date: Optional[datetime] = None,
+                                    end_date: Optional[datetime] = None,
+                                    limit: Optional[int] = None,
+                                    newest_first: bool = True,
+                                    max_concurrency: int = 10) -> List[Trade]:
+        """
+        Get trades across several symbols merged into one timestamp-ordered list.
+        
+        Each symbol is queried concurrently on the symbol index; the
+        per-symbol results are already ordered, so they are combined with a
+        heap merge instead of a full sort.
+        
+        Args:
+            symbols: Stock symbols to query
+            start_date: Only trades at or after this time
+            end_date: Only trades at or before this time
+            limit: Maximum number of merged trades to return (None for all)
+            newest_first: Return the most recent trades first
+            max_concurrency: Maximum number of symbol queries in flight
+            
+        Returns:
+            List of Trade objects in timestamp order
+        """
+        unique_symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        if not unique_symbols:
+            return []
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def _query_symbol(symbol: str) -> List[Trade]:
+            async with semaphore:
+                # Any symbol contributes at most `limit` trades to the merged result
+                return await self.get_trades_by_symbol(
+                    symbol, start_date, end_date, limit=limit, newest_first=newest_first
+                )
+        
+        results = await asyncio.gather(*[_query_symbol(symbol) for symbol in unique_symbols])
+        
+        merged = heapq.merge(*results, key=lambda trade: _to_utc_iso(trade.timestamp),
+                             reverse=newest_first)
+        trades = list(itertools.islice(merged, limit))
+        
+        logger.info(f"Retrieved {len(trades)} trades across {len(unique_symbols)} symbols")
+        return trades
+    
+    async def _paginate_trades(self, table: Any, query_params: Dict[str, Any],
+                               exclusive_start_key: Optional[Dict[str, Any]] = None) -> AsyncIterator[Trade]:
+        """Run a trades query, following LastEvaluatedKey and yielding parsed trades."""
+        while True:
+            if exclusive_start_key:
+                query_params['ExclusiveStartKey'] = exclusive_start_key
+            
+            response = await self._execute_with_retry(table.query, **query_params)
+            
             for item in response.get('Items', []):
-                # Remove DynamoDB specific fields
-                for key in ['pk', 'sk', 'gsi1pk', 'gsi1sk', 'ttl']:
-                    item.pop(key, None)
-                
-                try:
-                    trade = Trade.from_dict(item)
-                    trades.append(trade)
-                except Exception as e:
-                    logger.warning(f"Failed to parse trade data: {str(e)}")
-                    continue
+                trade = self._trade_from_item(item)
+                if trade is not None:
+                    yield trade
+            
+            exclusive_start_key = response.get('LastEvaluatedKey')
+            if not exclusive_start_key:
+                break
+    
+    async def backfill_user_trade_index(self, page_size: int = 100) -> int:
+        """
+        Add the ``gsi2`` user/timestamp attributes to trades written without them.
+        
+        iter_user_trades and get_user_trades query the ``gsi2`` index, which
+        only contains items carrying ``gsi2pk``/``gsi2sk``. Trades stored
+        before those attributes were introduced must be backfilled once after
+        the index is created. Safe to re-run: items that already have the
+        attributes are skipped.
+        
+        Args:
+            page_size: Items read per Scan request
             
-            # Cache the results
-            trade_data_list = [trade.to_dict() for trade in trades]
-            self._set_cache(cache_key, trade_data_list)
+        Returns:
+            Number of trades updated
+        """
+        table = await self._resolve_table(self.trades_table_name)
+        scan_params = {
+            'FilterExpression': 'attribute_not_exists(gsi2pk) AND begins_with(sk, :trade)',
+            'ExpressionAttributeValues': {':trade': 'TRADE#'},
+            'Limit': page_size
+        }
+        
+        updated = 0
+        while True:
+            response = await self._execute_with_retry(table.scan, **scan_params)
             
-            logger.info(f"Retrieved {len(trades)} trades for user {user_id}")
-            return trades
+            for item in response.get('Items', []):
+                try:
+                    timestamp = _to_utc_iso(datetime.fromisoformat(item['timestamp']))
+                    await self._execute_with_retry(
+                        table.update_item,
+                        Key={'pk': item['pk'], 'sk': item['sk']},
+                        UpdateExpression='SET gsi2pk = :gsi2pk, gsi2sk = :gsi2sk',
+                        ConditionExpression='attribute_exists(pk) AND attribute_not_exists(gsi2pk)',
+                        ExpressionAttributeValues={':gsi2pk': item['pk'], ':gsi2sk': timestamp}
+                    )
+                    updated += 1
+                except ConflictError:
+                    # Backfilled or deleted since the scan read it
+                    continue
+                except (KeyError, ValueError) as e:
+                    logger.warning(f"Skipping trade item {item.get('sk')} without a usable timestamp: {str(e)}")
             
+            if not response.get('LastEvaluatedKey'):
+                break
+            scan_params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        
+        logger.info(f"Backfilled user trade index on {updated} trades")
+        return updated
+    
+    def _trade_from_item(self, item: Dict[str, Any]) -> Optional[Trade]:
+        """Convert a trades-table item to a Trade, skipping unparseable items."""
+        data = {k: v for k, v in item.items() if k not in _TRADE_KEY_ATTRIBUTES}
+        try:
+            return Trade.from_dict(data)
         except Exception as e:
-            logger.error(f"Failed to get trades for user {user_id}: {str(e)}")
-            raise DatabaseError(f"Failed to retrieve user trades: {str(e)}", "USER_TRADES_GET_FAILED", e)
+            logger.warning(f"Failed to parse trade data: {str(e)}")
+            return None
     
     async def update_trade_status(self, user_id: str, trade_id: str, 
                                 status: TradeStatus, execution_details: Optional[Dict[str, Any]] = None) -> bool:
@@ -619,7 +1231,7 @@ class DatabaseService:
             True if successful
         """
         try:
-            table = self._get_table(self.trades_table_name)
+            table = await self._resolve_table(self.trades_table_name)
             
             # Build update expression
             update_expression = "SET #status = :status, last_updated = :timestamp"
@@ -649,17 +1261,13 @@ class DatabaseService:
             )
             
             # Clear related cache entries
-            cache_patterns = [
-                f"get_trade:user_id:{user_id}:trade_id:{trade_id}",
-                f"get_user_trades:user_id:{user_id}"
-            ]
-            for pattern in cache_patterns:
-                keys_to_remove = [k for k in self._query_cache.keys() if pattern in k]
-                for key in keys_to_remove:
-                    del self._query_cache[key]
+            self._query_cache.invalidate(
+                self._generate_cache_key('get_trade', user_id=user_id, trade_id=trade_id)
+            )
+            self._query_cache.invalidate_user(user_id, operations=['get_user_trades'])
             
             # Log audit event
-            self._log_audit_event('trade_updated', user_id, {
+            await self._log_audit_event('trade_updated', user_id, {
                 'trade_id': trade_id,
                 'new_status': status.value,
                 'execution_details': execution_details
@@ -694,9 +1302,9 @@ class DatabaseService:
             cache_key = self._generate_cache_key('get_user_positions', user_id=user_id, active_only=active_only)
             cached_result = self._get_from_cache(cache_key)
             if cached_result is not None:
-                return [Position.from_dict(pos_data) for pos_data in cached_result]
+                return thaw_all(cached_result)
             
-            table = self._get_table(self.positions_table_name)
+            table = await self._resolve_table(self.positions_table_name)
             response = await self._execute_with_retry(
                 table.query,
                 KeyConditionExpression='pk = :pk',
@@ -705,15 +1313,11 @@ class DatabaseService:
             
             positions = []
             for item in response.get('Items', []):
-                # Remove DynamoDB specific fields
-                for key in ['pk', 'sk', 'ttl']:
-                    item.pop(key, None)
-                
                 try:
-                    position = Position.from_dict(item)
+                    position = self._position_from_item(item)
                     
-                    # Filter active positions if requested
-                    if active_only and position.is_closed():
+                    # Closed positions have no Position representation
+                    if position is None or (active_only and position.is_closed()):
                         continue
                     
                     positions.append(position)
@@ -721,22 +1325,26 @@ class DatabaseService:
                     logger.warning(f"Failed to parse position data: {str(e)}")
                     continue
             
-            # Cache the results
-            position_data_list = [pos.to_dict() for pos in positions]
-            self._set_cache(cache_key, position_data_list)
+            # Cache immutable snapshots
+            snapshots = freeze_all(positions)
+            self._set_cache(cache_key, snapshots, user_id=user_id)
             
             logger.info(f"Retrieved {len(positions)} positions for user {user_id}")
-            return positions
+            return thaw_all(snapshots)
             
         except Exception as e:
             logger.error(f"Failed to get positions for user {user_id}: {str(e)}")
             raise DatabaseError(f"Failed to retrieve user positions: {str(e)}", "POSITIONS_GET_FAILED", e)
     
-    async def update_position(self, user_id: str, symbol: str, quantity: int, 
+    async def update_position(self, user_id: str, symbol: str, quantity: int,
                             price: Decimal, trade_id: str, commission: Decimal = Decimal('0.00')) -> bool:
         """
         Update or create a position based on a trade.
         
+        The position is read and rewritten with a condition on its version, so
+        a concurrent fill makes the write fail and it is retried against the
+        new state instead of overwriting it.
+        
         Args:
             user_id: User ID who owns the position
             symbol: Stock symbol
@@ -749,71 +1357,31 @@ class DatabaseService:
             True if successful
         """
         try:
-            table = self._get_table(self.positions_table_name)
+            table = await self._resolve_table(self.positions_table_name)
             symbol = symbol.upper()
             
-            # Get existing position
-            response = await self._execute_with_retry(
-                table.get_item,
-                Key={
-                    'pk': f"USER#{user_id}",
-                    'sk': f"SYMBOL#{symbol}"
-                }
-            )
+            for attempt in range(1, POSITION_WRITE_ATTEMPTS + 1):
+                item = await self._get_position_item(user_id, symbol)
+                update = self._build_position_update(user_id, symbol, quantity, price, trade_id, commission, item)
+                try:
+                    await self._execute_with_retry(table.update_item, **update)
+                    break
+                except ConflictError:
+                    if attempt == POSITION_WRITE_ATTEMPTS:
+                        raise
+                    logger.warning(f"Position {symbol} for user {user_id} changed concurrently, retrying")
             
-            if 'Item' in response:
-                # Update existing position
-                existing_data = response['Item']
-                # Remove DynamoDB specific fields
-                for key in ['pk', 'sk', 'ttl']:
-                    existing_data.pop(key, None)
-                
-                position = Position.from_dict(existing_data)
-                position.add_trade(trade_id, quantity, price, commission)
-            else:
-                # Create new position
-                position = Position(
-                    user_id=user_id,
-                    symbol=symbol,
-                    quantity=quantity,
-                    average_cost=price,
-                    current_price=price
-                )
-                position.add_trade(trade_id, quantity, price, commission)
-            
-            # Convert to DynamoDB item
-            item = position.to_dict()
-            item['pk'] = f"USER#{user_id}"
-            item['sk'] = f"SYMBOL#{symbol}"
-            item['ttl'] = int((datetime.now(timezone.utc) + timedelta(days=2555)).timestamp())
-            
-            # Store updated position
-            if position.is_closed():
-                # Remove closed position
-                await self._execute_with_retry(
-                    table.delete_item,
-                    Key={
-                        'pk': f"USER#{user_id}",
-                        'sk': f"SYMBOL#{symbol}"
-                    }
-                )
-                logger.info(f"Position {symbol} closed and removed for user {user_id}")
-            else:
-                await self._execute_with_retry(table.put_item, Item=item)
-                logger.info(f"Position {symbol} updated for user {user_id}: {position.quantity} shares")
+            new_quantity = update['ExpressionAttributeValues'][':quantity']
+            logger.info(f"Position {symbol} updated for user {user_id}: {new_quantity} shares")
             
             # Clear position cache
-            cache_patterns = [f"get_user_positions:user_id:{user_id}"]
-            for pattern in cache_patterns:
-                keys_to_remove = [k for k in self._query_cache.keys() if pattern in k]
-                for key in keys_to_remove:
-                    del self._query_cache[key]
+            self._query_cache.invalidate_user(user_id, operations=['get_user_positions'])
             
             # Log audit event
-            self._log_audit_event('position_updated', user_id, {
+            await self._log_audit_event('position_updated', user_id, {
                 'symbol': symbol,
                 'quantity_change': quantity,
-                'new_quantity': position.quantity,
+                'new_quantity': new_quantity,
                 'price': str(price),
                 'trade_id': trade_id
             })
@@ -824,6 +1392,333 @@ class DatabaseService:
             logger.error(f"Failed to update position {symbol} for user {user_id}: {str(e)}")
             raise DatabaseError(f"Failed to update position: {str(e)}", "POSITION_UPDATE_FAILED", e)
     
+    async def _get_position_item(self, user_id: str, symbol: str) -> Optional[Dict[str, Any]]:
+        """Read a raw position item with a strongly consistent read."""
+        table = await self._resolve_table(self.positions_table_name)
+        response = await self._execute_with_retry(
+            table.get_item,
+            Key={
+                'pk': f"USER#{user_id}",
+                'sk': f"SYMBOL#{symbol}"
+            },
+            ConsistentRead=True
+        )
+        return response.get('Item') if isinstance(response, dict) else None
+    
+    def _build_position_update(self, user_id: str, symbol: str, quantity: int, price: Decimal,
+                               trade_id: str, commission: Decimal = Decimal('0.00'),
+                               item: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Build the conditional update applying a fill to a position item.
+        
+        The new quantity, average cost and realized P&L are computed from the
+        current item, so closing a position realizes its P&L and reopening it
+        starts a fresh cost basis. Update expressions can only add and
+        subtract, so this arithmetic cannot run inside the expression itself;
+        instead the update is conditioned on the item's version (or absence),
+        making the read-modify-write safe under concurrent fills.
+        
+        Args:
+            user_id: User ID who owns the position
+            symbol: Stock symbol (upper case)
+            quantity: Signed quantity change
+            price: Fill price
+            trade_id: Trade ID added to the position's recent trade history
+            commission: Commission paid
+            item: Current raw position item, or None if there is none
+            
+        Returns:
+            Keyword arguments for UpdateItem (Key, UpdateExpression,
+            ConditionExpression, names, values)
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        price = Decimal(str(price))
+        state = self._position_state(item or {})
+        
+        new_quantity, average_cost, realized_pnl = _apply_position_fill(
+            state['quantity'], state['average_cost'], state['realized_pnl'], quantity, price
+        )
+        trade_history = (list(item.get('trade_history', [])) if item else []) + [trade_id]
+        version = int(item.get('version', 0)) if item else 0
+        
+        names = {
+            '#user_id': 'user_id',
+            '#symbol': 'symbol',
+            '#quantity': 'quantity',
+            '#average_cost': 'average_cost',
+            '#realized_pnl': 'realized_pnl',
+            '#commission_paid': 'commission_paid',
+            '#current_price': 'current_price',
+            '#last_updated': 'last_updated',
+            '#opened_date': 'opened_date',
+            '#ttl': 'ttl',
+            '#trade_history': 'trade_history',
+            '#version': 'version'
+        }
+        values = {
+            ':user_id': user_id,
+            ':symbol': symbol,
+            ':quantity': new_quantity,
+            ':average_cost': average_cost,
+            ':realized_pnl': realized_pnl,
+            ':commission_paid': state['commission_paid'] + Decimal(str(commission)),
+            ':price': price,
+            ':now': now,
+            ':ttl': int((datetime.now(timezone.utc) + timedelta(days=2555)).timestamp()),
+            ':trade_history': trade_history[-POSITION_TRADE_HISTORY_LIMIT:],
+            ':version': version + 1
+        }
+        
+        # A position opened from flat gets a new opened date
+        opened_date = ":now" if state['quantity'] == 0 else "if_not_exists(#opened_date, :now)"
+        update_expression = (
+            "SET #user_id = :user_id, #symbol = :symbol, #quantity = :quantity, "
+            "#average_cost = :average_cost, #realized_pnl = :realized_pnl, "
+            "#commission_paid = :commission_paid, #current_price = :price, #last_updated = :now, "
+            f"#opened_date = {opened_date}, #ttl = :ttl, #trade_history = :trade_history, #version = :version"
+        )
+        
+        if item is None:
+            condition = "attribute_not_exists(pk)"
+        elif 'version' in item:
+            condition = "#version = :expected_version"
+            values[':expected_version'] = version
+        else:
+            condition = "attribute_exists(pk) AND attribute_not_exists(#version)"
+        
+        return {
+            'Key': {
+                'pk': f"USER#{user_id}",
+                'sk': f"SYMBOL#{symbol}"
+            },
+            'UpdateExpression': update_expression,
+            'ConditionExpression': condition,
+            'ExpressionAttributeNames': names,
+            'ExpressionAttributeValues': values
+        }
+    
+    @staticmethod
+    def _position_state(item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Quantity, average cost, realized P&L and commission of a position item.
+        
+        Args:
+            item: Raw DynamoDB item (empty for a position that does not exist)
+            
+        Returns:
+            Dictionary with quantity, average_cost, realized_pnl and commission_paid
+        """
+        return {
+            'quantity': int(item.get('quantity', 0)),
+            'average_cost': Decimal(str(item.get('average_cost') or 0)),
+            'realized_pnl': Decimal(str(item.get('realized_pnl') or 0)),
+            'commission_paid': Decimal(str(item.get('commission_paid') or 0))
+        }
+        
+        shares_bought = Decimal(str(item.get('shares_bought', 0)))
+        cost_bought = Decimal(str(item.get('cost_bought', 0)))
+        shares_sold = Decimal(str(item.get('shares_sold', 0)))
+        proceeds_sold = Decimal(str(item.get('proceeds_sold', 0)))
+        state['commission_paid'] += Decimal(str(item.get('commission_total', 0)))
+        
+        # Fold in the lot held before the counters began
+        opening_quantity = Decimal(quantity) - (shares_bought - shares_sold)
+        if opening_quantity != 0 and item.get('average_cost') is not None:
+            opening_cost = Decimal(str(item['average_cost'])) * abs(opening_quantity)
+            if opening_quantity > 0:
+                shares_bought += opening_quantity
+                cost_bought += opening_cost
+            else:
+                shares_sold += -opening_quantity
+                proceeds_sold += opening_cost
+        
+        avg_buy = cost_bought / shares_bought if shares_bought else None
+        avg_sell = proceeds_sold / shares_sold if shares_sold else None
+        if quantity == 0:
+            state['average_cost'] = Decimal('0')
+        else:
+            average_cost = (avg_buy if quantity > 0 else avg_sell) or Decimal(str(item['current_price']))
+            state['average_cost'] = average_cost.quantize(Decimal('0.0001'))
+        
+        if avg_buy is not None and avg_sell is not None:
+            state['realized_pnl'] += (avg_sell - avg_buy) * min(shares_bought, shares_sold)
+        return state
+        
+    def _position_from_item(self, item: Dict[str, Any]) -> Optional[Position]:
+        """
+        Build a Position from a positions-table item.
+        
+        Args:
+            item: Raw DynamoDB item
+        
+        Returns:
+            Position, or None if the position is flat
+        """
+        data = {
+            k: v for k, v in item.items()
+            if k not in ('pk', 'sk', 'ttl', 'version')
+        }
+        state = self._position_state(item)
+        if state['quantity'] == 0:
+            return None
+        
+        data.update(state)
+        data['realized_pnl'] = state['realized_pnl'].quantize(Decimal('0.01'))
+        data['trade_history'] = list(data.get('trade_history', []))
+        position = Position.from_dict(data)
+        if item.get('last_updated'):
+            position.last_updated = datetime.fromisoformat(item['last_updated'])
+        return position
+    
+    @staticmethod
+    def _cancellation_code(error: DatabaseError, index: int) -> Optional[str]:
+        """Cancellation reason code reported for the transaction item at index."""
+        original = error.original_error
+        if isinstance(original, ClientError):
+            reasons = original.response.get('CancellationReasons', [])
+            if index < len(reasons):
+                return reasons[index].get('Code')
+        return None
+    
+    @staticmethod
+    def _is_conditional_cancellation(error: DatabaseError) -> bool:
+        """Check whether a cancelled transaction failed on a condition check."""
+        original = error.original_error
+        if isinstance(original, ClientError):
+            reasons = original.response.get('CancellationReasons', [])
+            if any(reason.get('Code') == 'ConditionalCheckFailed' for reason in reasons):
+                return True
+        return 'ConditionalCheckFailed' in str(original or error)
+    
+    async def settle_trade(self, trade: Trade) -> bool:
+        """
+        Persist an executed or failed trade in a single transaction.
+        
+        Writes the trade record (including its final status and execution
+        details) and, for executed trades, the position change with one
+        TransactWriteItems call instead of separate log/position/status writes.
+        If the position changed between reading and writing it, the
+        transaction is rebuilt from the new position and retried.
+        
+        Args:
+            trade: Trade with its final status set
+            
+        Returns:
+            True if successful
+            
+        Raises:
+            ConflictError: If the trade was already recorded
+            DatabaseError: If the transaction fails
+        """
+        try:
+            trade.validate()
+            
+            trade_item = build_trade_item(trade)
+            
+            serializer = TypeSerializer()
+            trade_put = {
+                'Put': {
+                    'TableName': self.trades_table_name,
+                    'Item': {k: serializer.serialize(v) for k, v in _to_dynamodb_types(trade_item).items()},
+                    'ConditionExpression': 'attribute_not_exists(pk) AND attribute_not_exists(sk)'
+                }
+            }
+            
+            quantity_change = None
+            if trade.status == TradeStatus.EXECUTED:
+                quantity_change = trade.quantity if trade.trade_type == TradeType.BUY else -trade.quantity
+            
+            client = await self._get_transaction_client()
+            for attempt in range(1, POSITION_WRITE_ATTEMPTS + 1):
+                transact_items = [trade_put]
+                if quantity_change is not None:
+                    item = await self._get_position_item(trade.user_id, trade.symbol)
+                    update = self._build_position_update(
+                        trade.user_id,
+                        trade.symbol,
+                        quantity_change,
+                        trade.execution_price or trade.price,
+                        trade.trade_id,
+                        trade.commission or Decimal('0.00'),
+                        item
+                    )
+                    transact_items.append({
+                        'Update': {
+                            'TableName': self.positions_table_name,
+                            'Key': {k: serializer.serialize(v) for k, v in update['Key'].items()},
+                            'UpdateExpression': update['UpdateExpression'],
+                            'ConditionExpression': update['ConditionExpression'],
+                            'ExpressionAttributeNames': update['ExpressionAttributeNames'],
+                            'ExpressionAttributeValues': {
+                                k: serializer.serialize(v)
+                                for k, v in _to_dynamodb_types(update['ExpressionAttributeValues']).items()
+                            }
+                        }
+                    })
+            
+                # A retried transaction has different items, so it needs its own token
+                token = trade.trade_id[:36] if attempt == 1 else f"{trade.trade_id[:32]}-{attempt}"
+                self._metrics['transactions'] += 1
+                try:
+                    await self._execute_with_retry(
+                        client.transact_write_items,
+                        TransactItems=transact_items,
+                        ClientRequestToken=token
+                    )
+                    break
+                except DatabaseError as e:
+                    position_conflict = (
+                        self._cancellation_code(e, 1) == 'ConditionalCheckFailed' and
+                        self._cancellation_code(e, 0) != 'ConditionalCheckFailed'
+                    )
+                    if not position_conflict:
+                        raise
+                    if attempt == POSITION_WRITE_ATTEMPTS:
+                        raise DatabaseError(
+                            f"Position {trade.symbol} kept changing concurrently",
+                            "POSITION_CONFLICT", e
+                        )
+                    logger.warning(f"Position {trade.symbol} changed while settling {trade.trade_id}, retrying")
+            
+            # Clear related cache entries
+            self._query_cache.invalidate_user(
+                trade.user_id, operations=['get_trade', 'get_user_trades', 'get_user_positions']
+            )
+            
+            await self._log_audit_event('trade_settled', trade.user_id, {
+                'trade_id': trade.trade_id,
+                'symbol': trade.symbol,
+                'quantity': trade.quantity,
+                'trade_type': trade.trade_type.value,
+                'status': trade.status.value,
+                'execution_id': trade.execution_id,
+                'execution_price': str(trade.execution_price) if trade.execution_price else None,
+                'position_change': quantity_change
+            })
+            
+            logger.info(f"Trade {trade.trade_id} settled with status {trade.status.value}")
+            return True
+            
+        except DatabaseError as e:
+            # A reused request token with a different payload means the trade id was already settled
+            if (e.error_code == 'IdempotentParameterMismatchException' or
+                    (e.error_code == 'TransactionCanceledException' and self._is_conditional_cancellation(e))):
+                logger.warning(f"Trade {trade.trade_id} already exists")
+                raise ConflictError(f"Trade {trade.trade_id} already exists", "DUPLICATE_TRADE", e)
+            logger.error(f"Failed to settle trade {trade.trade_id}: {str(e)}")
+            raise DatabaseError(f"Failed to settle trade: {str(e)}", "TRADE_SETTLE_FAILED", e)
+        
+        except Exception as e:
+            logger.error(f"Failed to settle trade {trade.trade_id}: {str(e)}")
+            raise DatabaseError(f"Failed to settle trade: {str(e)}", "TRADE_SETTLE_FAILED", e)
+    
+    async def _get_transaction_client(self):
+        """Get the low-level client used for TransactWriteItems."""
+        if self.use_async_client:
+            resource = await self._get_async_resource()
+            return resource.meta.client
+        return self._dynamodb_client
+    
     # User Management Methods
     
     async def create_user(self, user: User) -> bool:
@@ -848,7 +1743,7 @@ class DatabaseService:
             item['gsi1sk'] = "USER"
             item['ttl'] = int((datetime.now(timezone.utc) + timedelta(days=3650)).timestamp())  # 10 years
             
-            table = self._get_table(self.users_table_name)
+            table = await self._resolve_table(self.users_table_name)
             await self._execute_with_retry(
                 table.put_item,
                 Item=item,
@@ -856,7 +1751,7 @@ class DatabaseService:
             )
             
             # Log audit event
-            self._log_audit_event('user_created', user.user_id, {
+            await self._log_audit_event('user_created', user.user_id, {
                 'slack_user_id': user.slack_user_id,
                 'role': user.role.value,
                 'status': user.status.value
@@ -888,9 +1783,9 @@ class DatabaseService:
             cache_key = self._generate_cache_key('get_user', user_id=user_id)
             cached_result = self._get_from_cache(cache_key)
             if cached_result is not None:
-                return User.from_dict(cached_result) if cached_result else None
+                return cached_result.thaw() if cached_result else None
             
-            table = self._get_table(self.users_table_name)
+            table = await self._resolve_table(self.users_table_name)
             response = await self._execute_with_retry(
                 table.get_item,
                 Key={
@@ -907,13 +1802,13 @@ class DatabaseService:
                 
                 user = User.from_dict(user_data)
                 
-                # Cache the result
-                self._set_cache(cache_key, user_data)
+                # Cache an immutable snapshot; callers get mutable views
+                self._set_cache(cache_key, user.freeze(), user_id=user_id)
                 
-                return user
+                return user.thaw()
             
             # Cache negative result
-            self._set_cache(cache_key, None)
+            self._set_cache(cache_key, None, user_id=user_id)
             return None
             
         except Exception as e:
@@ -935,9 +1830,9 @@ class DatabaseService:
             cache_key = self._generate_cache_key('get_user_by_slack_id', slack_user_id=slack_user_id)
             cached_result = self._get_from_cache(cache_key)
             if cached_result is not None:
-                return User.from_dict(cached_result) if cached_result else None
+                return cached_result.thaw() if cached_result else None
             
-            table = self._get_table(self.users_table_name)
+            table = await self._resolve_table(self.users_table_name)
             response = await self._execute_with_retry(
                 table.query,
                 IndexName='gsi1',
@@ -956,10 +1851,10 @@ class DatabaseService:
                 
                 user = User.from_dict(user_data)
                 
-                # Cache the result
-                self._set_cache(cache_key, user_data)
+                # Cache an immutable snapshot; callers get mutable views
+                self._set_cache(cache_key, user.freeze(), user_id=user.user_id)
                 
-                return user
+                return user.thaw()
             
             # Cache negative result
             self._set_cache(cache_key, None)
@@ -988,7 +1883,7 @@ class DatabaseService:
             if cached_result is not None:
                 return cached_result
             
-            table = self._get_table(self.channels_table_name)
+            table = await self._resolve_table(self.channels_table_name)
             response = await self._execute_with_retry(
                 table.get_item,
                 Key={'channel_id': channel_id}
@@ -1022,7 +1917,7 @@ class DatabaseService:
             True if successful
         """
         try:
-            table = self._get_table(self.channels_table_name)
+            table = await self._resolve_table(self.channels_table_name)
             
             item = {
                 'channel_id': channel_id,
@@ -1037,11 +1932,10 @@ class DatabaseService:
             
             # Clear cache
             cache_key = self._generate_cache_key('is_channel_approved', channel_id=channel_id)
-            if cache_key in self._query_cache:
-                del self._query_cache[cache_key]
+            self._query_cache.invalidate(cache_key)
             
             # Log audit event
-            self._log_audit_event('channel_approved', created_by, {
+            await self._log_audit_event('channel_approved', created_by, {
                 'channel_id': channel_id,
                 'channel_name': channel_name
             })
@@ -1055,56 +1949,156 @@ class DatabaseService:
     
     # Batch Operations
     
-    async def batch_write_trades(self, trades: List[Trade]) -> Dict[str, Any]:
+    async def batch_write_trades(self, trades: List[Trade], max_concurrency: int = 8) -> Dict[str, Any]:
         """
         Write multiple trades in batch for improved performance.
         
         Args:
             trades: List of Trade objects to write
+            max_concurrency: Maximum number of BatchWriteItem requests in flight
             
         Returns:
-            Dictionary with success/failure counts
+            Dictionary with success/failure counts, unprocessed count,
+            duplicates dropped and consumed write capacity; success, failed
+            and duplicates add up to the number of trades given
         """
         try:
             self._metrics['batch_operations'] += 1
             
-            table = self._get_table(self.trades_table_name)
-            
-            # Process in batches of 25 (DynamoDB limit)
-            batch_size = 25
             results = {'success': 0, 'failed': 0, 'errors': []}
+            ttl = trade_ttl()
+            items = []
             
-            for i in range(0, len(trades), batch_size):
-                batch = trades[i:i + batch_size]
-                
-                with table.batch_writer() as batch_writer:
-                    for trade in batch:
-                        try:
-                            trade.validate()
-                            item = trade.to_dict()
-                            
-                            # Add DynamoDB specific fields
-                            item['pk'] = f"USER#{trade.user_id}"
-                            item['sk'] = f"TRADE#{trade.trade_id}"
-                            item['gsi1pk'] = f"SYMBOL#{trade.symbol}"
-                            item['gsi1sk'] = trade.timestamp.isoformat()
-                            item['ttl'] = int((datetime.now(timezone.utc) + timedelta(days=2555)).timestamp())
-                            
-                            batch_writer.put_item(Item=item)
-                            results['success'] += 1
-                            
-                        except Exception as e:
-                            results['failed'] += 1
-                            results['errors'].append(f"Trade {trade.trade_id}: {str(e)}")
-                            logger.error(f"Failed to batch write trade {trade.trade_id}: {str(e)}")
-            
-            logger.info(f"Batch write completed: {results['success']} success, {results['failed']} failed")
+            for trade in trades:
+                try:
+                    trade.validate()
+                    items.append(build_trade_item(trade, ttl))
+                except Exception as e:
+                    results['failed'] += 1
+                    results['errors'].append(f"Trade {trade.trade_id}: {str(e)}")
+                    logger.error(f"Failed to batch write trade {trade.trade_id}: {str(e)}")
+            
+            write_results = await self.write_trade_items(items, max_concurrency=max_concurrency)
+            results['success'] += write_results['written']
+            results['failed'] += len(write_results['unprocessed'])
+            results['unprocessed'] = len(write_results['unprocessed'])
+            results['duplicates'] = write_results['duplicates']
+            results['consumed_wcu'] = write_results['consumed_wcu']
+            
+            logger.info(
+                f"Batch write completed: {results['success']} success, {results['failed']} failed, "
+                f"{results['duplicates']} duplicates"
+            )
             return results
             
         except Exception as e:
             logger.error(f"Batch write trades failed: {str(e)}")
             raise DatabaseError(f"Batch write failed: {str(e)}", "BATCH_WRITE_FAILED", e)
     
+    async def write_trade_items(self, items: List[Dict[str, Any]], max_concurrency: int = 8,
+                                max_retries: int = 5) -> Dict[str, Any]:
+        """
+        Write prepared trade items with concurrent BatchWriteItem requests.
+        
+        Items are interleaved across partition keys, split into 25-item
+        batches and written with at most ``max_concurrency`` requests in
+        flight. Unprocessed items are retried with exponential backoff.
+        Items repeating an earlier item's key are dropped and counted, so
+        written + unprocessed + duplicates equals the number of items given.
+        
+        Args:
+            items: Items built with build_trade_item
+            max_concurrency: Maximum number of requests in flight
+            max_retries: Attempts per batch before giving up on its items
+            
+        Returns:
+            Dictionary with written count, items left unprocessed, duplicates
+            dropped, consumed write capacity units and retry count
+        """
+        items, duplicates = _interleave_by_partition(items)
+        if duplicates:
+            logger.warning(f"{duplicates} trade items repeat another item's key and were dropped")
+        batches = [items[i:i + BATCH_WRITE_MAX_ITEMS] for i in range(0, len(items), BATCH_WRITE_MAX_ITEMS)]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def _write(batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.write_trade_item_batch(batch, max_retries=max_retries)
+        
+        batch_results = await asyncio.gather(*[_write(batch) for batch in batches])
+        
+        results = {'written': 0, 'unprocessed': [], 'duplicates': duplicates, 'consumed_wcu': 0.0, 'retries': 0}
+        for batch_result in batch_results:
+            results['written'] += batch_result['written']
+            results['unprocessed'].extend(batch_result['unprocessed'])
+            results['consumed_wcu'] += batch_result['consumed_wcu']
+            results['retries'] += batch_result['retries']
+        
+        if results['unprocessed']:
+            logger.warning(f"{len(results['unprocessed'])} trade items left unprocessed after retries")
+        return results
+    
+    async def write_trade_item_batch(self, items: List[Dict[str, Any]], max_retries: int = 5,
+                                     base_backoff: float = 0.05) -> Dict[str, Any]:
+        """
+        Write up to 25 trade items, retrying unprocessed items with backoff.
+        
+        Args:
+            items: Items built with build_trade_item
+            max_retries: Attempts before the remaining items are returned
+            base_backoff: Initial retry delay in seconds
+            
+        Returns:
+            Dictionary with written count, items left unprocessed, consumed
+            write capacity units and retry count
+        """
+        if len(items) > BATCH_WRITE_MAX_ITEMS:
+            raise ValidationError(f"Batch of {len(items)} exceeds {BATCH_WRITE_MAX_ITEMS} items", "BATCH_TOO_LARGE")
+        
+        self._get_table(self.trades_table_name)
+        if self.use_async_client:
+            resource = await self._get_async_resource()
+        else:
+            resource = self._dynamodb_resource
+        
+        results = {'written': 0, 'unprocessed': [], 'consumed_wcu': 0.0, 'retries': 0}
+        pending = items
+        attempt = 0
+        
+        while pending:
+            response = await self._execute_with_retry(
+                resource.batch_write_item,
+                RequestItems={
+                    self.trades_table_name: [{'PutRequest': {'Item': item}} for item in pending]
+                },
+                ReturnConsumedCapacity='TOTAL'
+            )
+            
+            for capacity in response.get('ConsumedCapacity', []):
+                results['consumed_wcu'] += float(capacity.get('CapacityUnits', 0))
+            
+            unprocessed = [
+                request['PutRequest']['Item']
+                for request in response.get('UnprocessedItems', {}).get(self.trades_table_name, [])
+            ]
+            results['written'] += len(pending) - len(unprocessed)
+            pending = unprocessed
+            
+            if not pending:
+                break
+            
+            attempt += 1
+            if attempt >= max_retries:
+                results['unprocessed'] = pending
+                break
+            
+            results['retries'] += 1
+            self._metrics['retries'] += 1
+            delay = base_backoff * (2 ** (attempt - 1))
+            await asyncio.sleep(delay + random.uniform(0, delay))
+        
+        return results
+    
     # Health and Monitoring Methods
     
     def get_health_status(self) -> Dict[str, Any]:
@@ -1115,25 +2109,33 @@ class DatabaseService:
             Dictionary with health information
         """
         try:
-            # Test connection by listing tables
-            table_status = {}
-            for table_name, table in self._tables.items():
-                if table is not None:
-                    try:
-                        table.load()
-                        table_status[table_name] = 'healthy'
-                    except Exception as e:
-                        table_status[table_name] = f'error: {str(e)}'
-                else:
-                    table_status[table_name] = 'not_found'
+            # Test connection by describing every table concurrently
+            def _check_table(table_name: str) -> str:
+                try:
+                    self._dynamodb_client.describe_table(TableName=table_name)
+                    return 'healthy'
+                except ClientError as e:
+                    if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                        return 'not_found'
+                    return f'error: {str(e)}'
+                except Exception as e:
+                    return f'error: {str(e)}'
+            
+            table_names = self.table_names
+            with ThreadPoolExecutor(max_workers=len(table_names)) as executor:
+                table_status = dict(zip(table_names, executor.map(_check_table, table_names)))
             
             return {
                 'status': 'healthy' if all(status == 'healthy' for status in table_status.values()) else 'degraded',
                 'region': self.region_name,
-                'endpoint': self.endpoint_url or 'aws',
+                'endpoint': self.endpoint_label,
+                'backend': self.backend,
+                'async_client': self.use_async_client,
                 'tables': table_status,
                 'metrics': self._metrics.copy(),
+                'audit_writer': self._audit_writer.get_metrics(),
                 'cache_size': len(self._query_cache),
+                'cold_start': self.get_cold_start_timings(),
                 'timestamp': datetime.now(timezone.utc).isoformat()
             }
             
@@ -1145,9 +2147,26 @@ class DatabaseService:
                 'timestamp': datetime.now(timezone.utc).isoformat()
             }
     
+    def get_cold_start_timings(self) -> Dict[str, Any]:
+        """
+        Get the cold start timing breakdown.
+        
+        Returns:
+            Dictionary with client, table and constructor timings in
+            milliseconds, and per-table describe timings with the phase
+            (init or first_use) and whether the process-wide cache was hit
+        """
+        timings = dict(self._cold_start)
+        timings['tables'] = {name: dict(info) for name, info in self._cold_start['tables'].items()}
+        return timings
+    
     def get_metrics(self) -> Dict[str, Any]:
-        """Get performance metrics."""
-        return self._metrics.copy()
+        """Get performance metrics, including per-operation cache hit/miss counts."""
+        metrics = self._metrics.copy()
+        metrics['cache'] = self._query_cache.get_stats()
+        if self.local_store is not None:
+            metrics['local_store'] = self.local_store.get_stats()
+        return metrics
     
     def clear_cache(self) -> None:
         """Clear query cache."""
@@ -1157,6 +2176,9 @@ class DatabaseService:
     async def close(self) -> None:
         """Clean up resources."""
         try:
+            # Drain buffered audit entries
+            await self.flush_audit_log()
+            
             # Clear cache
             self.clear_cache()
             
@@ -1165,6 +2187,13 @@ class DatabaseService:
                 # boto3 clients don't need explicit closing
                 pass
             
+            # Release the pooled aioboto3 connector
+            if self._async_resource_context is not None:
+                await self._async_resource_context.__aexit__(None, None, None)
+                self._async_resource_context = None
+                self._async_resource = None
+                self._async_tables.clear()
+            
             logger.info("Database service closed successfully")
             
         except Exception as e:
@@ -0,0 +1,247 @@
+"""
+Incrementally maintained trading statistics.
+
+Each finished execution report updates counters, traded volume, running
+mean and variance (Welford's method) of execution time and slippage, and
+streaming p50/p95/p99 estimates (the P-squared algorithm, five markers per
+quantile), overall and per symbol. Nothing is recomputed from history, so
+reading the statistics costs O(symbols) however many executions there were,
+and the figures cover every execution even after old reports have left the
+execution history.
+"""
+
+import math
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from services.trading_api import ExecutionReport
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class RunningStats:
+    """Count, mean and variance of a stream via Welford's method."""
+    
+    __slots__ = ('count', 'mean', '_m2', 'min', 'max')
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+    
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+    
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 for fewer than two values)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class P2Quantile:
+    """
+    Streaming estimate of one quantile in constant memory.
+    
+    Implements the P-squared algorithm of Jain and Chlamtac: five markers
+    track the minimum, the quantile, the maximum and two midpoints, and are
+    adjusted with piecewise-parabolic interpolation as values arrive.
+    """
+    
+    __slots__ = ('q', 'count', '_heights', '_positions', '_desired', '_increments')
+    
+    def __init__(self, q: float):
+        if not 0 < q < 1:
+            raise ValueError(f"Quantile must be between 0 and 1: {q}")
+        self.q = q
+        self.count = 0
+        self._heights: List[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * q, 4 * q, 2 + 2 * q, 4.0]
+        self._increments = [0.0, q / 2, q, (1 + q) / 2, 1.0]
+    
+    def add(self, value: float) -> None:
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+        
+        # Cell the value falls into, stretching the extremes if needed
+        if value < heights[0]:
+            heights[0] = value
+            k = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= heights[k + 1]:
+                k += 1
+        
+        positions = self._positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+        
+        for i in (1, 2, 3):
+            d = self._desired[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or \
+               (d <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (
+                        positions[i + step] - positions[i]
+                    )
+                heights[i] = height
+                positions[i] += step
+    
+    def value(self) -> Optional[float]:
+        """Current estimate (exact while fewer than six values were seen)."""
+        if not self.count:
+            return None
+        if self.count <= 5:
+            # Nearest-rank quantile of the values seen so far
+            return self._heights[max(0, math.ceil(self.q * self.count) - 1)]
+        return self._heights[2]
+    
+    def _parabolic(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+
+class MetricSummary:
+    """Running moments and quantile estimates of one metric."""
+    
+    __slots__ = ('stats', 'quantiles')
+    
+    def __init__(self, quantiles: Sequence[float] = DEFAULT_QUANTILES):
+        self.stats = RunningStats()
+        self.quantiles = [P2Quantile(q) for q in quantiles]
+    
+    def add(self, value: float) -> None:
+        self.stats.add(value)
+        for quantile in self.quantiles:
+            quantile.add(value)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        summary = {
+            'count': self.stats.count,
+            'mean': self.stats.mean,
+            'stdev': self.stats.stdev,
+            'min': self.stats.min,
+            'max': self.stats.max
+        }
+        for quantile in self.quantiles:
+            summary[f"p{quantile.q * 100:g}"] = quantile.value()
+        return summary
+
+
+@dataclass
+class SymbolStatistics:
+    """Aggregates for one symbol."""
+    count: int = 0
+    volume: Decimal = Decimal('0')
+    slippage: MetricSummary = field(default_factory=MetricSummary)
+    execution_time: MetricSummary = field(default_factory=MetricSummary)
+
+
+class ExecutionStatistics:
+    """
+    Trading statistics updated as each execution report finishes.
+    
+    Usage:
+        stats = ExecutionStatistics()
+        stats.record(report)
+        stats.get_summary()
+    """
+    
+    def __init__(self):
+        self.total_executions = 0
+        self.successful_executions = 0
+        self.partial_executions = 0
+        self.failed_executions = 0
+        self.total_volume = Decimal('0')
+        self.execution_time = MetricSummary()
+        self.slippage = MetricSummary()
+        self.symbols: Dict[str, SymbolStatistics] = {}
+    
+    def record(self, report: 'ExecutionReport') -> None:
+        """
+        Add a finished report to the statistics.
+        
+        Args:
+            report: Report leaving the active orders
+        """
+        symbol_stats = self.symbols.get(report.symbol)
+        if symbol_stats is None:
+            symbol_stats = self.symbols[report.symbol] = SymbolStatistics()
+        
+        self.total_executions += 1
+        symbol_stats.count += 1
+        if report.is_complete:
+            self.successful_executions += 1
+        elif report.is_partial:
+            self.partial_executions += 1
+        elif report.status.value == 'rejected':
+            self.failed_executions += 1
+        
+        value = report.total_execution_value
+        self.total_volume += value
+        symbol_stats.volume += value
+        
+        if report.execution_time_ms:
+            self.execution_time.add(report.execution_time_ms)
+            symbol_stats.execution_time.add(report.execution_time_ms)
+        
+        if report.slippage_bps is not None:
+            self.slippage.add(report.slippage_bps)
+            symbol_stats.slippage.add(report.slippage_bps)
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """Counts, volume, metric distributions and per-symbol breakdown."""
+        total = self.total_executions
+        return {
+            'execution_summary': {
+                'total_executions': total,
+                'successful_executions': self.successful_executions,
+                'partial_executions': self.partial_executions,
+                'failed_executions': self.failed_executions,
+                'success_rate': (self.successful_executions / total * 100) if total > 0 else 0
+            },
+            'performance_metrics': {
+                'average_execution_time_ms': self.execution_time.stats.mean,
+                'total_volume': float(self.total_volume),
+                'average_slippage_bps': self.slippage.stats.mean,
+                'execution_time_ms': self.execution_time.to_dict(),
+                'slippage_bps': self.slippage.to_dict()
+            },
+            'symbol_breakdown': {
+                symbol: {
+                    'count': stats.count,
+                    'volume': float(stats.volume),
+                    'avg_slippage': stats.slippage.stats.mean,
+                    'slippage_bps': stats.slippage.to_dict(),
+                    'execution_time_ms': stats.execution_time.to_dict()
+                }
+                for symbol, stats in self.symbols.items()
+            }
+        }
@@ -0,0 +1,212 @@
+"""
+Bounded, indexed store of finished execution reports.
+
+Keeps the most recent reports in a retention ring with hash indexes by
+execution, order and trade ID and a per-symbol index in the order reports
+were recorded, so lookups are O(1) and recent history for a symbol is read
+without scanning or sorting. When the ring is full the oldest report is
+evicted and, if a spill sink is configured, handed to it in batches so older
+reports can be kept on disk or in the database.
+"""
+
+import asyncio
+import json
+import os
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, List, Optional
+
+import structlog
+
+if TYPE_CHECKING:
+    from services.trading_api import ExecutionReport
+
+SpillFunc = Callable[[List['ExecutionReport']], Any]
+
+
+class JsonlSpill:
+    """Spill sink appending evicted reports to a JSON Lines file."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def __call__(self, reports: List['ExecutionReport']) -> None:
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for report in reports:
+                f.write(json.dumps(report.to_dict(), separators=(',', ':')))
+                f.write('\n')
+
+
+class ExecutionStore:
+    """
+    Retention ring of execution reports with O(1) lookups.
+    
+    Usage:
+        store = ExecutionStore(max_reports=10000, spill=JsonlSpill('executions.jsonl'))
+        store.add(report)
+        store.get_by_order(report.order_id)
+        store.recent(symbol='AAPL', limit=20)
+    """
+    
+    def __init__(self, max_reports: int = 10000, spill: Optional[SpillFunc] = None,
+                 spill_batch_size: int = 100):
+        """
+        Initialize execution store.
+        
+        Args:
+            max_reports: Reports retained in memory
+            spill: Function or coroutine function receiving evicted reports
+            spill_batch_size: Evicted reports collected before each spill call
+        """
+        if max_reports <= 0:
+            raise ValueError("Execution store size must be positive")
+        
+        self.max_reports = max_reports
+        self.spill = spill
+        self.spill_batch_size = spill_batch_size
+        self.logger = structlog.get_logger(__name__)
+        
+        # Execution ID -> report, oldest first
+        self._reports: 'OrderedDict[str, ExecutionReport]' = OrderedDict()
+        self._by_order: Dict[str, str] = {}
+        self._by_trade: Dict[str, str] = {}
+        self._by_symbol: Dict[str, Deque[str]] = {}
+        
+        self._spill_buffer: List['ExecutionReport'] = []
+        self.total_recorded = 0
+        self.total_evicted = 0
+    
+    def __len__(self) -> int:
+        return len(self._reports)
+    
+    def __iter__(self) -> Iterator['ExecutionReport']:
+        """Retained reports, oldest first."""
+        return iter(list(self._reports.values()))
+    
+    def __contains__(self, execution_id: str) -> bool:
+        return execution_id in self._reports
+    
+    def add(self, report: 'ExecutionReport') -> None:
+        """
+        Record a finished report, evicting the oldest one if the ring is full.
+        
+        Args:
+            report: Filled, partially filled, cancelled or rejected report
+        """
+        execution_id = report.execution_id
+        if execution_id in self._reports:
+            self._remove(execution_id)
+        
+        self._reports[execution_id] = report
+        self._by_order[report.order_id] = execution_id
+        self._by_trade[report.trade_id] = execution_id
+        self._by_symbol.setdefault(report.symbol, deque()).append(execution_id)
+        self.total_recorded += 1
+        
+        while len(self._reports) > self.max_reports:
+            self._evict_oldest()
+    
+    def get(self, execution_id: str) -> Optional['ExecutionReport']:
+        """Report by execution ID."""
+        return self._reports.get(execution_id)
+    
+    def get_by_order(self, order_id: str) -> Optional['ExecutionReport']:
+        """Report by order ID."""
+        execution_id = self._by_order.get(order_id)
+        return self._reports.get(execution_id) if execution_id else None
+    
+    def get_by_trade(self, trade_id: str) -> Optional['ExecutionReport']:
+        """Latest report for a trade ID."""
+        execution_id = self._by_trade.get(trade_id)
+        return self._reports.get(execution_id) if execution_id else None
+    
+    def recent(self, symbol: Optional[str] = None, limit: int = 100) -> List['ExecutionReport']:
+        """
+        Most recently recorded reports, newest first.
+        
+        Args:
+            symbol: Only reports for this symbol
+            limit: Maximum number of reports
+        
+        Returns:
+            List of ExecutionReport objects
+        """
+        if symbol is not None:
+            execution_ids = reversed(self._by_symbol.get(symbol, ()))
+        else:
+            execution_ids = reversed(self._reports)
+        
+        reports = []
+        for execution_id in execution_ids:
+            if len(reports) >= limit:
+                break
+            reports.append(self._reports[execution_id])
+        return reports
+    
+    def symbols(self) -> List[str]:
+        """Symbols with retained reports."""
+        return list(self._by_symbol)
+    
+    def flush(self) -> None:
+        """Hand any buffered evicted reports to the spill sink."""
+        if not self._spill_buffer:
+            return
+        
+        batch, self._spill_buffer = self._spill_buffer, []
+        try:
+            result = self.spill(batch)
+            if asyncio.iscoroutine(result):
+                asyncio.ensure_future(result)
+        except Exception as e:
+            self.logger.error("Execution spill failed", reports=len(batch), error=str(e))
+    
+    def clear(self) -> None:
+        """Drop all retained reports, spilling buffered evictions first."""
+        self.flush()
+        self._reports.clear()
+        self._by_order.clear()
+        self._by_trade.clear()
+        self._by_symbol.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Store size and eviction counts for monitoring."""
+        return {
+            'retained': len(self._reports),
+            'max_reports': self.max_reports,
+            'total_recorded': self.total_recorded,
+            'evicted': self.total_evicted,
+            'spill_pending': len(self._spill_buffer),
+            'symbols': len(self._by_symbol)
+        }
+    
+    def _evict_oldest(self) -> None:
+        execution_id, report = self._reports.popitem(last=False)
+        self._unindex(execution_id, report)
+        self.total_evicted += 1
+        
+        # The oldest report overall is also the oldest of its symbol
+        symbol_ids = self._by_symbol[report.symbol]
+        symbol_ids.popleft()
+        if not symbol_ids:
+            del self._by_symbol[report.symbol]
+        
+        if self.spill is not None:
+            self._spill_buffer.append(report)
+            if len(self._spill_buffer) >= self.spill_batch_size:
+                self.flush()
+    
+    def _remove(self, execution_id: str) -> None:
+        report = self._reports.pop(execution_id)
+        self._unindex(execution_id, report)
+        symbol_ids = self._by_symbol[report.symbol]
+        symbol_ids.remove(execution_id)
+        if not symbol_ids:
+            del self._by_symbol[report.symbol]
+    
+    def _unindex(self, execution_id: str, report: 'ExecutionReport') -> None:
+        if self._by_order.get(report.order_id) == execution_id:
+            del self._by_order[report.order_id]
+        if self._by_trade.get(report.trade_id) == execution_id:
+            del self._by_trade[report.trade_id]
@@ -0,0 +1,1356 @@
+"""
+Embedded in-process DynamoDB backend.
+
+Implements the part of the DynamoDB table, resource and client APIs that
+DatabaseService uses, on top of in-memory indexed tables. The service's real
+code paths (key conditions, global secondary indexes, conditional writes,
+atomic update expressions, transactions, batch writes and pagination) run
+unchanged without AWS, DynamoDB Local or moto, which makes the backend
+suitable for development, load tests and benchmarks.
+
+Every table keeps its items in a dict keyed by primary key plus a sorted
+entry list per partition for the base table and each GSI, so a query is a
+bisect and a slice rather than a scan. Items are normalized on write the way
+boto3 round-trips them (numbers come back as Decimal, floats are rejected)
+and copied on read, and errors are raised as botocore ClientErrors carrying
+the DynamoDB error codes.
+"""
+
+import json
+import logging
+import math
+import re
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass, field
+from decimal import Decimal, DecimalException
+from functools import lru_cache
+from operator import itemgetter
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from boto3.dynamodb.types import DYNAMODB_CONTEXT, Binary, TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+# DynamoDB service limits
+MAX_ITEM_BYTES = 400 * 1024
+MAX_PAGE_BYTES = 1024 * 1024
+MAX_BATCH_WRITE_ITEMS = 25
+MAX_TRANSACT_ITEMS = 100
+IDEMPOTENCY_WINDOW_SECONDS = 600
+
+_MISSING = object()
+_UNCHANGED = object()
+_sort_value = itemgetter(0)
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+@dataclass
+class TableSchema:
+    """Key layout of a local table. All key attributes are strings (S)."""
+    hash_key: str
+    range_key: Optional[str] = None
+    indexes: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+
+
+def default_table_schemas(prefix: str = 'slack-trading-bot') -> Dict[str, TableSchema]:
+    """
+    Table layout used by DatabaseService.
+
+    Args:
+        prefix: Table name prefix
+
+    Returns:
+        Mapping of table name to schema
+    """
+    return {
+        f'{prefix}-trades': TableSchema('pk', 'sk', {
+            'gsi1': ('gsi1pk', 'gsi1sk'),
+            'gsi2': ('gsi2pk', 'gsi2sk')
+        }),
+        f'{prefix}-positions': TableSchema('pk', 'sk'),
+        f'{prefix}-users': TableSchema('pk', 'sk', {'gsi1': ('gsi1pk', 'gsi1sk')}),
+        f'{prefix}-channels': TableSchema('channel_id'),
+        f'{prefix}-portfolios': TableSchema('pk', 'sk', {'gsi1': ('gsi1pk', 'gsi1sk')}),
+        f'{prefix}-audit': TableSchema('audit_id')
+    }
+
+
+def _client_error(code: str, message: str, operation: str, **extra: Any) -> ClientError:
+    """Build a ClientError shaped like a DynamoDB error response."""
+    response = {
+        'Error': {'Code': code, 'Message': message},
+        'ResponseMetadata': {'HTTPStatusCode': 400}
+    }
+    response.update(extra)
+    return ClientError(response, operation)
+
+
+def _validation_error(message: str, operation: str) -> ClientError:
+    return _client_error('ValidationException', message, operation)
+
+
+def _normalize(value: Any) -> Any:
+    """Round-trip a value through the boto3 type system."""
+    return _deserializer.deserialize(_serializer.serialize(value))
+
+
+def _clone(value: Any) -> Any:
+    """Deep copy of a normalized attribute value."""
+    if isinstance(value, dict):
+        return {k: _clone(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_clone(v) for v in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def _attribute_size(value: Any) -> int:
+    """Approximate stored size of an attribute value in bytes."""
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, bool) or value is None:
+        return 1
+    if isinstance(value, Decimal):
+        return (len(value.as_tuple().digits) + 1) // 2 + 1
+    if isinstance(value, Binary):
+        return len(value.value)
+    if isinstance(value, dict):
+        return 3 + sum(len(k.encode('utf-8')) + _attribute_size(v) + 1 for k, v in value.items())
+    if isinstance(value, (list, set)):
+        return 3 + sum(_attribute_size(v) + 1 for v in value)
+    return len(str(value))
+
+
+def _item_size(item: Dict[str, Any]) -> int:
+    return sum(len(name.encode('utf-8')) + _attribute_size(value) for name, value in item.items())
+
+
+def _type_tag(value: Any) -> str:
+    """DynamoDB type descriptor of a normalized value."""
+    if isinstance(value, bool):
+        return 'BOOL'
+    if value is None:
+        return 'NULL'
+    if isinstance(value, str):
+        return 'S'
+    if isinstance(value, Decimal):
+        return 'N'
+    if isinstance(value, Binary):
+        return 'B'
+    if isinstance(value, list):
+        return 'L'
+    if isinstance(value, dict):
+        return 'M'
+    if isinstance(value, set):
+        return 'SET'
+    return type(value).__name__
+
+
+# Expression parsing
+
+class _ExpressionError(Exception):
+    """Syntax error in a DynamoDB expression."""
+    pass
+
+
+_TOKEN_RE = re.compile(r'\s*(?:(<>|<=|>=|[=<>(),+\-])|(#\w+)|(:\w+)|([A-Za-z_]\w*))')
+_KEYWORDS = {'AND', 'OR', 'NOT', 'BETWEEN', 'IN'}
+_COMPARATORS = {'=', '<>', '<', '<=', '>', '>='}
+_UPDATE_CLAUSES = ('SET', 'REMOVE', 'ADD', 'DELETE')
+_CONDITION_FUNCTIONS = {'attribute_exists': 1, 'attribute_not_exists': 1, 'begins_with': 2, 'contains': 2}
+_OPERAND_FUNCTIONS = {
+    'condition': {'size': 1},
+    'update': {'if_not_exists': 2, 'list_append': 2}
+}
+
+_Parsed = namedtuple('_Parsed', 'tree names values')
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str]]:
+    tokens = []
+    expression = expression.rstrip()
+    position = 0
+    while position < len(expression):
+        match = _TOKEN_RE.match(expression, position)
+        if not match:
+            raise _ExpressionError(f"unexpected character at position {position}")
+        op, name, value, word = match.groups()
+        if op:
+            tokens.append(('op', op))
+        elif name:
+            tokens.append(('name', name))
+        elif value:
+            tokens.append(('value', value))
+        else:
+            tokens.append(('word', word))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """
+    Recursive descent parser for condition, update and projection expressions.
+
+    Produces a tuple tree that references placeholders (#name, :value) by
+    token, so parsed expressions can be cached and bound per request.
+    """
+
+    def __init__(self, expression: str, mode: str):
+        self.tokens = _tokenize(expression)
+        self.position = 0
+        self.mode = mode
+        self.names = set()
+        self.values = set()
+
+    def peek(self, offset: int = 0) -> Tuple[Optional[str], Optional[str]]:
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def next(self) -> Tuple[str, str]:
+        token = self.peek()
+        if token[0] is None:
+            raise _ExpressionError("unexpected end of expression")
+        self.position += 1
+        return token
+
+    def at_end(self) -> bool:
+        return self.position >= len(self.tokens)
+
+    def accept_op(self, op: str) -> bool:
+        if self.peek() == ('op', op):
+            self.position += 1
+            return True
+        return False
+
+    def expect_op(self, op: str) -> None:
+        if not self.accept_op(op):
+            raise _ExpressionError(f"expected '{op}' but found '{self.peek()[1]}'")
+
+    def accept_word(self, word: str) -> bool:
+        kind, text = self.peek()
+        if kind == 'word' and text.upper() == word:
+            self.position += 1
+            return True
+        return False
+
+    # Conditions
+
+    def condition(self) -> tuple:
+        node = self.conjunction()
+        while self.accept_word('OR'):
+            node = ('or', node, self.conjunction())
+        return node
+
+    def conjunction(self) -> tuple:
+        node = self.negation()
+        while self.accept_word('AND'):
+            node = ('and', node, self.negation())
+        return node
+
+    def negation(self) -> tuple:
+        if self.accept_word('NOT'):
+            return ('not', self.negation())
+        return self.predicate()
+
+    def predicate(self) -> tuple:
+        if self.accept_op('('):
+            node = self.condition()
+            self.expect_op(')')
+            return node
+
+        kind, text = self.peek()
+        if kind == 'word' and text.lower() in _CONDITION_FUNCTIONS and self.peek(1) == ('op', '('):
+            function = text.lower()
+            self.position += 2
+            args = self.arguments(function, _CONDITION_FUNCTIONS[function])
+            if function.startswith('attribute_') and args[0][0] != 'path':
+                raise _ExpressionError(f"{function} requires an attribute path")
+            return (function, *args)
+
+        left = self.operand()
+        if self.accept_word('BETWEEN'):
+            low = self.operand()
+            if not self.accept_word('AND'):
+                raise _ExpressionError("BETWEEN requires AND")
+            return ('between', left, low, self.operand())
+        if self.accept_word('IN'):
+            self.expect_op('(')
+            return ('in', left, tuple(self.arguments('IN')))
+
+        kind, text = self.next()
+        if kind != 'op' or text not in _COMPARATORS:
+            raise _ExpressionError(f"unexpected token '{text}'")
+        return ('cmp', text, left, self.operand())
+
+    def arguments(self, function: str, arity: Optional[int] = None) -> List[tuple]:
+        """Parse a comma separated operand list after the opening parenthesis."""
+        args = [self.operand()]
+        while self.accept_op(','):
+            args.append(self.operand())
+        self.expect_op(')')
+        if arity is not None and len(args) != arity:
+            raise _ExpressionError(f"{function} takes {arity} argument(s)")
+        return args
+
+    def operand(self) -> tuple:
+        kind, text = self.next()
+        if kind == 'name':
+            self.names.add(text)
+            return ('path', text)
+        if kind == 'value':
+            self.values.add(text)
+            return ('value', text)
+        if kind == 'word' and text.upper() not in _KEYWORDS:
+            if self.accept_op('('):
+                functions = _OPERAND_FUNCTIONS.get(self.mode, {})
+                function = text.lower()
+                if function not in functions:
+                    raise _ExpressionError(f"invalid function name '{text}'")
+                args = self.arguments(function, functions[function])
+                if function == 'if_not_exists' and args[0][0] != 'path':
+                    raise _ExpressionError("if_not_exists requires an attribute path")
+                return (function, *args)
+            return ('path', text)
+        raise _ExpressionError(f"unexpected token '{text}'")
+
+    def path(self) -> tuple:
+        node = self.operand()
+        if node[0] != 'path':
+            raise _ExpressionError("expected an attribute path")
+        return node
+
+    # Updates and projections
+
+    def update(self) -> tuple:
+        actions = []
+        clauses = set()
+        while not self.at_end():
+            kind, text = self.next()
+            clause = text.upper() if kind == 'word' else None
+            if clause not in _UPDATE_CLAUSES or clause in clauses:
+                raise _ExpressionError(f"unexpected token '{text}'")
+            clauses.add(clause)
+            while True:
+                path = self.path()
+                if clause == 'SET':
+                    self.expect_op('=')
+                    actions.append((clause, path, self.set_value()))
+                elif clause == 'REMOVE':
+                    actions.append((clause, path, None))
+                else:
+                    actions.append((clause, path, self.operand()))
+                if not self.accept_op(','):
+                    break
+        if not actions:
+            raise _ExpressionError("empty update expression")
+        return tuple(actions)
+
+    def set_value(self) -> tuple:
+        node = self.operand()
+        for op in ('+', '-'):
+            if self.accept_op(op):
+                return (op, node, self.operand())
+        return node
+
+    def projection(self) -> tuple:
+        paths = [self.path()]
+        while self.accept_op(','):
+            paths.append(self.path())
+        return tuple(paths)
+
+
+@lru_cache(maxsize=512)
+def _parse(expression: str, mode: str) -> _Parsed:
+    """Parse and cache an expression; mode is 'condition', 'update' or 'projection'."""
+    parser = _Parser(expression, mode)
+    tree = getattr(parser, mode)()
+    if not parser.at_end():
+        raise _ExpressionError(f"unexpected token '{parser.peek()[1]}'")
+    return _Parsed(tree, frozenset(parser.names), frozenset(parser.values))
+
+
+class _Context:
+    """Placeholder bindings shared by the expressions of one request."""
+
+    def __init__(self, operation: str, names: Optional[Dict[str, str]] = None,
+                 values: Optional[Dict[str, Any]] = None, wire_values: bool = False):
+        self.operation = operation
+        if values is not None and not values:
+            raise _validation_error("ExpressionAttributeValues must not be empty", operation)
+        if names is not None and not names:
+            raise _validation_error("ExpressionAttributeNames must not be empty", operation)
+        self.names = names or {}
+        if wire_values:
+            self.values = {k: _deserializer.deserialize(v) for k, v in (values or {}).items()}
+        else:
+            self.values = {k: _normalize(v) for k, v in (values or {}).items()}
+        self.used_names = set()
+        self.used_values = set()
+        self._builder = ConditionExpressionBuilder()
+
+    def parse(self, expression: Any, mode: str, label: str) -> Any:
+        """Parse an expression and record the placeholders it uses."""
+        if isinstance(expression, ConditionBase):
+            expression = self._build_condition(expression, label)
+        if not isinstance(expression, str) or not expression.strip():
+            raise _validation_error(f"Invalid {label}: The expression can not be empty", self.operation)
+        try:
+            parsed = _parse(expression, mode)
+        except _ExpressionError as e:
+            raise _validation_error(f"Invalid {label}: {e}; expression: {expression}", self.operation)
+
+        for name in parsed.names:
+            if name not in self.names:
+                raise _validation_error(
+                    f"Invalid {label}: An expression attribute name used in the document path "
+                    f"is not defined; attribute name: {name}", self.operation)
+        for value in parsed.values:
+            if value not in self.values:
+                raise _validation_error(
+                    f"Invalid {label}: An expression attribute value used in expression "
+                    f"is not defined; attribute value: {value}", self.operation)
+        self.used_names |= parsed.names
+        self.used_values |= parsed.values
+        return parsed.tree
+
+    def _build_condition(self, condition: ConditionBase, label: str) -> str:
+        """Expand a boto3 condition object into placeholders like the resource layer does."""
+        built = self._builder.build_expression(condition, is_key_condition=label == 'KeyConditionExpression')
+        self.names = {**self.names, **built.attribute_name_placeholders}
+        self.values = {
+            **self.values,
+            **{k: _normalize(v) for k, v in built.attribute_value_placeholders.items()}
+        }
+        return built.condition_expression
+
+    def check_unused(self) -> None:
+        """Reject placeholders that no expression referenced."""
+        unused = sorted(set(self.values) - self.used_values)
+        if unused:
+            raise _validation_error(
+                f"Value provided in ExpressionAttributeValues unused in expressions: keys: {{{', '.join(unused)}}}",
+                self.operation)
+        unused = sorted(set(self.names) - self.used_names)
+        if unused:
+            raise _validation_error(
+                f"Value provided in ExpressionAttributeNames unused in expressions: keys: {{{', '.join(unused)}}}",
+                self.operation)
+
+    def name(self, node: tuple) -> str:
+        token = node[1]
+        return self.names[token] if token.startswith('#') else token
+
+
+def _compare(op: str, left: Any, right: Any) -> bool:
+    if left is _MISSING or right is _MISSING:
+        return False
+    left_type, right_type = _type_tag(left), _type_tag(right)
+    if left_type != right_type:
+        return op == '<>'
+    if op == '=':
+        return left == right
+    if op == '<>':
+        return left != right
+    if left_type not in ('S', 'N', 'B'):
+        return False
+    if left_type == 'B':
+        left, right = left.value, right.value
+    if op == '<':
+        return left < right
+    if op == '<=':
+        return left <= right
+    if op == '>':
+        return left > right
+    return left >= right
+
+
+def _operand(node: tuple, item: Dict[str, Any], ctx: _Context) -> Any:
+    kind = node[0]
+    if kind == 'path':
+        return item.get(ctx.name(node), _MISSING)
+    if kind == 'value':
+        return ctx.values[node[1]]
+    if kind == 'size':
+        value = _operand(node[1], item, ctx)
+        if isinstance(value, (str, list, dict, set)):
+            return Decimal(len(value))
+        if isinstance(value, Binary):
+            return Decimal(len(value.value))
+        return _MISSING
+    if kind == 'if_not_exists':
+        value = _operand(node[1], item, ctx)
+        return _operand(node[2], item, ctx) if value is _MISSING else value
+
+    left, right = _operand(node[1], item, ctx), _operand(node[2], item, ctx)
+    if left is _MISSING or right is _MISSING:
+        raise _validation_error(
+            "The provided expression refers to an attribute that does not exist in the item", ctx.operation)
+    if kind == 'list_append':
+        if not (isinstance(left, list) and isinstance(right, list)):
+            raise _validation_error(
+                "An operand in the update expression has an incorrect data type", ctx.operation)
+        return left + right
+    if _type_tag(left) != 'N' or _type_tag(right) != 'N':
+        raise _validation_error(
+            "An operand in the update expression has an incorrect data type", ctx.operation)
+    try:
+        return DYNAMODB_CONTEXT.add(left, right) if kind == '+' else DYNAMODB_CONTEXT.subtract(left, right)
+    except DecimalException:
+        raise _validation_error("Number overflow. Attempting to store a number with magnitude larger than supported range", ctx.operation)
+
+
+def _holds(node: tuple, item: Dict[str, Any], ctx: _Context) -> bool:
+    kind = node[0]
+    if kind == 'and':
+        return _holds(node[1], item, ctx) and _holds(node[2], item, ctx)
+    if kind == 'or':
+        return _holds(node[1], item, ctx) or _holds(node[2], item, ctx)
+    if kind == 'not':
+        return not _holds(node[1], item, ctx)
+    if kind == 'cmp':
+        return _compare(node[1], _operand(node[2], item, ctx), _operand(node[3], item, ctx))
+    if kind == 'between':
+        value = _operand(node[1], item, ctx)
+        return (_compare('>=', value, _operand(node[2], item, ctx))
+                and _compare('<=', value, _operand(node[3], item, ctx)))
+    if kind == 'in':
+        value = _operand(node[1], item, ctx)
+        return any(_compare('=', value, _operand(option, item, ctx)) for option in node[2])
+    if kind == 'attribute_exists':
+        return ctx.name(node[1]) in item
+    if kind == 'attribute_not_exists':
+        return ctx.name(node[1]) not in item
+
+    value, argument = _operand(node[1], item, ctx), _operand(node[2], item, ctx)
+    if kind == 'begins_with':
+        return isinstance(value, str) and isinstance(argument, str) and value.startswith(argument)
+    if isinstance(value, str):
+        return isinstance(argument, str) and argument in value
+    if isinstance(value, (list, set)):
+        return argument in value
+    return False
+
+
+def _conjuncts(node: tuple) -> Iterable[tuple]:
+    if node[0] == 'and':
+        yield from _conjuncts(node[1])
+        yield from _conjuncts(node[2])
+    else:
+        yield node
+
+
+def _consumed_units(size_bytes: int, unit_bytes: int) -> int:
+    return max(1, math.ceil(size_bytes / unit_bytes))
+
+
+class _SortedIndex:
+    """
+    Sorted entries per partition for the base table or a GSI.
+
+    Entries are ``(sort_value, primary_key)`` tuples so items sharing a sort
+    value keep a stable order. Items missing an index key attribute are not
+    indexed, giving sparse GSI behaviour.
+    """
+
+    def __init__(self, hash_key: str, range_key: Optional[str]):
+        self.hash_key = hash_key
+        self.range_key = range_key
+        self.partitions: Dict[str, List[Tuple[str, Tuple[str, str]]]] = {}
+
+    def entry(self, item: Dict[str, Any], key: Tuple[str, str]) -> Optional[Tuple[str, Tuple]]:
+        hash_value = item.get(self.hash_key)
+        if hash_value is None:
+            return None
+        sort_value = item.get(self.range_key) if self.range_key else ''
+        if sort_value is None:
+            return None
+        return hash_value, (sort_value, key)
+
+    def add(self, entry: Optional[Tuple[str, Tuple]]) -> None:
+        if entry is not None:
+            insort(self.partitions.setdefault(entry[0], []), entry[1])
+
+    def remove(self, entry: Optional[Tuple[str, Tuple]]) -> None:
+        if entry is None:
+            return
+        partition = self.partitions.get(entry[0], [])
+        position = bisect_left(partition, entry[1])
+        if position < len(partition) and partition[position] == entry[1]:
+            del partition[position]
+            if not partition:
+                del self.partitions[entry[0]]
+
+    def count(self) -> int:
+        return sum(len(partition) for partition in self.partitions.values())
+
+
+class LocalTable:
+    """
+    In-memory table exposing the boto3 ``Table`` resource methods.
+
+    Supports put_item, get_item, update_item, delete_item, query and scan
+    with condition, filter, update and projection expressions.
+    """
+
+    def __init__(self, name: str, schema: TableSchema, lock: threading.RLock):
+        self.name = name
+        self.table_name = name
+        self.schema = schema
+        self._lock = lock
+        self._items: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._sizes: Dict[Tuple[str, str], int] = {}
+        self._indexes: Dict[Optional[str], _SortedIndex] = {None: _SortedIndex(schema.hash_key, schema.range_key)}
+        for index_name, (hash_key, range_key) in schema.indexes.items():
+            self._indexes[index_name] = _SortedIndex(hash_key, range_key)
+
+    @property
+    def key_attributes(self) -> Tuple[str, ...]:
+        schema = self.schema
+        return (schema.hash_key, schema.range_key) if schema.range_key else (schema.hash_key,)
+
+    @property
+    def item_count(self) -> int:
+        return len(self._items)
+
+    @property
+    def table_size_bytes(self) -> int:
+        return sum(self._sizes.values())
+
+    # Table API
+
+    def put_item(self, Item: Dict[str, Any], ConditionExpression: Any = None,
+                 ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+                 ExpressionAttributeValues: Optional[Dict[str, Any]] = None,
+                 ReturnValues: str = 'NONE', ReturnConsumedCapacity: str = 'NONE') -> Dict[str, Any]:
+        operation = 'PutItem'
+        with self._lock:
+            ctx = _Context(operation, ExpressionAttributeNames, ExpressionAttributeValues)
+            condition = ctx.parse(ConditionExpression, 'condition', 'ConditionExpression') \
+                if ConditionExpression is not None else None
+            ctx.check_unused()
+
+            key, item = self._prepare_item(Item, operation)
+            old = self._items.get(key)
+            self._check_condition(condition, old, ctx)
+            units = self._write(key, item, self._validate_item(item, operation))
+
+        response = self._response(ReturnConsumedCapacity, units)
+        if ReturnValues == 'ALL_OLD' and old is not None:
+            response['Attributes'] = _clone(old)
+        return response
+
+    def get_item(self, Key: Dict[str, Any], ProjectionExpression: Optional[str] = None,
+                 ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+                 ConsistentRead: bool = False, ReturnConsumedCapacity: str = 'NONE') -> Dict[str, Any]:
+        operation = 'GetItem'
+        with self._lock:
+            ctx = _Context(operation, ExpressionAttributeNames)
+            projection = ctx.parse(ProjectionExpression, 'projection', 'ProjectionExpression') \
+                if ProjectionExpression is not None else None
+            ctx.check_unused()
+
+            key = self._key(Key, operation)
+            item = self._items.get(key)
+            size = self._sizes.get(key, 0)
+            result = self._project(item, projection, ctx) if item is not None else None
+
+        response = self._response(ReturnConsumedCapacity, self._read_units(size, ConsistentRead))
+        if result is not None:
+            response['Item'] = result
+        return response
+
+    def update_item(self, Key: Dict[str, Any], UpdateExpression: Optional[str] = None,
+                    ConditionExpression: Any = None,
+                    ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+                    ExpressionAttributeValues: Optional[Dict[str, Any]] = None,
+                    ReturnValues: str = 'NONE', ReturnConsumedCapacity: str = 'NONE') -> Dict[str, Any]:
+        operation = 'UpdateItem'
+        with self._lock:
+            ctx = _Context(operation, ExpressionAttributeNames, ExpressionAttributeValues)
+            actions = ctx.parse(UpdateExpression, 'update', 'UpdateExpression') \
+                if UpdateExpression is not None else ()
+            condition = ctx.parse(ConditionExpression, 'condition', 'ConditionExpression') \
+                if ConditionExpression is not None else None
+            ctx.check_unused()
+
+            key = self._key(Key, operation)
+            old = self._items.get(key)
+            self._check_condition(condition, old, ctx)
+            item, updated = self._apply_update(key, old, actions, ctx)
+            units = self._write(key, item, self._validate_item(item, operation))
+
+        response = self._response(ReturnConsumedCapacity, units)
+        if ReturnValues in ('ALL_NEW', 'UPDATED_NEW'):
+            names = item if ReturnValues == 'ALL_NEW' else updated
+            response['Attributes'] = {name: _clone(item[name]) for name in names if name in item}
+        elif ReturnValues in ('ALL_OLD', 'UPDATED_OLD') and old is not None:
+            names = old if ReturnValues == 'ALL_OLD' else updated
+            response['Attributes'] = {name: _clone(old[name]) for name in names if name in old}
+        return response
+
+    def delete_item(self, Key: Dict[str, Any], ConditionExpression: Any = None,
+                    ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+                    ExpressionAttributeValues: Optional[Dict[str, Any]] = None,
+                    ReturnValues: str = 'NONE', ReturnConsumedCapacity: str = 'NONE') -> Dict[str, Any]:
+        operation = 'DeleteItem'
+        with self._lock:
+            ctx = _Context(operation, ExpressionAttributeNames, ExpressionAttributeValues)
+            condition = ctx.parse(ConditionExpression, 'condition', 'ConditionExpression') \
+                if ConditionExpression is not None else None
+            ctx.check_unused()
+
+            key = self._key(Key, operation)
+            old = self._items.get(key)
+            self._check_condition(condition, old, ctx)
+            units = self._write(key, None)
+
+        response = self._response(ReturnConsumedCapacity, units)
+        if ReturnValues == 'ALL_OLD' and old is not None:
+            response['Attributes'] = _clone(old)
+        return response
+
+    def query(self, KeyConditionExpression: Any, IndexName: Optional[str] = None,
+              FilterExpression: Any = None, ProjectionExpression: Optional[str] = None,
+              ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+              ExpressionAttributeValues: Optional[Dict[str, Any]] = None,
+              Limit: Optional[int] = None, ExclusiveStartKey: Optional[Dict[str, Any]] = None,
+              ScanIndexForward: bool = True, Select: str = 'ALL_ATTRIBUTES',
+              ConsistentRead: bool = False, ReturnConsumedCapacity: str = 'NONE') -> Dict[str, Any]:
+        operation = 'Query'
+        with self._lock:
+            index = self._index(IndexName, operation)
+            if ConsistentRead and IndexName is not None:
+                raise _validation_error("Consistent reads are not supported on global secondary indexes", operation)
+
+            ctx = _Context(operation, ExpressionAttributeNames, ExpressionAttributeValues)
+            key_condition = ctx.parse(KeyConditionExpression, 'condition', 'KeyConditionExpression')
+            filter_condition = ctx.parse(FilterExpression, 'condition', 'FilterExpression') \
+                if FilterExpression is not None else None
+            projection = ctx.parse(ProjectionExpression, 'projection', 'ProjectionExpression') \
+                if ProjectionExpression is not None else None
+            ctx.check_unused()
+
+            hash_value, range_condition = self._plan_key_condition(key_condition, index, ctx)
+            partition = index.partitions.get(hash_value, [])
+            low, high = self._bounds(partition, range_condition, ctx)
+
+            if ExclusiveStartKey is not None:
+                start = self._start_entry(ExclusiveStartKey, index, operation)
+                if ScanIndexForward:
+                    low = max(low, bisect_right(partition, start))
+                else:
+                    high = min(high, bisect_left(partition, start))
+
+            positions = range(low, high) if ScanIndexForward else range(high - 1, low - 1, -1)
+            entries = (partition[position][1] for position in positions)
+            return self._collect(entries, index, filter_condition, projection, ctx,
+                                 Limit, Select, ConsistentRead, ReturnConsumedCapacity)
+
+    def scan(self, IndexName: Optional[str] = None, FilterExpression: Any = None,
+             ProjectionExpression: Optional[str] = None,
+             ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+             ExpressionAttributeValues: Optional[Dict[str, Any]] = None,
+             Limit: Optional[int] = None, ExclusiveStartKey: Optional[Dict[str, Any]] = None,
+             Select: str = 'ALL_ATTRIBUTES', ConsistentRead: bool = False,
+             ReturnConsumedCapacity: str = 'NONE') -> Dict[str, Any]:
+        operation = 'Scan'
+        with self._lock:
+            index = self._index(IndexName, operation)
+            ctx = _Context(operation, ExpressionAttributeNames, ExpressionAttributeValues)
+            filter_condition = ctx.parse(FilterExpression, 'condition', 'FilterExpression') \
+                if FilterExpression is not None else None
+            projection = ctx.parse(ProjectionExpression, 'projection', 'ProjectionExpression') \
+                if ProjectionExpression is not None else None
+            ctx.check_unused()
+
+            # Partitions in hash key order, entries in sort order
+            entries = [
+                (hash_value, entry)
+                for hash_value in sorted(index.partitions)
+                for entry in index.partitions[hash_value]
+            ]
+            position = 0
+            if ExclusiveStartKey is not None:
+                start = self._start_entry(ExclusiveStartKey, index, operation)
+                position = bisect_right(entries, (ExclusiveStartKey.get(index.hash_key), start))
+
+            keys = (entry[1][1] for entry in entries[position:])
+            return self._collect(keys, index, filter_condition, projection, ctx,
+                                 Limit, Select, ConsistentRead, ReturnConsumedCapacity)
+
+    # Internals (callers hold the store lock)
+
+    def _truncate(self) -> None:
+        self._items.clear()
+        self._sizes.clear()
+        for index in self._indexes.values():
+            index.partitions.clear()
+
+    def _index(self, index_name: Optional[str], operation: str) -> _SortedIndex:
+        index = self._indexes.get(index_name)
+        if index is None:
+            raise _validation_error(f"The table does not have the specified index: {index_name}", operation)
+        return index
+
+    def _key(self, key: Dict[str, Any], operation: str) -> Tuple[str, str]:
+        """Validate a Key parameter and return the primary key tuple."""
+        if set(key) != set(self.key_attributes):
+            raise _validation_error("The provided key element does not match the schema", operation)
+        values = tuple(key[name] for name in self.key_attributes)
+        if not all(isinstance(value, str) and value for value in values):
+            raise _validation_error("The provided key element does not match the schema", operation)
+        return values if len(values) == 2 else (values[0], '')
+
+    def _prepare_item(self, item: Dict[str, Any], operation: str) -> Tuple[Tuple[str, str], Dict[str, Any]]:
+        """Normalize and validate an item for writing."""
+        for name in self.key_attributes:
+            value = item.get(name)
+            if not isinstance(value, str) or not value:
+                raise _validation_error(
+                    f"One or more parameter values were invalid: Missing the key {name} in the item"
+                    if value is None else
+                    f"One or more parameter values were invalid: Type mismatch for key {name} expected: S",
+                    operation)
+        normalized = {name: _normalize(value) for name, value in item.items()}
+        key = tuple(normalized[name] for name in self.key_attributes)
+        return (key if len(key) == 2 else (key[0], '')), normalized
+
+    def _validate_item(self, item: Dict[str, Any], operation: str) -> int:
+        """Check index key types and the item size limit; returns the item size."""
+        for index_name, (hash_key, range_key) in self.schema.indexes.items():
+            for name in (hash_key, range_key):
+                value = item.get(name)
+                if value is not None and (not isinstance(value, str) or not value):
+                    raise _validation_error(
+                        f"One or more parameter values were invalid: Type mismatch for Index Key "
+                        f"{name} Expected: S Actual: {_type_tag(value)} IndexName: {index_name}", operation)
+        size = _item_size(item)
+        if size > MAX_ITEM_BYTES:
+            raise _validation_error("Item size has exceeded the maximum allowed size", operation)
+        return size
+
+    def _check_condition(self, condition: Optional[tuple], item: Optional[Dict[str, Any]], ctx: _Context) -> None:
+        if condition is not None and not _holds(condition, item or {}, ctx):
+            raise _client_error('ConditionalCheckFailedException', 'The conditional request failed', ctx.operation)
+
+    def _apply_update(self, key: Tuple[str, str], old: Optional[Dict[str, Any]], actions: tuple,
+                      ctx: _Context) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Evaluate update actions against the current item.
+
+        All operands read the item as it was before the update, matching
+        DynamoDB semantics. Returns the new item and the updated attribute names.
+        """
+        base = old if old is not None else dict(zip(self.key_attributes, key))
+        item = dict(base)
+        updated = []
+        for clause, path, value_node in actions:
+            name = ctx.name(path)
+            if name in self.key_attributes:
+                raise _validation_error(
+                    f"One or more parameter values were invalid: Cannot update attribute {name}. "
+                    f"This attribute is part of the key", ctx.operation)
+            if name in updated:
+                raise _validation_error(
+                    f"Invalid UpdateExpression: Two document paths overlap with each other; "
+                    f"path one: [{name}], path two: [{name}]", ctx.operation)
+            updated.append(name)
+
+            if clause == 'SET':
+                value = _operand(value_node, base, ctx)
+                if value is _MISSING:
+                    raise _validation_error(
+                        "The provided expression refers to an attribute that does not exist in the item",
+                        ctx.operation)
+                item[name] = value
+                continue
+            if clause == 'REMOVE':
+                item.pop(name, None)
+                continue
+
+            operand = _operand(value_node, base, ctx)
+            current = base.get(name, _MISSING)
+            if clause == 'ADD' and _type_tag(operand) == 'N':
+                if current is _MISSING:
+                    item[name] = operand
+                elif _type_tag(current) == 'N':
+                    try:
+                        item[name] = DYNAMODB_CONTEXT.add(current, operand)
+                    except DecimalException:
+                        raise _validation_error("Number overflow", ctx.operation)
+                else:
+                    raise _validation_error(
+                        "An operand in the update expression has an incorrect data type", ctx.operation)
+            elif isinstance(operand, set):
+                if current is _MISSING:
+                    if clause == 'ADD':
+                        item[name] = set(operand)
+                elif isinstance(current, set):
+                    remaining = current | operand if clause == 'ADD' else current - operand
+                    if remaining:
+                        item[name] = remaining
+                    else:
+                        item.pop(name, None)
+                else:
+                    raise _validation_error(
+                        "An operand in the update expression has an incorrect data type", ctx.operation)
+            else:
+                raise _validation_error(
+                    f"Invalid UpdateExpression: Incorrect operand type for operator or function; "
+                    f"operator: {clause}, operand type: {_type_tag(operand)}", ctx.operation)
+        return item, updated
+
+    def _write(self, key: Tuple[str, str], item: Optional[Dict[str, Any]], size: int = 0) -> int:
+        """
+        Store or delete an item and maintain every index.
+
+        Args:
+            key: Primary key tuple
+            item: Validated item to store, or None to delete
+            size: Item size returned by _validate_item
+
+        Returns:
+            Write capacity units consumed, including GSI writes
+        """
+        old = self._items.get(key)
+        old_size = self._sizes.get(key, 0)
+
+        index_writes = 0
+        for index_name, index in self._indexes.items():
+            old_entry = index.entry(old, key) if old is not None else None
+            new_entry = index.entry(item, key) if item is not None else None
+            if index_name is not None and (old_entry or new_entry):
+                index_writes += 1
+            if old_entry != new_entry:
+                index.remove(old_entry)
+                index.add(new_entry)
+
+        if item is None:
+            self._items.pop(key, None)
+            self._sizes.pop(key, None)
+        else:
+            self._items[key] = item
+            self._sizes[key] = size
+        return _consumed_units(max(size, old_size), 1024) * (1 + index_writes)
+
+    def _plan_key_condition(self, condition: tuple, index: _SortedIndex, ctx: _Context) -> Tuple[str, Optional[tuple]]:
+        """Split a key condition into the partition value and an optional sort key condition."""
+        hash_value = _MISSING
+        range_condition = None
+        for term in _conjuncts(condition):
+            attribute_node = term[2] if term[0] == 'cmp' else term[1]
+            value_nodes = term[3:] if term[0] == 'cmp' else term[2:]
+            if (term[0] not in ('cmp', 'between', 'begins_with') or attribute_node[0] != 'path'
+                    or any(node[0] != 'value' for node in value_nodes)):
+                raise _validation_error("Query key condition not supported", ctx.operation)
+
+            attribute = ctx.name(attribute_node)
+            values = [ctx.values[node[1]] for node in value_nodes]
+            if not all(isinstance(value, str) for value in values):
+                raise _validation_error(
+                    "One or more parameter values were invalid: Condition parameter type does not match schema type",
+                    ctx.operation)
+
+            if attribute == index.hash_key and term[0] == 'cmp' and term[1] == '=' and hash_value is _MISSING:
+                hash_value = values[0]
+            elif attribute == index.range_key and range_condition is None and term[:2] != ('cmp', '<>'):
+                range_condition = term
+            else:
+                raise _validation_error("Query key condition not supported", ctx.operation)
+
+        if hash_value is _MISSING:
+            raise _validation_error(f"Query condition missed key schema element: {index.hash_key}", ctx.operation)
+        return hash_value, range_condition
+
+    @staticmethod
+    def _bounds(partition: List[tuple], condition: Optional[tuple], ctx: _Context) -> Tuple[int, int]:
+        """Slice of a sorted partition matching the sort key condition."""
+        if condition is None:
+            return 0, len(partition)
+
+        kind = condition[0]
+        if kind == 'between':
+            low, high = ctx.values[condition[2][1]], ctx.values[condition[3][1]]
+            if low > high:
+                raise _validation_error(
+                    "Invalid KeyConditionExpression: The BETWEEN operator requires upper bound to be "
+                    "greater than or equal to lower bound", ctx.operation)
+            return bisect_left(partition, low, key=_sort_value), bisect_right(partition, high, key=_sort_value)
+
+        if kind == 'begins_with':
+            prefix = ctx.values[condition[2][1]]
+            start = end = bisect_left(partition, prefix, key=_sort_value)
+            while end < len(partition) and partition[end][0].startswith(prefix):
+                end += 1
+            return start, end
+
+        op, value = condition[1], ctx.values[condition[3][1]]
+        if op == '=':
+            return bisect_left(partition, value, key=_sort_value), bisect_right(partition, value, key=_sort_value)
+        if op == '<':
+            return 0, bisect_left(partition, value, key=_sort_value)
+        if op == '<=':
+            return 0, bisect_right(partition, value, key=_sort_value)
+        if op == '>':
+            return bisect_right(partition, value, key=_sort_value), len(partition)
+        return bisect_left(partition, value, key=_sort_value), len(partition)
+
+    def _start_entry(self, start_key: Dict[str, Any], index: _SortedIndex, operation: str) -> Tuple[str, Tuple]:
+        """Index entry for an ExclusiveStartKey."""
+        try:
+            key = self._key({name: start_key[name] for name in self.key_attributes}, operation)
+            entry = index.entry(start_key, key)
+        except KeyError:
+            entry = None
+        if entry is None:
+            raise _validation_error("The provided starting key is invalid", operation)
+        return entry[1]
+
+    def _collect(self, keys: Iterable[Tuple[str, str]], index: _SortedIndex, filter_condition: Optional[tuple],
+                 projection: Optional[tuple], ctx: _Context, limit: Optional[int], select: str,
+                 consistent_read: bool, return_consumed_capacity: str) -> Dict[str, Any]:
+        """Read one page of items, honouring Limit and the 1 MB page size."""
+        if limit is not None and limit < 1:
+            raise _validation_error("Limit must be greater than or equal to 1", ctx.operation)
+
+        items = []
+        scanned = 0
+        read_bytes = 0
+        last_key = None
+        stopped = False
+        for key in keys:
+            if (limit is not None and scanned >= limit) or read_bytes >= MAX_PAGE_BYTES:
+                stopped = True
+                break
+            item = self._items[key]
+            scanned += 1
+            read_bytes += self._sizes[key]
+            last_key = key
+            if filter_condition is not None and not _holds(filter_condition, item, ctx):
+                continue
+            items.append(item)
+
+        response = self._response(return_consumed_capacity, self._read_units(read_bytes, consistent_read))
+        response['Count'] = len(items)
+        response['ScannedCount'] = scanned
+        if select != 'COUNT':
+            response['Items'] = [self._project(item, projection, ctx) for item in items]
+        if stopped and last_key is not None:
+            last_item = self._items[last_key]
+            names = set(self.key_attributes) | {index.hash_key}
+            if index.range_key:
+                names.add(index.range_key)
+            response['LastEvaluatedKey'] = {name: last_item[name] for name in names}
+        return response
+
+    @staticmethod
+    def _project(item: Dict[str, Any], projection: Optional[tuple], ctx: _Context) -> Dict[str, Any]:
+        if projection is None:
+            return _clone(item)
+        names = (ctx.name(path) for path in projection)
+        return {name: _clone(item[name]) for name in names if name in item}
+
+    @staticmethod
+    def _read_units(size_bytes: int, consistent_read: bool) -> float:
+        units = _consumed_units(size_bytes, 4096)
+        return float(units if consistent_read else units / 2)
+
+    def _response(self, return_consumed_capacity: Optional[str], units: float) -> Dict[str, Any]:
+        response: Dict[str, Any] = {'ResponseMetadata': {'HTTPStatusCode': 200}}
+        if return_consumed_capacity in ('TOTAL', 'INDEXES'):
+            response['ConsumedCapacity'] = {'TableName': self.name, 'CapacityUnits': float(units)}
+        return response
+
+    def describe(self) -> Dict[str, Any]:
+        """DescribeTable payload for this table."""
+        def key_schema(hash_key: str, range_key: Optional[str]) -> List[Dict[str, str]]:
+            schema = [{'AttributeName': hash_key, 'KeyType': 'HASH'}]
+            if range_key:
+                schema.append({'AttributeName': range_key, 'KeyType': 'RANGE'})
+            return schema
+
+        description = {
+            'TableName': self.name,
+            'TableStatus': 'ACTIVE',
+            'KeySchema': key_schema(self.schema.hash_key, self.schema.range_key),
+            'ItemCount': self.item_count,
+            'TableSizeBytes': self.table_size_bytes,
+            'BillingModeSummary': {'BillingMode': 'PAY_PER_REQUEST'}
+        }
+        if self.schema.indexes:
+            description['GlobalSecondaryIndexes'] = [
+                {
+                    'IndexName': index_name,
+                    'KeySchema': key_schema(hash_key, range_key),
+                    'Projection': {'ProjectionType': 'ALL'},
+                    'IndexStatus': 'ACTIVE',
+                    'ItemCount': self._indexes[index_name].count()
+                }
+                for index_name, (hash_key, range_key) in self.schema.indexes.items()
+            ]
+        return description
+
+
+class _MissingTable:
+    """Table handle for a table that does not exist; every call fails like DynamoDB."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __getattr__(self, operation: str):
+        def _fail(*args, **kwargs):
+            raise _client_error(
+                'ResourceNotFoundException', 'Requested resource not found', operation
+            )
+        return _fail
+
+
+class LocalDynamoDBClient:
+    """Low-level client subset: DescribeTable, ListTables and TransactWriteItems."""
+
+    def __init__(self, store: 'LocalDynamoDB'):
+        self._store = store
+
+    def describe_table(self, TableName: str) -> Dict[str, Any]:
+        with self._store._lock:
+            table = self._store._require_table(TableName, 'DescribeTable')
+            return {'Table': table.describe()}
+
+    def list_tables(self, **kwargs: Any) -> Dict[str, Any]:
+        with self._store._lock:
+            return {'TableNames': sorted(self._store._tables)}
+
+    def transact_write_items(self, TransactItems: List[Dict[str, Any]],
+                             ClientRequestToken: Optional[str] = None,
+                             ReturnConsumedCapacity: str = 'NONE',
+                             ReturnItemCollectionMetrics: str = 'NONE') -> Dict[str, Any]:
+        """
+        Apply Put, Update, Delete and ConditionCheck actions atomically.
+
+        Takes AttributeValue-typed parameters like the real client. All
+        conditions are evaluated before anything is written; if any fails the
+        call raises TransactionCanceledException with CancellationReasons.
+        A repeated ClientRequestToken with identical items is a no-op.
+        """
+        operation = 'TransactWriteItems'
+        if not 1 <= len(TransactItems) <= MAX_TRANSACT_ITEMS:
+            raise _validation_error(
+                f"Member must have length less than or equal to {MAX_TRANSACT_ITEMS}", operation)
+
+        store = self._store
+        with store._lock:
+            fingerprint = json.dumps(TransactItems, sort_keys=True, default=str)
+            if ClientRequestToken is not None and store._replayed_transaction(ClientRequestToken, fingerprint):
+                return {'ResponseMetadata': {'HTTPStatusCode': 200}}
+
+            plans = []
+            reasons = []
+            targets = set()
+            for entry in TransactItems:
+                if len(entry) != 1:
+                    raise _validation_error("TransactItems entries must contain exactly one action", operation)
+                (action, request), = entry.items()
+                table = store._require_table(request['TableName'], operation)
+                ctx = _Context(operation, request.get('ExpressionAttributeNames'),
+                               request.get('ExpressionAttributeValues'), wire_values=True)
+
+                condition_expression = request.get('ConditionExpression')
+                condition = ctx.parse(condition_expression, 'condition', 'ConditionExpression') \
+                    if condition_expression is not None else None
+
+                if action == 'Put':
+                    item = {k: _deserializer.deserialize(v) for k, v in request['Item'].items()}
+                    key, new_item = table._prepare_item(item, operation)
+                elif action in ('Update', 'Delete', 'ConditionCheck'):
+                    key = table._key({k: _deserializer.deserialize(v) for k, v in request['Key'].items()}, operation)
+                    new_item = None if action == 'Delete' else _UNCHANGED
+                    if action == 'Update':
+                        actions = ctx.parse(request['UpdateExpression'], 'update', 'UpdateExpression')
+                        new_item, _ = table._apply_update(key, table._items.get(key), actions, ctx)
+                    elif action == 'ConditionCheck' and condition is None:
+                        raise _validation_error("ConditionCheck requires a ConditionExpression", operation)
+                else:
+                    raise _validation_error(f"Unsupported transaction action: {action}", operation)
+                ctx.check_unused()
+
+                if (table.name, key) in targets:
+                    raise _validation_error(
+                        "Transaction request cannot include multiple operations on one item", operation)
+                targets.add((table.name, key))
+
+                size = 0
+                if new_item is not None and new_item is not _UNCHANGED:
+                    size = table._validate_item(new_item, operation)
+                if condition is not None and not _holds(condition, table._items.get(key) or {}, ctx):
+                    reasons.append({'Code': 'ConditionalCheckFailed', 'Message': 'The conditional request failed'})
+                else:
+                    reasons.append({'Code': 'None'})
+                plans.append((table, key, new_item, size))
+
+            if any(reason['Code'] != 'None' for reason in reasons):
+                codes = ', '.join(reason['Code'] for reason in reasons)
+                raise _client_error(
+                    'TransactionCanceledException',
+                    f"Transaction cancelled, please refer cancellation reasons for specific reasons [{codes}]",
+                    operation,
+                    CancellationReasons=reasons
+                )
+
+            for table, key, new_item, size in plans:
+                if new_item is not _UNCHANGED:
+                    table._write(key, new_item, size)
+
+            if ClientRequestToken is not None:
+                store._transaction_tokens[ClientRequestToken] = (fingerprint, time.monotonic())
+
+        return {'ResponseMetadata': {'HTTPStatusCode': 200}}
+
+
+class LocalDynamoDBResource:
+    """Service resource subset: ``Table()`` and ``batch_write_item``."""
+
+    def __init__(self, store: 'LocalDynamoDB'):
+        self._store = store
+        self.meta = SimpleNamespace(client=store.client)
+
+    def Table(self, name: str):
+        return self._store._tables.get(name) or _MissingTable(name)
+
+    def batch_write_item(self, RequestItems: Dict[str, List[Dict[str, Any]]],
+                         ReturnConsumedCapacity: str = 'NONE',
+                         ReturnItemCollectionMetrics: str = 'NONE') -> Dict[str, Any]:
+        """
+        Apply up to 25 put and delete requests across tables.
+
+        Every request is processed, so UnprocessedItems is always empty.
+        """
+        operation = 'BatchWriteItem'
+        total = sum(len(requests) for requests in RequestItems.values())
+        if not 1 <= total <= MAX_BATCH_WRITE_ITEMS:
+            raise _validation_error(
+                "Too many items requested for the BatchWriteItem call" if total else
+                "The batch write request list for a table cannot be null or empty", operation)
+
+        store = self._store
+        consumed = []
+        with store._lock:
+            plans = []
+            for table_name, requests in RequestItems.items():
+                table = store._require_table(table_name, operation)
+                keys = set()
+                for request in requests:
+                    size = 0
+                    if 'PutRequest' in request:
+                        key, item = table._prepare_item(request['PutRequest']['Item'], operation)
+                        size = table._validate_item(item, operation)
+                    else:
+                        key, item = table._key(request['DeleteRequest']['Key'], operation), None
+                    if key in keys:
+                        raise _validation_error("Provided list of item keys contains duplicates", operation)
+                    keys.add(key)
+                    plans.append((table, key, item, size))
+
+            units: Dict[str, float] = {}
+            for table, key, item, size in plans:
+                units[table.name] = units.get(table.name, 0.0) + table._write(key, item, size)
+            consumed = [{'TableName': name, 'CapacityUnits': value} for name, value in units.items()]
+
+        response: Dict[str, Any] = {'UnprocessedItems': {}, 'ResponseMetadata': {'HTTPStatusCode': 200}}
+        if ReturnConsumedCapacity in ('TOTAL', 'INDEXES'):
+            response['ConsumedCapacity'] = consumed
+        return response
+
+
+class LocalDynamoDB:
+    """
+    Embedded DynamoDB store with boto3-compatible ``client`` and ``resource``.
+
+    Thread-safe: all operations on a store are serialized by one re-entrant
+    lock, so it can be shared between the event loop and executor threads.
+    """
+
+    def __init__(self, schemas: Optional[Dict[str, TableSchema]] = None):
+        """
+        Create the store and its tables.
+
+        Args:
+            schemas: Table layouts keyed by table name (defaults to the service tables)
+        """
+        self._lock = threading.RLock()
+        self._tables: Dict[str, LocalTable] = {}
+        self._transaction_tokens: 'OrderedDict[str, Tuple[str, float]]' = OrderedDict()
+        for name, schema in (schemas if schemas is not None else default_table_schemas()).items():
+            self.create_table(name, schema)
+
+        self.client = LocalDynamoDBClient(self)
+        self.resource = LocalDynamoDBResource(self)
+
+    def create_table(self, name: str, schema: TableSchema) -> LocalTable:
+        """
+        Create an empty table.
+
+        Args:
+            name: Table name
+            schema: Key layout
+
+        Returns:
+            The new table
+        """
+        with self._lock:
+            if name in self._tables:
+                raise _client_error('ResourceInUseException', f"Table already exists: {name}", 'CreateTable')
+            table = LocalTable(name, schema, self._lock)
+            self._tables[name] = table
+            logger.debug(f"Local table {name} created")
+            return table
+
+    def reset(self) -> None:
+        """Remove every item from every table, keeping the schemas."""
+        with self._lock:
+            for table in self._tables.values():
+                table._truncate()
+            self._transaction_tokens.clear()
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Item count and approximate size per table."""
+        with self._lock:
+            return {
+                name: {'item_count': table.item_count, 'size_bytes': table.table_size_bytes}
+                for name, table in self._tables.items()
+            }
+
+    def _require_table(self, name: str, operation: str) -> LocalTable:
+        table = self._tables.get(name)
+        if table is None:
+            raise _client_error(
+                'ResourceNotFoundException', f"Requested resource not found: Table: {name} not found", operation
+            )
+        return table
+
+    def _replayed_transaction(self, token: str, fingerprint: str) -> bool:
+        """Check the idempotency window for a ClientRequestToken."""
+        cutoff = time.monotonic() - IDEMPOTENCY_WINDOW_SECONDS
+        while self._transaction_tokens:
+            oldest_token, (_, recorded) = next(iter(self._transaction_tokens.items()))
+            if recorded >= cutoff:
+                break
+            del self._transaction_tokens[oldest_token]
+
+        previous = self._transaction_tokens.get(token)
+        if previous is None:
+            return False
+        if previous[0] != fingerprint:
+            raise _client_error(
+                'IdempotentParameterMismatchException',
+                'The request uses the same client token as a previous, but non-identical request',
+                'TransactWriteItems'
+            )
+        return True
@@ -0,0 +1,244 @@
+"""
+Local exchange calendar for US equity markets.
+
+Answers which trading session is in effect at a given moment (pre-market,
+regular hours, after hours, closed or holiday) and when it started and ends,
+without calling a market data API. NYSE holidays are derived from their
+published rules, including the Saturday/Sunday observance rules and the
+1 p.m. early closes, and are computed once per year. Unscheduled closures can
+be added as extra holidays.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from enum import Enum
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+
+class TradingSession(Enum):
+    """Trading session classifications."""
+    PRE_MARKET = "pre_market"
+    REGULAR = "regular"
+    AFTER_HOURS = "after_hours"
+    CLOSED = "closed"
+    HOLIDAY = "holiday"
+
+
+@dataclass(frozen=True)
+class SessionWindow:
+    """A trading session and the period it covers."""
+    session: TradingSession
+    start: datetime
+    end: datetime
+    
+    @property
+    def is_trading(self) -> bool:
+        """Whether prices can change during this session."""
+        return self.session in (TradingSession.PRE_MARKET, TradingSession.REGULAR, TradingSession.AFTER_HOURS)
+    
+    @property
+    def start_utc(self) -> datetime:
+        """Session start as a naive UTC datetime, comparable with quote timestamps."""
+        return self.start.astimezone(timezone.utc).replace(tzinfo=None)
+    
+    def seconds_remaining(self, at: datetime) -> float:
+        """Seconds from ``at`` until the session ends."""
+        return max(0.0, (self.end - at).total_seconds())
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """The n-th given weekday of a month (n=-1 for the last one)."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    
+    last = date(year + (month == 12), month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Western Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """NYSE observance: Saturday holidays move to Friday, Sunday holidays to Monday."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+class ExchangeCalendar:
+    """
+    Session calendar for a US equity exchange.
+    
+    Holiday and early-close sets are computed once per year and the current
+    session window is reused until it ends, so lookups are cheap enough to
+    run on every cache read.
+    """
+    
+    def __init__(self, tz: str = "America/New_York",
+                 pre_market_open: time = time(4, 0),
+                 regular_open: time = time(9, 30),
+                 regular_close: time = time(16, 0),
+                 after_hours_close: time = time(20, 0),
+                 early_close: time = time(13, 0),
+                 early_after_hours_close: time = time(17, 0),
+                 extra_holidays: Iterable[date] = (),
+                 clock: Optional[Callable[[], datetime]] = None):
+        """
+        Initialize exchange calendar.
+        
+        Args:
+            tz: Exchange time zone
+            pre_market_open: Start of pre-market trading
+            regular_open: Regular session open
+            regular_close: Regular session close
+            after_hours_close: End of after-hours trading
+            early_close: Regular session close on early-close days
+            early_after_hours_close: End of after-hours trading on early-close days
+            extra_holidays: Additional full-day closures
+            clock: Returns the current time as an aware datetime (default: system clock)
+        """
+        self.tz = ZoneInfo(tz)
+        self.pre_market_open = pre_market_open
+        self.regular_open = regular_open
+        self.regular_close = regular_close
+        self.after_hours_close = after_hours_close
+        self.early_close = early_close
+        self.early_after_hours_close = early_after_hours_close
+        self.extra_holidays = set(extra_holidays)
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        
+        self._years: Dict[int, Tuple[Dict[date, str], Set[date]]] = {}
+        self._window: Optional[SessionWindow] = None
+    
+    def holidays(self, year: int) -> Dict[date, str]:
+        """
+        Full-day market holidays of a year.
+        
+        Args:
+            year: Calendar year
+        
+        Returns:
+            Dict mapping dates to holiday names
+        """
+        return self._year(year)[0]
+    
+    def early_closes(self, year: int) -> Set[date]:
+        """Trading days of a year on which the regular session closes early."""
+        return self._year(year)[1]
+    
+    def _year(self, year: int) -> Tuple[Dict[date, str], Set[date]]:
+        if year not in self._years:
+            self._years[year] = self._build_year(year)
+        return self._years[year]
+    
+    def _build_year(self, year: int) -> Tuple[Dict[date, str], Set[date]]:
+        holidays: Dict[date, str] = {}
+        
+        # A Saturday New Year's Day is not observed on the preceding Friday
+        new_year = date(year, 1, 1)
+        if new_year.weekday() != 5:
+            holidays[_observed(new_year)] = "New Year's Day"
+        
+        holidays[_nth_weekday(year, 1, 0, 3)] = "Martin Luther King Jr. Day"
+        holidays[_nth_weekday(year, 2, 0, 3)] = "Washington's Birthday"
+        holidays[_easter(year) - timedelta(days=2)] = "Good Friday"
+        holidays[_nth_weekday(year, 5, 0, -1)] = "Memorial Day"
+        if year >= 2022:
+            holidays[_observed(date(year, 6, 19))] = "Juneteenth"
+        holidays[_observed(date(year, 7, 4))] = "Independence Day"
+        holidays[_nth_weekday(year, 9, 0, 1)] = "Labor Day"
+        thanksgiving = _nth_weekday(year, 11, 3, 4)
+        holidays[thanksgiving] = "Thanksgiving Day"
+        holidays[_observed(date(year, 12, 25))] = "Christmas Day"
+        
+        for extra in self.extra_holidays:
+            if extra.year == year:
+                holidays[extra] = "Market closure"
+        
+        early_closes = {
+            day for day in (date(year, 7, 3), thanksgiving + timedelta(days=1), date(year, 12, 24))
+            if day.weekday() < 5 and day not in holidays
+        }
+        return holidays, early_closes
+    
+    def is_trading_day(self, day: date) -> bool:
+        """Whether the exchange trades on a date."""
+        return day.weekday() < 5 and day not in self.holidays(day.year)
+    
+    def _boundaries(self, day: date) -> List[Tuple[datetime, TradingSession]]:
+        """Session start times of a trading day, in order."""
+        early = day in self.early_closes(day.year)
+        times = [
+            (self.pre_market_open, TradingSession.PRE_MARKET),
+            (self.regular_open, TradingSession.REGULAR),
+            (self.early_close if early else self.regular_close, TradingSession.AFTER_HOURS),
+            (self.early_after_hours_close if early else self.after_hours_close, TradingSession.CLOSED)
+        ]
+        return [(datetime.combine(day, at, self.tz), session) for at, session in times]
+    
+    def _trading_day_near(self, day: date, step: int) -> date:
+        """Closest trading day strictly before (step=-1) or after (step=1) a date."""
+        day += timedelta(days=step)
+        while not self.is_trading_day(day):
+            day += timedelta(days=step)
+        return day
+    
+    def session_at(self, at: Optional[datetime] = None) -> SessionWindow:
+        """
+        Trading session in effect at a moment.
+        
+        Args:
+            at: Aware datetime, or naive UTC (default: now)
+        
+        Returns:
+            SessionWindow: Session with its start and end
+        """
+        if at is None:
+            at = self.clock()
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+        
+        window = self._window
+        if window is not None and window.start <= at < window.end:
+            return window
+        
+        window = self._compute_window(at.astimezone(self.tz))
+        self._window = window
+        return window
+    
+    def _compute_window(self, local: datetime) -> SessionWindow:
+        day = local.date()
+        
+        if not self.is_trading_day(day):
+            session = TradingSession.HOLIDAY if day.weekday() < 5 else TradingSession.CLOSED
+            start = self._boundaries(self._trading_day_near(day, -1))[-1][0]
+            end = self._boundaries(self._trading_day_near(day, 1))[0][0]
+            return SessionWindow(session, start, end)
+        
+        boundaries = self._boundaries(day)
+        if local < boundaries[0][0]:
+            start = self._boundaries(self._trading_day_near(day, -1))[-1][0]
+            return SessionWindow(TradingSession.CLOSED, start, boundaries[0][0])
+        
+        for (start, session), (end, _) in zip(boundaries, boundaries[1:]):
+            if start <= local < end:
+                return SessionWindow(session, start, end)
+        
+        end = self._boundaries(self._trading_day_near(day, 1))[0][0]
+        return SessionWindow(TradingSession.CLOSED, boundaries[-1][0], end)
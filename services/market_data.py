@@ -10,18 +10,22 @@ mechanisms to ensure reliable operation even when external APIs are experiencing
 """
 
 import asyncio
+import contextvars
 import logging
 import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional, Any, Tuple, Union
-from dataclasses import dataclass, field
-from enum import Enum
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field, replace
+from enum import Enum, IntEnum
 import json
 import hashlib
+import os
+import threading
+from collections import deque
 
 import aiohttp
-import redis
+import redis.asyncio as aioredis
 from tenacity import (
     retry, 
     stop_after_attempt, 
@@ -33,6 +37,10 @@ from prometheus_client import Counter, Histogram, Gauge
 import structlog
 
 from config.settings import get_config
+from services.market_calendar import ExchangeCalendar, SessionWindow, TradingSession
+from services.quote_stream import QuoteStream, StreamTick
+from services.symbol_universe import SymbolRecord, SymbolUniverse
+from utils.validators import SymbolValidator
 
 
 class MarketDataError(Exception):
@@ -64,6 +72,24 @@ class DataQuality(Enum):
     FALLBACK = "fallback"
 
 
+_QUOTE_FORMAT_VERSION = "q1"
+_QUOTE_FIELD_SEPARATOR = "\x1f"
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _pack_optional(value: Any) -> str:
+    return '' if value is None else str(value)
+
+
+def _unpack_number(value: str) -> Optional[Union[int, float]]:
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
 @dataclass
 class MarketQuote:
     """
@@ -99,7 +125,8 @@ class MarketQuote:
     
     def __post_init__(self):
         """Validate quote data after initialization."""
-        if self.current_price <= 0:
+        # Fallback quotes stand in for symbols with no price at all
+        if self.current_price <= 0 and self.data_quality != DataQuality.FALLBACK:
             raise ValueError(f"Invalid current price for {self.symbol}: {self.current_price}")
         
         if self.volume is not None and self.volume < 0:
@@ -124,6 +151,11 @@ class MarketQuote:
         """Check if quote data is considered stale (older than 5 minutes)."""
         return datetime.utcnow() - self.timestamp > timedelta(minutes=5)
     
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the quote was fetched."""
+        return (datetime.utcnow() - self.timestamp).total_seconds()
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert quote to dictionary for serialization."""
         return {
@@ -149,6 +181,84 @@ class MarketQuote:
             'price_change_percent': float(self.price_change_percent) if self.price_change_percent else None,
             'is_stale': self.is_stale
         }
+    
+    def pack(self) -> bytes:
+        """
+        Serialize the quote into the compact cache format.
+        
+        Fields are written in a fixed order, separated by ASCII unit separators,
+        behind a format version tag. Prices keep their exact Decimal digits and
+        the timestamp is stored as integer microseconds since the epoch.
+        
+        Returns:
+            Encoded quote
+        """
+        fields = [
+            _QUOTE_FORMAT_VERSION,
+            self.symbol,
+            str(self.current_price),
+            _pack_optional(self.open_price),
+            _pack_optional(self.high_price),
+            _pack_optional(self.low_price),
+            _pack_optional(self.previous_close),
+            _pack_optional(self.volume),
+            _pack_optional(self.market_cap),
+            _pack_optional(self.pe_ratio),
+            str((self.timestamp - _EPOCH) // timedelta(microseconds=1)),
+            self.market_status.value,
+            self.data_quality.value,
+            self.exchange or '',
+            self.currency,
+            self.timezone,
+            self.source,
+            _pack_optional(self.api_latency_ms)
+        ]
+        return _QUOTE_FIELD_SEPARATOR.join(fields).encode('utf-8')
+    
+    @classmethod
+    def unpack(cls, payload: Union[bytes, str]) -> 'MarketQuote':
+        """
+        Deserialize a quote written by pack().
+        
+        Args:
+            payload: Encoded quote
+            
+        Returns:
+            MarketQuote object
+            
+        Raises:
+            ValueError: If the payload is not in the current format
+        """
+        if isinstance(payload, bytes):
+            payload = payload.decode('utf-8')
+        
+        fields = payload.split(_QUOTE_FIELD_SEPARATOR)
+        if fields[0] != _QUOTE_FORMAT_VERSION or len(fields) != 18:
+            raise ValueError("Unsupported quote cache format")
+        
+        (_, symbol, current_price, open_price, high_price, low_price, previous_close,
+         volume, market_cap, pe_ratio, timestamp, market_status, data_quality,
+         exchange, currency, timezone, source, api_latency_ms) = fields
+        
+        return cls(
+            symbol=symbol,
+            current_price=Decimal(current_price),
+            open_price=Decimal(open_price) if open_price else None,
+            high_price=Decimal(high_price) if high_price else None,
+            low_price=Decimal(low_price) if low_price else None,
+            previous_close=Decimal(previous_close) if previous_close else None,
+            volume=int(volume) if volume else None,
+            market_cap=_unpack_number(market_cap),
+            pe_ratio=Decimal(pe_ratio) if pe_ratio else None,
+            timestamp=_EPOCH + timedelta(microseconds=int(timestamp)),
+            market_status=MarketStatus(market_status),
+            data_quality=DataQuality(data_quality),
+            exchange=exchange or None,
+            currency=currency,
+            timezone=timezone,
+            source=source,
+            api_latency_ms=float(api_latency_ms) if api_latency_ms else None
+        )
 
 
 @dataclass
@@ -179,59 +289,266 @@ class SymbolInfo:
             'sector': self.sector,
             'industry': self.industry
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SymbolInfo':
+        """Create symbol info from its dictionary form."""
+        return cls(**{name: data[name] for name in cls.__dataclass_fields__ if name in data})
+
+
+class RequestPriority(IntEnum):
+    """Scheduling classes for Finnhub requests; lower values are served first."""
+    EXECUTION = 0
+    RISK_ANALYSIS = 1
+    DASHBOARD = 2
+    PREFETCH = 3
+
+
+# Priority of market data requests made from the current task. Tasks started
+# on behalf of a request (single-flight fetches) inherit it.
+request_priority: contextvars.ContextVar[RequestPriority] = contextvars.ContextVar(
+    'market_data_request_priority', default=RequestPriority.DASHBOARD
+)
+
+
+@dataclass
+class _TokenWaiter:
+    """A request queued for a rate limit token."""
+    future: asyncio.Future
+    priority: RequestPriority
+    enqueued_at: float
+    key: Optional[str] = None
+    active: bool = True
 
 
 class RateLimiter:
     """
-    Token bucket rate limiter for API requests.
+    Priority-aware token bucket rate limiter for API requests.
     
-    Implements a token bucket algorithm to ensure API rate limits are respected
-    while allowing for burst requests when tokens are available.
+    Tokens refill continuously at max_requests per time_window, so capacity is
+    handed out evenly instead of in whole-token bursts. Requests that find the
+    bucket empty queue in FIFO order within their priority class and are woken
+    by a single timer when the next token accrues, without polling. Higher
+    classes are served first; a waiter gains one class for every
+    ``aging_seconds`` it has waited so low-priority work is never starved.
     """
     
-    def __init__(self, max_requests: int, time_window: int = 60):
+    def __init__(self, max_requests: int, time_window: int = 60, aging_seconds: float = 30.0,
+                 on_wait: Optional[Callable[[RequestPriority, float], None]] = None,
+                 on_queue_change: Optional[Callable[[RequestPriority, int], None]] = None):
         """
         Initialize rate limiter.
         
         Args:
             max_requests: Maximum requests allowed in time window
             time_window: Time window in seconds (default: 60)
+            aging_seconds: Wait after which a queued request is treated as one
+                priority class higher
+            on_wait: Callback invoked with (priority, seconds waited) per grant
+            on_queue_change: Callback invoked with (priority, queue depth)
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self.tokens = max_requests
-        self.last_refill = time.time()
-        self._lock = asyncio.Lock()
+        self.rate = max_requests / time_window
+        self.aging_seconds = aging_seconds
+        self.on_wait = on_wait
+        self.on_queue_change = on_queue_change
+        
+        self.tokens = float(max_requests)
+        self.last_refill = time.monotonic()
+        self._queues: Dict[RequestPriority, deque] = {priority: deque() for priority in RequestPriority}
+        self._depths: Dict[RequestPriority, int] = {priority: 0 for priority in RequestPriority}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._granted: Dict[RequestPriority, int] = {priority: 0 for priority in RequestPriority}
+        self._wait_total: Dict[RequestPriority, float] = {priority: 0.0 for priority in RequestPriority}
+        self._wait_max: Dict[RequestPriority, float] = {priority: 0.0 for priority in RequestPriority}
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(float(self.max_requests), self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
     
     async def acquire(self) -> bool:
         """
         Acquire a token for making a request.
         
         Returns:
-            bool: True if token acquired, False if rate limited
+            bool: True if token acquired, False if rate limited or requests are queued
         """
-        async with self._lock:
-            now = time.time()
-            
-            # Refill tokens based on elapsed time
-            elapsed = now - self.last_refill
-            tokens_to_add = int(elapsed * (self.max_requests / self.time_window))
+        self._refill()
+        if self.tokens >= 1 and not self.queue_depth:
+            self.tokens -= 1
+            return True
+        return False
+    
+    async def wait_for_token(self, priority: Optional[RequestPriority] = None,
+                             key: Optional[str] = None) -> float:
+        """
+        Wait until a token is granted.
+        
+        Args:
+            priority: Scheduling class (default: the current request priority)
+            key: Identifies the request so a later caller can promote it
             
-            if tokens_to_add > 0:
-                self.tokens = min(self.max_requests, self.tokens + tokens_to_add)
-                self.last_refill = now
+        Returns:
+            float: Seconds spent waiting
+        """
+        if priority is None:
+            priority = request_priority.get()
+        
+        if await self.acquire():
+            self._record_wait(priority, 0.0)
+            return 0.0
+        
+        loop = asyncio.get_running_loop()
+        waiter = _TokenWaiter(loop.create_future(), priority, time.monotonic(), key)
+        self._enqueue(waiter)
+        self._schedule_dispatch()
+        
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just before the caller was cancelled; hand the token back
+                self.tokens += 1
+            elif waiter.active:
+                waiter.active = False
+                self._change_depth(waiter.priority, -1)
+            self._schedule_dispatch()
+            raise
+        
+        waited = time.monotonic() - waiter.enqueued_at
+        self._record_wait(waiter.priority, waited)
+        return waited
+    
+    def promote(self, key: str, priority: RequestPriority) -> bool:
+        """
+        Move a queued request to a higher priority class.
+        
+        Used when a more urgent caller joins a request that is already waiting.
+        
+        Args:
+            key: Key the request was queued with
+            priority: New scheduling class
             
-            # Check if we have tokens available
-            if self.tokens > 0:
-                self.tokens -= 1
-                return True
+        Returns:
+            bool: True if a queued request was promoted
+        """
+        for queued_priority in RequestPriority:
+            if queued_priority <= priority:
+                continue
+            for waiter in self._queues[queued_priority]:
+                if self._is_queued(waiter, queued_priority) and waiter.key == key:
+                    # The entry left behind in the old queue is skipped on dispatch
+                    self._change_depth(queued_priority, -1)
+                    waiter.priority = priority
+                    self._enqueue(waiter)
+                    return True
+        return False
+    
+    @staticmethod
+    def _is_queued(waiter: _TokenWaiter, priority: RequestPriority) -> bool:
+        """Whether a queue entry still represents a waiting request of that class."""
+        return waiter.active and waiter.priority == priority and not waiter.future.done()
+    
+    def _enqueue(self, waiter: _TokenWaiter) -> None:
+        self._queues[waiter.priority].append(waiter)
+        self._change_depth(waiter.priority, 1)
+    
+    def _change_depth(self, priority: RequestPriority, delta: int) -> None:
+        self._depths[priority] += delta
+        if self.on_queue_change:
+            self.on_queue_change(priority, self._depths[priority])
+    
+    def _schedule_dispatch(self) -> None:
+        """Arm the wakeup timer for the next grant if requests are queued."""
+        if self._timer is not None or not self.queue_depth:
+            return
+        
+        self._refill()
+        delay = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+        self._timer = asyncio.get_running_loop().call_later(delay, self._dispatch)
+    
+    def _dispatch(self) -> None:
+        """Grant accrued tokens to queued requests in priority order."""
+        self._timer = None
+        self._refill()
+        
+        while self.tokens >= 1:
+            waiter = self._next_waiter()
+            if waiter is None:
+                break
+            self.tokens -= 1
+            waiter.future.set_result(None)
+        
+        self._schedule_dispatch()
+    
+    def _next_waiter(self) -> Optional[_TokenWaiter]:
+        """Pop the waiter with the best aged priority."""
+        now = time.monotonic()
+        best = None
+        best_rank = None
+        
+        for priority, queue in self._queues.items():
+            while queue and not self._is_queued(queue[0], priority):
+                queue.popleft()
+            if not queue:
+                continue
             
-            return False
+            head = queue[0]
+            rank = head.priority - (now - head.enqueued_at) / self.aging_seconds
+            if best_rank is None or rank < best_rank:
+                best, best_rank = head, rank
+        
+        if best is not None:
+            self._queues[best.priority].popleft()
+            best.active = False
+            self._change_depth(best.priority, -1)
+        return best
+    
+    def _record_wait(self, priority: RequestPriority, waited: float) -> None:
+        self._granted[priority] += 1
+        self._wait_total[priority] += waited
+        self._wait_max[priority] = max(self._wait_max[priority], waited)
+        if self.on_wait:
+            self.on_wait(priority, waited)
+    
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a token."""
+        return sum(self._depths.values())
     
-    async def wait_for_token(self) -> None:
-        """Wait until a token becomes available."""
-        while not await self.acquire():
-            await asyncio.sleep(0.1)
+    def get_stats(self) -> Dict[str, Any]:
+        """Tokens, queue depth and wait times per priority class for monitoring."""
+        self._refill()
+        return {
+            'tokens_available': round(self.tokens, 2),
+            'max_requests': self.max_requests,
+            'queue_depth': self.queue_depth,
+            'classes': {
+                priority.name.lower(): {
+                    'queued': self._depths[priority],
+                    'granted': self._granted[priority],
+                    'avg_wait_seconds': round(self._wait_total[priority] / self._granted[priority], 4)
+                    if self._granted[priority] else 0.0,
+                    'max_wait_seconds': round(self._wait_max[priority], 4)
+                }
+                for priority in RequestPriority
+            }
+        }
+
+
+class CircuitOpenError(MarketDataError):
+    """Raised when a call is rejected because its circuit is open."""
+    
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(
+            f"Circuit breaker is open for {endpoint}; retry in {retry_after:.1f}s",
+            error_code="CIRCUIT_OPEN"
+        )
+        self.endpoint = endpoint
+        self.retry_after = retry_after
 
 
 class CircuitBreaker:
@@ -240,22 +557,56 @@ class CircuitBreaker:
     
     Prevents cascading failures by temporarily stopping requests to a failing service
     and allowing it time to recover.
+    
+    The breaker only guards state transitions, never the call itself, so
+    concurrent requests through one breaker run in parallel. Transitions run
+    between awaits on the event loop and need no lock. After the recovery
+    timeout a limited number of probe requests is let through (half-open);
+    the circuit closes once that many probes succeed and reopens on any
+    probe failure. Outcomes are also kept in a rolling window, and the
+    circuit trips when the window's error rate crosses the threshold.
     """
     
-    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 60):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 60,
+                 half_open_max_calls: int = 1, error_rate_threshold: Optional[float] = None,
+                 window_seconds: int = 60, min_calls: int = 10, name: str = "default",
+                 on_state_change: Optional[Callable[[str, str], None]] = None):
         """
         Initialize circuit breaker.
         
         Args:
-            failure_threshold: Number of failures before opening circuit
+            failure_threshold: Number of consecutive failures before opening circuit
             recovery_timeout: Seconds to wait before attempting recovery
+            half_open_max_calls: Concurrent probe requests allowed while half-open,
+                and successes needed to close the circuit again
+            error_rate_threshold: Rolling error rate (0-1) that opens the circuit,
+                or None to trip on consecutive failures only
+            window_seconds: Length of the rolling error rate window
+            min_calls: Calls required in the window before the error rate applies
+            name: Endpoint name used in errors and state reporting
+            on_state_change: Callback invoked with (name, new_state)
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.error_rate_threshold = error_rate_threshold
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.name = name
+        self.on_state_change = on_state_change
+        
         self.failure_count = 0
         self.last_failure_time = None
-        self.state = "closed"  # closed, open, half_open
-        self._lock = asyncio.Lock()
+        self.opened_at: Optional[float] = None
+        self.state = self.CLOSED
+        self.rejected_count = 0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._outcomes: deque = deque()  # (monotonic time, succeeded)
     
     async def call(self, func, *args, **kwargs):
         """
@@ -270,41 +621,478 @@ class CircuitBreaker:
             Function result
             
         Raises:
-            Exception: If circuit is open or function fails
+            CircuitOpenError: If the circuit is open or all probe slots are taken
+            Exception: If the function fails
         """
-        async with self._lock:
-            if self.state == "open":
-                if self._should_attempt_reset():
-                    self.state = "half_open"
-                else:
-                    raise Exception("Circuit breaker is open")
+        probe = self._admit()
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            if probe:
+                self._probes_in_flight -= 1
+            raise
+        except Exception:
+            self._on_failure(probe)
+            raise
+        
+        self._on_success(probe)
+        return result
+    
+    def _admit(self) -> bool:
+        """
+        Decide whether a call may proceed.
+        
+        Returns:
+            True if the call is a half-open probe
             
-            try:
-                result = await func(*args, **kwargs)
-                await self._on_success()
-                return result
-            except Exception as e:
-                await self._on_failure()
-                raise e
+        Raises:
+            CircuitOpenError: If the call is rejected
+        """
+        if self.state == self.OPEN:
+            if not self._should_attempt_reset():
+                self.rejected_count += 1
+                raise CircuitOpenError(self.name, self._retry_after())
+            self._transition(self.HALF_OPEN)
+        
+        if self.state == self.HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_max_calls:
+                self.rejected_count += 1
+                raise CircuitOpenError(self.name, 0.0)
+            self._probes_in_flight += 1
+            return True
+        
+        return False
     
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset."""
-        if self.last_failure_time is None:
+        if self.opened_at is None:
             return True
-        return time.time() - self.last_failure_time >= self.recovery_timeout
+        return time.monotonic() - self.opened_at >= self.recovery_timeout
     
-    async def _on_success(self):
+    def _retry_after(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+    
+    def _on_success(self, probe: bool) -> None:
         """Handle successful request."""
-        self.failure_count = 0
-        self.state = "closed"
+        self._record(True)
+        if probe:
+            self._probes_in_flight -= 1
+            if self.state == self.HALF_OPEN:
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_max_calls:
+                    self._transition(self.CLOSED)
+        elif self.state == self.CLOSED:
+            self.failure_count = 0
     
-    async def _on_failure(self):
+    def _on_failure(self, probe: bool) -> None:
         """Handle failed request."""
-        self.failure_count += 1
+        self._record(False)
         self.last_failure_time = time.time()
         
-        if self.failure_count >= self.failure_threshold:
-            self.state = "open"
+        if probe:
+            self._probes_in_flight -= 1
+            if self.state == self.HALF_OPEN:
+                self._transition(self.OPEN)
+        elif self.state == self.CLOSED:
+            # Calls that started before the circuit opened don't move it
+            self.failure_count += 1
+            if self.failure_count >= self.failure_threshold or self._error_rate_exceeded():
+                self._transition(self.OPEN)
+    
+    def _transition(self, state: str) -> None:
+        """Move to a new state and reset the counters that belong to it."""
+        self.state = state
+        if state == self.OPEN:
+            self.opened_at = time.monotonic()
+        elif state == self.HALF_OPEN:
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+        else:
+            self.failure_count = 0
+            self.opened_at = None
+            self._outcomes.clear()
+        
+        if self.on_state_change:
+            self.on_state_change(self.name, state)
+    
+    def _record(self, succeeded: bool) -> None:
+        now = time.monotonic()
+        self._outcomes.append((now, succeeded))
+        self._prune(now)
+    
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            self._outcomes.popleft()
+    
+    def _error_rate_exceeded(self) -> bool:
+        if self.error_rate_threshold is None or len(self._outcomes) < self.min_calls:
+            return False
+        return self.error_rate >= self.error_rate_threshold
+    
+    @property
+    def error_rate(self) -> float:
+        """Fraction of failed calls in the rolling window."""
+        self._prune(time.monotonic())
+        if not self._outcomes:
+            return 0.0
+        failures = sum(1 for _, succeeded in self._outcomes if not succeeded)
+        return failures / len(self._outcomes)
+    
+    def get_state(self) -> Dict[str, Any]:
+        """State, rolling error rate and counters for monitoring."""
+        return {
+            'state': self.state,
+            'error_rate': round(self.error_rate, 4),
+            'window_calls': len(self._outcomes),
+            'consecutive_failures': self.failure_count,
+            'probes_in_flight': self._probes_in_flight,
+            'rejected': self.rejected_count,
+            'retry_after_seconds': round(self._retry_after(), 1) if self.state == self.OPEN else 0.0
+        }
+
+
+class SingleFlight:
+    """
+    Request coalescing for concurrent calls with the same key.
+    
+    The first caller for a key starts the call as a task; callers arriving
+    while it is in flight await the same task instead of starting their own,
+    and every awaiter receives the same result or exception. Awaiters are
+    shielded from each other, so a cancelled caller does not cancel the
+    shared call.
+    """
+    
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.originated = 0
+        self.coalesced = 0
+    
+    async def do(self, key: str, func, *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        Run func for key, or join the call already in flight for key.
+        
+        Args:
+            key: Coalescing key
+            func: Coroutine function to execute
+            *args: Function arguments
+            **kwargs: Function keyword arguments
+            
+        Returns:
+            Tuple of (result, shared) where shared is True if this caller
+            joined a call started by another caller
+        """
+        task = self._in_flight.get(key)
+        shared = task is not None
+        
+        if shared:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._on_done(key, done))
+            self.originated += 1
+        
+        return await asyncio.shield(task), shared
+    
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished call so the next caller starts a new one."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved in case every awaiter was cancelled
+            task.exception()
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._in_flight
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently in flight."""
+        return len(self._in_flight)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Originated, coalesced and in-flight call counts."""
+        return {
+            'originated': self.originated,
+            'coalesced': self.coalesced,
+            'in_flight': self.in_flight
+        }
+
+
+class ProfileCache:
+    """
+    Long-lived cache of company profiles (SymbolInfo).
+    
+    Profile fields such as exchange, currency and market cap change rarely, so
+    they are cached far longer than quotes and shared by quote assembly, symbol
+    validation and the execution simulator. Entries live in memory, in Redis
+    under ``profile:<SYMBOL>`` and in a JSON file that survives restarts. The
+    file is rewritten at most once per save delay, however many profiles
+    arrive, and on close. Symbols without a profile are remembered in memory for a shorter time so
+    quote refreshes don't keep asking for them.
+    """
+    
+    def __init__(self, ttl_seconds: int = 86400, path: Optional[str] = None,
+                 miss_ttl_seconds: int = 3600, save_delay_seconds: float = 5.0):
+        """
+        Initialize profile cache.
+        
+        Args:
+            ttl_seconds: Lifetime of a cached profile
+            path: JSON file used to persist profiles, or None to keep them in memory
+            miss_ttl_seconds: How long a symbol without a profile is remembered
+            save_delay_seconds: How long new profiles are collected before the file is rewritten
+        """
+        self.ttl_seconds = ttl_seconds
+        self.path = path
+        self.miss_ttl_seconds = miss_ttl_seconds
+        self.save_delay_seconds = save_delay_seconds
+        self.redis_client: Optional[aioredis.Redis] = None
+        self.logger = structlog.get_logger(__name__)
+        
+        self._profiles: Dict[str, Tuple[SymbolInfo, float]] = {}  # symbol -> (info, expires_at)
+        self._misses: Dict[str, float] = {}
+        self._save_lock = asyncio.Lock()
+        self._save_task: Optional[asyncio.Task] = None
+        self._dirty = False
+        
+        # Snapshots are numbered so an older one never replaces a newer file
+        self._write_lock = threading.Lock()
+        self._generation = 0
+        self._written_generation = 0
+    
+    def peek(self, symbol: str) -> Optional[SymbolInfo]:
+        """
+        Get a profile from memory without touching Redis or the API.
+        
+        Args:
+            symbol: Stock symbol
+            
+        Returns:
+            Cached SymbolInfo or None
+        """
+        entry = self._profiles.get(symbol)
+        if entry is None:
+            return None
+        if entry[1] <= time.time():
+            del self._profiles[symbol]
+            return None
+        return entry[0]
+    
+    def is_missing(self, symbol: str) -> bool:
+        """Whether the symbol recently turned out to have no profile."""
+        expires_at = self._misses.get(symbol)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            del self._misses[symbol]
+            return False
+        return True
+    
+    async def get(self, symbol: str) -> Optional[SymbolInfo]:
+        """
+        Get a profile from memory, falling back to Redis.
+        
+        Args:
+            symbol: Stock symbol
+            
+        Returns:
+            Cached SymbolInfo or None
+        """
+        profile = self.peek(symbol)
+        if profile is not None or not self.redis_client:
+            return profile
+        
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(f"profile:{symbol}")
+                pipe.ttl(f"profile:{symbol}")
+                cached_data, ttl = await pipe.execute()
+        except Exception as e:
+            self.logger.warning("Redis profile read failed", symbol=symbol, error=str(e))
+            return None
+        
+        if not cached_data:
+            return None
+        
+        profile = SymbolInfo.from_dict(json.loads(cached_data))
+        expires_at = time.time() + (ttl if ttl and ttl > 0 else self.ttl_seconds)
+        self._profiles[symbol] = (profile, expires_at)
+        return profile
+    
+    async def put(self, profile: SymbolInfo) -> None:
+        """
+        Cache a profile in memory and Redis, and schedule a write to disk.
+        
+        Args:
+            profile: Profile to cache
+        """
+        symbol = profile.symbol
+        self._profiles[symbol] = (profile, time.time() + self.ttl_seconds)
+        self._misses.pop(symbol, None)
+        
+        if self.redis_client:
+            try:
+                await self.redis_client.setex(
+                    f"profile:{symbol}", self.ttl_seconds, json.dumps(profile.to_dict())
+                )
+            except Exception as e:
+                self.logger.warning("Redis profile write failed", symbol=symbol, error=str(e))
+        
+        if self.path:
+            self._dirty = True
+            if self._save_task is None or self._save_task.done():
+                self._save_task = asyncio.create_task(self._save_later())
+    
+    def mark_missing(self, symbol: str) -> None:
+        """Remember that a symbol has no profile."""
+        self._misses[symbol] = time.time() + self.miss_ttl_seconds
+    
+    async def load(self) -> int:
+        """
+        Load unexpired profiles from the cache file.
+        
+        Returns:
+            Number of profiles loaded
+        """
+        if not self.path:
+            return 0
+        
+        try:
+            entries = await asyncio.get_event_loop().run_in_executor(None, self._read_file)
+        except Exception as e:
+            self.logger.warning("Profile cache file unreadable", path=self.path, error=str(e))
+            return 0
+        
+        now = time.time()
+        loaded = 0
+        for symbol, entry in entries.items():
+            if entry['expires_at'] > now and symbol not in self._profiles:
+                self._profiles[symbol] = (SymbolInfo.from_dict(entry['profile']), entry['expires_at'])
+                loaded += 1
+        
+        self.logger.info("Profile cache loaded", path=self.path, profiles=loaded)
+        return loaded
+    
+    async def save(self) -> None:
+        """Write unexpired profiles to the cache file."""
+        if not self.path:
+            return
+        
+        self._dirty = False
+        self._generation += 1
+        generation = self._generation
+        now = time.time()
+        entries = {
+            symbol: {'profile': profile.to_dict(), 'expires_at': expires_at}
+            for symbol, (profile, expires_at) in self._profiles.items()
+            if expires_at > now
+        }
+        
+        async with self._save_lock:
+            try:
+                await asyncio.get_event_loop().run_in_executor(None, self._write_file, entries, generation)
+            except Exception as e:
+                self.logger.warning("Profile cache file write failed", path=self.path, error=str(e))
+    
+    async def close(self) -> None:
+        """Stop the pending write and save profiles not yet on disk."""
+        if self._save_task is not None:
+            self._save_task.cancel()
+            await asyncio.gather(self._save_task, return_exceptions=True)
+            self._save_task = None
+        if self._dirty:
+            await self.save()
+    
+    async def _save_later(self) -> None:
+        """Write the cache file once the save delay has passed, until nothing is unsaved."""
+        while self._dirty:
+            await asyncio.sleep(self.save_delay_seconds)
+            await self.save()
+    
+    def _read_file(self) -> Dict[str, Any]:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _write_file(self, entries: Dict[str, Any], generation: int) -> None:
+        with self._write_lock:
+            if generation <= self._written_generation:
+                return
+            
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            
+            # Write to a temporary file and rename so readers never see a partial file
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(temp_path, self.path)
+            self._written_generation = generation
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size and persistence settings for monitoring."""
+        return {
+            'profiles': len(self._profiles),
+            'known_missing': len(self._misses),
+            'ttl_seconds': self.ttl_seconds,
+            'persisted_to': self.path,
+            'unsaved_changes': self._dirty
+        }
+
+
+def _symbol_info_from_record(record: SymbolRecord) -> SymbolInfo:
+    """Symbol information for a symbol universe entry."""
+    return SymbolInfo(
+        symbol=record.symbol,
+        display_symbol=record.display_symbol,
+        description=record.description,
+        type=record.type,
+        exchange=record.mic,
+        currency=record.currency
+    )
+
+
+STREAM_SOURCE = "finnhub_stream"
+
+_SESSION_STATUS = {
+    TradingSession.PRE_MARKET: MarketStatus.PRE_MARKET,
+    TradingSession.REGULAR: MarketStatus.OPEN,
+    TradingSession.AFTER_HOURS: MarketStatus.AFTER_HOURS,
+    TradingSession.CLOSED: MarketStatus.CLOSED,
+    TradingSession.HOLIDAY: MarketStatus.HOLIDAY
+}
+
+# Late prints and closing auction corrections can still arrive right after the
+# close, so quotes fetched this soon after it are not treated as final
+_CLOSE_SETTLE = timedelta(minutes=5)
+
+
+@dataclass(frozen=True)
+class QuoteTTLPolicy:
+    """
+    Quote cache TTLs in effect for a trading session.
+    
+    A quote is fresh if it was fetched after ``fresh_after`` and, when a soft
+    TTL applies, is younger than it. Quotes younger than the hard TTL may be
+    served as delayed while they are refreshed.
+    """
+    window: SessionWindow
+    soft_ttl: Optional[int]
+    hard_ttl: int
+    fresh_after: datetime
+    
+    def is_fresh(self, quote: MarketQuote) -> bool:
+        """Whether a cached quote can be served without a refresh."""
+        if quote.timestamp < self.fresh_after:
+            return False
+        return self.soft_ttl is None or quote.age_seconds < self.soft_ttl
 
 
 class MarketDataService:
@@ -325,15 +1113,26 @@ class MarketDataService:
         self.session: Optional[aiohttp.ClientSession] = None
         
         # Initialize caching
-        self.redis_client: Optional[redis.Redis] = None
+        self.redis_pool: Optional[aioredis.ConnectionPool] = None
+        self.redis_client: Optional[aioredis.Redis] = None
         self.memory_cache: Dict[str, Tuple[MarketQuote, datetime]] = {}
         
         # Initialize rate limiting and circuit breaker
         self.rate_limiter = RateLimiter(
             max_requests=self.config.market_data.rate_limit_per_minute,
-            time_window=60
+            time_window=60,
+            on_wait=self._on_rate_limit_wait,
+            on_queue_change=self._on_rate_limit_queue_change
         )
-        self.circuit_breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=60)
+        # One breaker per Finnhub endpoint so a failing endpoint doesn't block the others
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {
+            endpoint: self._create_circuit_breaker(endpoint)
+            for endpoint in ('quote', 'symbol_info', 'market_status', 'search')
+        }
+        self.circuit_breaker = self.circuit_breakers['quote']
+        
+        # Concurrent cache misses for a symbol share one upstream fetch
+        self.quote_flights = SingleFlight()
         
         # Metrics
         self.request_counter = Counter(
@@ -356,15 +1155,90 @@ class MarketDataService:
             'API errors by type',
             ['error_type']
         )
+        self.quote_fetch_counter = Counter(
+            'market_data_quote_fetches_total',
+            'Quote fetches by single-flight outcome',
+            ['outcome']
+        )
+        self.rate_limit_wait = Histogram(
+            'market_data_rate_limit_wait_seconds',
+            'Time spent waiting for a rate limit token',
+            ['priority']
+        )
+        self.rate_limit_queue_depth = Gauge(
+            'market_data_rate_limit_queue_depth',
+            'Requests waiting for a rate limit token',
+            ['priority']
+        )
+        self.circuit_state_gauge = Gauge(
+            'market_data_circuit_breaker_open',
+            'Circuit breaker state per endpoint (0=closed, 0.5=half-open, 1=open)',
+            ['endpoint']
+        )
+        
+        # Company profiles change rarely and are cached separately from quotes
+        self.profile_cache = ProfileCache(
+            ttl_seconds=self.config.market_data.profile_cache_ttl_seconds,
+            path=self.config.market_data.profile_cache_path,
+            save_delay_seconds=self.config.market_data.profile_cache_save_delay_seconds
+        )
+        self.profile_flights = SingleFlight()
         
-        # Symbol cache for validation
-        self.symbol_cache: Dict[str, SymbolInfo] = {}
-        self.symbol_cache_expiry = datetime.utcnow()
+        # Optional local symbol master; when loaded, search and validation
+        # are answered from memory without API calls
+        self.symbol_universe = SymbolUniverse(self.config.market_data.symbol_universe_path)
+        self._universe_reload_task: Optional[asyncio.Task] = None
+        
+        # Quote TTLs follow the trading session of the local exchange calendar;
+        # quotes between the soft and hard TTL are served as delayed while one
+        # background refresh per symbol runs
+        self.market_calendar = ExchangeCalendar(
+            extra_holidays=[date.fromisoformat(day) for day in self.config.market_data.extra_market_holidays]
+        )
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        
+        # Optional trade feed for watched symbols; ticks update the quote cache
+        self.quote_stream: Optional[QuoteStream] = None
+        self._stream_interest: Dict[str, Tuple[frozenset, Optional[float]]] = {}
+        self._stream_tick_times: Dict[str, float] = {}
+        self._quote_listeners: Dict[int, Tuple[Callable[[MarketQuote], Any], Optional[frozenset]]] = {}
+        self._listener_ids = 0
+        self._listener_tasks: set = set()
         
         self.logger.info("MarketDataService initialized", 
                         api_key_configured=bool(self.config.market_data.finnhub_api_key),
                         rate_limit=self.config.market_data.rate_limit_per_minute)
     
+    def _on_rate_limit_wait(self, priority: RequestPriority, waited: float) -> None:
+        """Record how long a request waited for a rate limit token."""
+        self.rate_limit_wait.labels(priority=priority.name.lower()).observe(waited)
+    
+    def _on_rate_limit_queue_change(self, priority: RequestPriority, depth: int) -> None:
+        """Publish the rate limit queue depth for a priority class."""
+        self.rate_limit_queue_depth.labels(priority=priority.name.lower()).set(depth)
+    
+    def _create_circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        """Create the circuit breaker guarding one Finnhub endpoint."""
+        config = self.config.market_data
+        return CircuitBreaker(
+            failure_threshold=config.circuit_failure_threshold,
+            recovery_timeout=config.circuit_recovery_seconds,
+            half_open_max_calls=config.circuit_half_open_calls,
+            error_rate_threshold=config.circuit_error_rate_threshold,
+            window_seconds=config.circuit_window_seconds,
+            name=endpoint,
+            on_state_change=self._on_circuit_state_change
+        )
+    
+    def _on_circuit_state_change(self, endpoint: str, state: str) -> None:
+        """Publish circuit breaker transitions to logs and metrics."""
+        value = {CircuitBreaker.CLOSED: 0, CircuitBreaker.HALF_OPEN: 0.5, CircuitBreaker.OPEN: 1}[state]
+        self.circuit_state_gauge.labels(endpoint=endpoint).set(value)
+        if state == CircuitBreaker.OPEN:
+            self.logger.warning("Circuit breaker opened", endpoint=endpoint)
+        else:
+            self.logger.info("Circuit breaker state changed", endpoint=endpoint, state=state)
+    
     async def __aenter__(self):
         """Async context manager entry."""
         await self.initialize()
@@ -391,41 +1265,282 @@ class MarketDataService:
         
         # Initialize Redis cache if available
         try:
-            self.redis_client = redis.Redis(
-                host='localhost',
-                port=6379,
-                db=0,
-                decode_responses=True,
+            self.redis_pool = aioredis.ConnectionPool.from_url(
+                self.config.market_data.redis_url,
+                max_connections=self.config.market_data.redis_max_connections,
                 socket_timeout=5
             )
+            self.redis_client = aioredis.Redis(connection_pool=self.redis_pool)
             # Test connection
-            await asyncio.get_event_loop().run_in_executor(
-                None, self.redis_client.ping
-            )
-            self.logger.info("Redis cache initialized successfully")
+            await self.redis_client.ping()
+            self.logger.info("Redis cache initialized successfully",
+                           max_connections=self.config.market_data.redis_max_connections)
         except Exception as e:
             self.logger.warning("Redis cache not available, using memory cache only", error=str(e))
-            self.redis_client = None
+            await self._close_redis()
+        
+        self.profile_cache.redis_client = self.redis_client
+        await self.profile_cache.load()
+        
+        if self.symbol_universe.path:
+            if await self.symbol_universe.load():
+                SymbolValidator.set_symbol_universe(self.symbol_universe)
+            self._universe_reload_task = asyncio.create_task(self._reload_symbol_universe())
+        
+        if self.config.market_data.streaming_enabled:
+            await self.start_streaming()
         
         self.logger.info("MarketDataService initialization complete")
     
     async def cleanup(self) -> None:
         """Clean up resources."""
+        await self.stop_streaming()
+        
+        if self._universe_reload_task:
+            self._universe_reload_task.cancel()
+            await asyncio.gather(self._universe_reload_task, return_exceptions=True)
+            self._universe_reload_task = None
+        if SymbolValidator.symbol_universe is self.symbol_universe:
+            SymbolValidator.set_symbol_universe(None)
+        
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self._refresh_tasks.values(), return_exceptions=True)
+        
+        await self.profile_cache.close()
+        
         if self.session:
             await self.session.close()
         
-        if self.redis_client:
-            self.redis_client.close()
+        await self._close_redis()
         
         self.logger.info("MarketDataService cleanup complete")
     
-    async def get_quote(self, symbol: str, use_cache: bool = True) -> MarketQuote:
+    async def _reload_symbol_universe(self) -> None:
+        """Pick up a replaced symbol master file while the service runs."""
+        while True:
+            await asyncio.sleep(self.config.market_data.symbol_universe_reload_seconds)
+            try:
+                if await self.symbol_universe.reload_if_changed():
+                    SymbolValidator.set_symbol_universe(self.symbol_universe)
+            except Exception as e:
+                self.logger.warning("Symbol universe reload failed", error=str(e))
+    
+    async def _close_redis(self) -> None:
+        """Close the Redis client and its connection pool."""
+        if self.redis_client:
+            await self.redis_client.aclose()
+        if self.redis_pool:
+            await self.redis_pool.disconnect()
+        self.redis_client = None
+        self.redis_pool = None
+    
+    async def start_streaming(self) -> None:
+        """Start streaming trades for watched symbols into the quote cache."""
+        if self.quote_stream is None:
+            self.quote_stream = QuoteStream(
+                url=self.config.market_data.streaming_url,
+                api_key=self.config.market_data.finnhub_api_key,
+                on_ticks=self._on_stream_ticks,
+                on_backfill=self._backfill_stream
+            )
+        
+        await self.quote_stream.set_symbols(self.streamed_symbols)
+        self.quote_stream.start(self.session)
+        self.logger.info("Quote streaming started", symbols=len(self.quote_stream.symbols))
+    
+    async def stop_streaming(self) -> None:
+        """Stop the trade feed; quotes fall back to REST polling."""
+        if self.quote_stream:
+            await self.quote_stream.stop()
+        
+        for task in list(self._listener_tasks):
+            task.cancel()
+        await asyncio.gather(*self._listener_tasks, return_exceptions=True)
+    
+    @property
+    def streamed_symbols(self) -> set:
+        """Union of symbols currently watched by any source."""
+        now = time.time()
+        symbols = set()
+        for watched, expires_at in self._stream_interest.values():
+            if expires_at is None or expires_at > now:
+                symbols |= watched
+        return symbols
+    
+    async def watch_symbols(self, source: str, symbols: List[str],
+                            ttl_seconds: Optional[float] = None) -> None:
+        """
+        Declare the symbols a source wants streamed, replacing its previous set.
+        
+        Sources are e.g. ``positions:<user_id>`` or ``modal:<view_id>``; the
+        stream follows the union over all sources.
+        
+        Args:
+            source: Identifier of the interested party
+            symbols: Symbols it wants streamed
+            ttl_seconds: Drop the interest after this long unless renewed
+        """
+        expires_at = time.time() + ttl_seconds if ttl_seconds else None
+        self._stream_interest[source] = (frozenset(s.upper().strip() for s in symbols), expires_at)
+        await self._update_stream_symbols()
+    
+    async def unwatch_symbols(self, source: str) -> None:
+        """
+        Withdraw a source's streaming interest.
+        
+        Args:
+            source: Identifier passed to watch_symbols
+        """
+        if self._stream_interest.pop(source, None) is not None:
+            await self._update_stream_symbols()
+    
+    async def _update_stream_symbols(self) -> None:
+        now = time.time()
+        self._stream_interest = {
+            source: (symbols, expires_at)
+            for source, (symbols, expires_at) in self._stream_interest.items()
+            if expires_at is None or expires_at > now
+        }
+        if self.quote_stream:
+            await self.quote_stream.set_symbols(self.streamed_symbols)
+    
+    def subscribe_quotes(self, callback: Callable[[MarketQuote], Any],
+                         symbols: Optional[List[str]] = None) -> Callable[[], None]:
+        """
+        Register an in-process listener for streamed quote updates.
+        
+        Args:
+            callback: Function or coroutine function called with each updated quote
+            symbols: Symbols to receive, or None for all
+            
+        Returns:
+            Function that removes the listener
+        """
+        self._listener_ids += 1
+        listener_id = self._listener_ids
+        wanted = frozenset(s.upper().strip() for s in symbols) if symbols else None
+        self._quote_listeners[listener_id] = (callback, wanted)
+        
+        return lambda: self._quote_listeners.pop(listener_id, None)
+    
+    def _notify_quote_listeners(self, quotes: List[MarketQuote]) -> None:
+        for callback, wanted in list(self._quote_listeners.values()):
+            for quote in quotes:
+                if wanted is not None and quote.symbol not in wanted:
+                    continue
+                try:
+                    result = callback(quote)
+                    if asyncio.iscoroutine(result):
+                        task = asyncio.ensure_future(result)
+                        self._listener_tasks.add(task)
+                        task.add_done_callback(self._on_listener_done)
+                except Exception as e:
+                    self.logger.warning("Quote listener failed", symbol=quote.symbol, error=str(e))
+    
+    def _on_listener_done(self, task: asyncio.Task) -> None:
+        self._listener_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            self.logger.warning("Quote listener failed", error=str(task.exception()))
+    
+    async def _on_stream_ticks(self, ticks: List[StreamTick]) -> None:
+        """Apply streamed trades to the quote cache and notify listeners."""
+        updated = {}
+        now = time.monotonic()
+        
+        for tick in ticks:
+            entry = self.memory_cache.get(tick.symbol)
+            base = entry[0] if entry else None
+            if base and base.source == STREAM_SOURCE and base.timestamp > tick.timestamp:
+                continue
+            
+            updated[tick.symbol] = self._quote_from_tick(tick, base)
+            self._stream_tick_times[tick.symbol] = now
+        
+        await self._cache_quotes(updated)
+        self._notify_quote_listeners(list(updated.values()))
+    
+    def _quote_from_tick(self, tick: StreamTick, base: Optional[MarketQuote]) -> MarketQuote:
+        """
+        Build the quote for a streamed trade.
+        
+        Args:
+            tick: Latest trade
+            base: Cached quote to carry session fields over from
+            
+        Returns:
+            MarketQuote at the traded price
+        """
+        if base is None:
+            profile = self.profile_cache.peek(tick.symbol)
+            return MarketQuote(
+                symbol=tick.symbol,
+                current_price=tick.price,
+                market_cap=profile.market_cap if profile else None,
+                timestamp=tick.timestamp,
+                market_status=self.current_market_status(),
+                data_quality=DataQuality.REAL_TIME,
+                exchange=profile.exchange if profile else None,
+                currency=profile.currency if profile else 'USD',
+                source=STREAM_SOURCE
+            )
+        
+        return replace(
+            base,
+            current_price=tick.price,
+            high_price=max(base.high_price, tick.price) if base.high_price else None,
+            low_price=min(base.low_price, tick.price) if base.low_price else None,
+            timestamp=tick.timestamp,
+            data_quality=DataQuality.REAL_TIME,
+            source=STREAM_SOURCE,
+            cache_hit=False,
+            api_latency_ms=None
+        )
+    
+    async def _backfill_stream(self, symbols: set) -> None:
+        """
+        Refresh streamed symbols over REST after a (re)connect or subscription.
+        
+        A symbol that receives a live trade while the request is in flight
+        keeps the streamed price.
+        
+        Args:
+            symbols: Symbols that may have missed trades
+        """
+        started = time.monotonic()
+        symbols = sorted(symbols)
+        outcomes = await asyncio.gather(
+            *(self._fetch_quote_shared(symbol, self._fetch_quote, RequestPriority.PREFETCH) for symbol in symbols),
+            return_exceptions=True
+        )
+        
+        backfilled = {}
+        for symbol, outcome in zip(symbols, outcomes):
+            if isinstance(outcome, BaseException):
+                self.logger.warning("Stream backfill failed", symbol=symbol, error=str(outcome))
+            elif self._stream_tick_times.get(symbol, 0) < started:
+                backfilled[symbol] = outcome[0]
+        
+        await self._cache_quotes(backfilled)
+        self._notify_quote_listeners(list(backfilled.values()))
+        self.logger.info("Stream backfill complete", requested=len(symbols), applied=len(backfilled))
+    
+    async def get_quote(self, symbol: str, use_cache: bool = True, require_fresh: bool = False,
+                        priority: RequestPriority = RequestPriority.DASHBOARD) -> MarketQuote:
         """
         Get real-time quote for a symbol.
         
+        Cache TTLs follow the current trading session (see quote_ttl_policy).
+        A cached quote that is no longer fresh but younger than the hard TTL
+        is returned immediately as DataQuality.DELAYED and refreshed in the
+        background, unless fresh data is required.
+        
         Args:
             symbol: Stock symbol (e.g., 'AAPL', 'MSFT')
             use_cache: Whether to use cached data if available
+            require_fresh: Whether to wait for a fetch instead of serving a
+                delayed quote (trade execution)
+            priority: Rate limit scheduling class for any API request
             
         Returns:
             MarketQuote: Comprehensive quote data
@@ -442,23 +1557,17 @@ class MarketDataService:
         # Check cache first if enabled
         if use_cache:
             cached_quote = await self._get_cached_quote(symbol)
-            if cached_quote and not cached_quote.is_stale:
-                self.cache_hit_counter.labels(cache_type='hit').inc()
-                self.logger.debug("Cache hit for symbol", symbol=symbol)
-                return cached_quote
+            if cached_quote:
+                served = self._serve_cached_quote(symbol, cached_quote, require_fresh)
+                if served:
+                    self.logger.debug("Cache hit for symbol", symbol=symbol,
+                                    data_quality=served.data_quality.value)
+                    return served
         
-        # Fetch from API with circuit breaker protection
+        # Fetch from API with circuit breaker protection, sharing any fetch
+        # already in flight for this symbol
         try:
-            quote = await self.circuit_breaker.call(self._fetch_quote_from_api, symbol)
-            
-            # Cache the result
-            await self._cache_quote(symbol, quote)
-            
-            self.logger.info("Quote fetched successfully", 
-                           symbol=symbol, 
-                           price=float(quote.current_price),
-                           data_quality=quote.data_quality.value)
-            
+            quote, _ = await self._fetch_quote_shared(symbol, self._fetch_and_cache_quote, priority)
             return quote
             
         except Exception as e:
@@ -468,19 +1577,21 @@ class MarketDataService:
             # Try to return stale cached data as fallback
             cached_quote = await self._get_cached_quote(symbol)
             if cached_quote:
-                cached_quote.data_quality = DataQuality.STALE
                 self.logger.warning("Returning stale cached data", symbol=symbol)
-                return cached_quote
+                return replace(cached_quote, data_quality=DataQuality.STALE)
             
             raise e
     
-    async def get_multiple_quotes(self, symbols: List[str], use_cache: bool = True) -> Dict[str, MarketQuote]:
+    async def get_multiple_quotes(self, symbols: List[str], use_cache: bool = True, require_fresh: bool = False,
+                                  priority: RequestPriority = RequestPriority.DASHBOARD) -> Dict[str, MarketQuote]:
         """
         Get quotes for multiple symbols efficiently.
         
         Args:
             symbols: List of stock symbols
             use_cache: Whether to use cached data if available
+            require_fresh: Whether to fetch instead of serving delayed quotes
+            priority: Rate limit scheduling class for API requests
             
         Returns:
             Dict mapping symbols to MarketQuote objects
@@ -489,27 +1600,62 @@ class MarketDataService:
             return {}
         
         # Normalize symbols
-        symbols = [s.upper().strip() for s in symbols]
-        
-        # Create tasks for concurrent fetching
-        tasks = []
+        symbols = list(dict.fromkeys(s.upper().strip() for s in symbols))
+        requested = len(symbols)
+        failed = []
         for symbol in symbols:
-            task = asyncio.create_task(self._safe_get_quote(symbol, use_cache))
-            tasks.append((symbol, task))
+            if not self._is_valid_symbol_format(symbol):
+                self.logger.error("Failed to fetch quote in batch", symbol=symbol, error="Invalid symbol format")
+                failed.append(symbol)
+        symbols = [s for s in symbols if self._is_valid_symbol_format(s)]
         
-        # Wait for all tasks to complete
+        # Resolve all cached symbols in one round trip
         results = {}
-        for symbol, task in tasks:
-            try:
-                quote = await task
-                results[symbol] = quote
-            except Exception as e:
-                self.logger.error("Failed to fetch quote in batch", symbol=symbol, error=str(e))
-                # Continue with other symbols
+        if use_cache:
+            for symbol, cached_quote in (await self._get_cached_quotes(symbols)).items():
+                served = self._serve_cached_quote(symbol, cached_quote, require_fresh)
+                if served:
+                    results[symbol] = served
+        
+        # Fetch the misses concurrently and write them back in one pipeline
+        misses = [s for s in symbols if s not in results]
+        outcomes = await asyncio.gather(
+            *(self._fetch_quote_shared(symbol, self._fetch_quote, priority) for symbol in misses),
+            return_exceptions=True
+        )
+        
+        fetched = {}
+        for symbol, outcome in zip(misses, outcomes):
+            if isinstance(outcome, BaseException):
+                self.api_error_counter.labels(error_type=type(outcome).__name__).inc()
+                self.logger.error("Failed to fetch quote in batch", symbol=symbol, error=str(outcome))
+                failed.append(symbol)
+                continue
+            
+            quote, shared = outcome
+            results[symbol] = quote
+            if not shared:
+                fetched[symbol] = quote
+        
+        await self._cache_quotes(fetched)
+        
+        # Fall back to stale cached data for symbols that could not be fetched,
+        # and to a placeholder quote when there is none
+        if failed:
+            for symbol, quote in (await self._get_cached_quotes(failed)).items():
+                results[symbol] = replace(quote, data_quality=DataQuality.STALE)
+            for symbol in failed:
+                if symbol not in results:
+                    results[symbol] = MarketQuote(
+                        symbol=symbol,
+                        current_price=Decimal('0.00'),
+                        data_quality=DataQuality.FALLBACK,
+                        timestamp=datetime.utcnow()
+                    )
         
         self.logger.info("Batch quote fetch complete", 
-                        requested=len(symbols), 
-                        successful=len(results))
+                        requested=requested, 
+                        successful=requested - len(failed))
         
         return results
     
@@ -528,16 +1674,17 @@ class MarketDataService:
         """
         symbol = symbol.upper().strip()
         
-        # Check symbol cache first
-        if symbol in self.symbol_cache and datetime.utcnow() < self.symbol_cache_expiry:
-            return self.symbol_cache[symbol]
+        if self.profile_cache.is_missing(symbol):
+            raise ValueError(f"Invalid or unknown symbol: {symbol}")
+        
+        if self.symbol_universe.is_loaded:
+            record = self.symbol_universe.get(symbol)
+            if record is None:
+                raise ValueError(f"Invalid or unknown symbol: {symbol}")
+            return await self.profile_cache.get(symbol) or _symbol_info_from_record(record)
         
-        # Fetch symbol information from API
         try:
-            symbol_info = await self.circuit_breaker.call(self._fetch_symbol_info, symbol)
-            
-            # Cache the result
-            self.symbol_cache[symbol] = symbol_info
+            symbol_info = await self.get_symbol_profile(symbol)
             
             self.logger.info("Symbol validated successfully", 
                            symbol=symbol, 
@@ -549,18 +1696,83 @@ class MarketDataService:
             self.logger.error("Symbol validation failed", symbol=symbol, error=str(e))
             raise ValueError(f"Invalid or unknown symbol: {symbol}")
     
+    async def get_symbol_profile(self, symbol: str) -> SymbolInfo:
+        """
+        Get a company profile from the profile cache, fetching it on a miss.
+        
+        Concurrent misses for one symbol share a single profile request.
+        
+        Args:
+            symbol: Stock symbol
+            
+        Returns:
+            SymbolInfo: Company profile
+            
+        Raises:
+            ValueError: If the symbol has no profile
+        """
+        symbol = symbol.upper().strip()
+        
+        profile = await self.profile_cache.get(symbol)
+        if profile is not None:
+            self.cache_hit_counter.labels(cache_type='profile').inc()
+            return profile
+        
+        profile, _ = await self.profile_flights.do(symbol, self._fetch_and_cache_profile, symbol)
+        return profile
+    
+    async def get_cached_profile(self, symbol: str) -> Optional[SymbolInfo]:
+        """
+        Get a company profile only if it is already cached.
+        
+        Args:
+            symbol: Stock symbol
+            
+        Returns:
+            Cached SymbolInfo or None
+        """
+        return await self.profile_cache.get(symbol.upper().strip())
+    
+    async def _fetch_and_cache_profile(self, symbol: str) -> SymbolInfo:
+        """Fetch a company profile from the API and cache it."""
+        try:
+            profile = await self.circuit_breakers['symbol_info'].call(self._fetch_symbol_info, symbol)
+        except ValueError:
+            self.profile_cache.mark_missing(symbol)
+            raise
+        
+        await self.profile_cache.put(profile)
+        return profile
+    
+    async def _get_profile_for_quote(self, symbol: str) -> Optional[SymbolInfo]:
+        """Get the profile used to enrich a quote; quotes are still served without one."""
+        if self.profile_cache.is_missing(symbol):
+            return None
+        
+        try:
+            return await self.get_symbol_profile(symbol)
+        except Exception as e:
+            self.logger.warning("Profile unavailable for quote", symbol=symbol, error=str(e))
+            return None
+    
     async def get_market_status(self, exchange: str = "US") -> MarketStatus:
         """
         Get current market status for an exchange.
         
+        US status comes from the local exchange calendar and costs no API
+        call; other exchanges are looked up through the API.
+        
         Args:
             exchange: Exchange code (default: "US")
             
         Returns:
             MarketStatus: Current market status
         """
+        if exchange == "US":
+            return self.current_market_status()
+        
         try:
-            status = await self.circuit_breaker.call(self._fetch_market_status, exchange)
+            status = await self.circuit_breakers['market_status'].call(self._fetch_market_status, exchange)
             
             self.logger.debug("Market status fetched", exchange=exchange, status=status.value)
             return status
@@ -573,6 +1785,9 @@ class MarketDataService:
         """
         Search for symbols matching a query.
         
+        Served from the local symbol universe when one is loaded, otherwise
+        through the API.
+        
         Args:
             query: Search query (company name or symbol)
             limit: Maximum number of results
@@ -583,8 +1798,11 @@ class MarketDataService:
         if not query or len(query.strip()) < 2:
             return []
         
+        if self.symbol_universe.is_loaded:
+            return [_symbol_info_from_record(record) for record in self.symbol_universe.search(query, limit)]
+        
         try:
-            results = await self.circuit_breaker.call(self._search_symbols_api, query, limit)
+            results = await self.circuit_breakers['search'].call(self._search_symbols_api, query, limit)
             
             self.logger.info("Symbol search completed", 
                            query=query, 
@@ -596,18 +1814,142 @@ class MarketDataService:
             self.logger.error("Symbol search failed", query=query, error=str(e))
             return []
     
-    async def _safe_get_quote(self, symbol: str, use_cache: bool = True) -> MarketQuote:
-        """Safely get quote with error handling for batch operations."""
+    def current_market_status(self) -> MarketStatus:
+        """US market status from the local exchange calendar."""
+        return _SESSION_STATUS[self.market_calendar.session_at().session]
+    
+    def quote_ttl_policy(self) -> QuoteTTLPolicy:
+        """
+        Quote cache TTLs for the current trading session.
+        
+        Regular hours use the short configured TTLs and extended hours the
+        longer extended TTLs. While the market is closed prices cannot move, so
+        a quote fetched after the close stays fresh until the next session.
+        In every session, quotes fetched before the session started are stale.
+        
+        Returns:
+            QuoteTTLPolicy: TTLs in effect now
+        """
+        window = self.market_calendar.session_at()
+        config = self.config.market_data
+        
+        if window.session == TradingSession.REGULAR:
+            return QuoteTTLPolicy(window, config.cache_ttl_seconds, config.cache_hard_ttl_seconds, window.start_utc)
+        if window.is_trading:
+            return QuoteTTLPolicy(window, config.cache_extended_ttl_seconds,
+                                  config.cache_extended_hard_ttl_seconds, window.start_utc)
+        return QuoteTTLPolicy(window, None, config.cache_closed_hard_ttl_seconds,
+                              window.start_utc + _CLOSE_SETTLE)
+    
+    def _quote_ttl_status(self) -> Dict[str, Any]:
+        """Current trading session and quote TTLs for monitoring."""
+        policy = self.quote_ttl_policy()
+        return {
+            'session': policy.window.session.value,
+            'session_ends': policy.window.end.isoformat(),
+            'soft_ttl_seconds': policy.soft_ttl,
+            'hard_ttl_seconds': policy.hard_ttl,
+            'fresh_after': policy.fresh_after.isoformat()
+        }
+    
+    def _serve_cached_quote(self, symbol: str, quote: MarketQuote,
+                            require_fresh: bool) -> Optional[MarketQuote]:
+        """
+        Apply the session's soft/hard TTL policy to a cached quote.
+        
+        Args:
+            symbol: Stock symbol
+            quote: Cached quote
+            require_fresh: Whether only fresh quotes may be served
+            
+        Returns:
+            Quote to serve, or None if it must be fetched
+        """
+        policy = self.quote_ttl_policy()
+        age = quote.age_seconds
+        if policy.is_fresh(quote):
+            self.cache_hit_counter.labels(cache_type='hit').inc()
+            return quote
+        
+        if require_fresh or age >= policy.hard_ttl:
+            return None
+        
+        self.cache_hit_counter.labels(cache_type='stale_while_revalidate').inc()
+        self._schedule_refresh(symbol)
+        return replace(quote, data_quality=DataQuality.DELAYED)
+    
+    def _schedule_refresh(self, symbol: str) -> None:
+        """Start a background refresh for a symbol unless one is running."""
+        if symbol in self._refresh_tasks:
+            return
+        
+        task = asyncio.create_task(self._refresh_quote(symbol))
+        self._refresh_tasks[symbol] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(symbol, None))
+    
+    async def _refresh_quote(self, symbol: str) -> None:
+        """Refresh a cached quote in the background."""
         try:
-            return await self.get_quote(symbol, use_cache)
+            await self._fetch_quote_shared(symbol, self._fetch_and_cache_quote, RequestPriority.PREFETCH)
         except Exception as e:
-            # Return a fallback quote for failed requests
-            return MarketQuote(
-                symbol=symbol,
-                current_price=Decimal('0.00'),
-                data_quality=DataQuality.FALLBACK,
-                timestamp=datetime.utcnow()
-            )
+            self.api_error_counter.labels(error_type=type(e).__name__).inc()
+            self.logger.warning("Background quote refresh failed", symbol=symbol, error=str(e))
+    
+    async def _fetch_quote_shared(self, symbol: str, fetch: Callable,
+                                  priority: RequestPriority) -> Tuple[MarketQuote, bool]:
+        """
+        Fetch a quote through the single-flight group for its symbol.
+        
+        A fetch started here runs at the given priority. Joining a fetch that
+        is still queued for a rate limit token promotes it to that priority.
+        
+        Args:
+            symbol: Stock symbol
+            fetch: Coroutine function run if no fetch is already in flight
+            priority: Rate limit scheduling class
+            
+        Returns:
+            Tuple of (quote, whether it came from another caller's fetch)
+        """
+        if symbol in self.quote_flights:
+            self.rate_limiter.promote(f"quote:{symbol}", priority)
+        
+        token = request_priority.set(priority)
+        try:
+            quote, shared = await self.quote_flights.do(symbol, fetch, symbol)
+        finally:
+            request_priority.reset(token)
+        self.quote_fetch_counter.labels(outcome='coalesced' if shared else 'originated').inc()
+        
+        if shared:
+            self.logger.debug("Joined in-flight quote fetch", symbol=symbol)
+        else:
+            self.logger.info("Quote fetched successfully", 
+                           symbol=symbol, 
+                           price=float(quote.current_price),
+                           data_quality=quote.data_quality.value)
+        
+        return quote, shared
+    
+    async def _fetch_quote(self, symbol: str) -> MarketQuote:
+        """Fetch a quote from the API with circuit breaker protection."""
+        return await self.circuit_breakers['quote'].call(self._fetch_quote_from_api, symbol)
+    
+    async def _fetch_and_cache_quote(self, symbol: str) -> MarketQuote:
+        """
+        Fetch a quote from the API and cache it.
+        
+        Runs once per single-flight group; all coalesced callers share the result.
+        
+        Args:
+            symbol: Stock symbol
+            
+        Returns:
+            MarketQuote: Freshly fetched quote
+        """
+        quote = await self._fetch_quote(symbol)
+        await self._cache_quote(symbol, quote)
+        return quote
     
     @retry(
         stop=stop_after_attempt(3),
@@ -631,45 +1973,24 @@ class MarketDataService:
         if not self.session:
             raise Exception("HTTP session not initialized")
         
-        # Wait for rate limit token
-        await self.rate_limiter.wait_for_token()
-        
         start_time = time.time()
         
         try:
-            # Fetch real-time quote
-            quote_url = f"https://finnhub.io/api/v1/quote"
-            quote_params = {
-                'symbol': symbol,
-                'token': self.config.market_data.finnhub_api_key
-            }
-            
-            async with self.session.get(quote_url, params=quote_params) as response:
-                if response.status == 429:
-                    self.api_error_counter.labels(error_type='rate_limit').inc()
-                    raise Exception("Rate limit exceeded")
-                
-                if response.status != 200:
-                    self.api_error_counter.labels(error_type='http_error').inc()
-                    raise Exception(f"API request failed with status {response.status}")
-                
-                quote_data = await response.json()
-            
-            # Fetch company profile for additional data
-            profile_url = f"https://finnhub.io/api/v1/stock/profile2"
-            profile_params = {
-                'symbol': symbol,
-                'token': self.config.market_data.finnhub_api_key
-            }
-            
-            async with self.session.get(profile_url, params=profile_params) as response:
-                profile_data = await response.json() if response.status == 200 else {}
+            # Only /quote is requested per refresh; the profile comes from its own
+            # long-lived cache and is fetched alongside the first quote on a miss
+            profile = self.profile_cache.peek(symbol)
+            if profile is None:
+                quote_data, profile = await asyncio.gather(
+                    self._request_quote(symbol), self._get_profile_for_quote(symbol)
+                )
+            else:
+                quote_data = await self._request_quote(symbol)
             
             # Calculate API latency
             api_latency = (time.time() - start_time) * 1000
             
             # Build MarketQuote object
-            quote = self._build_market_quote(symbol, quote_data, profile_data, api_latency)
+            quote = self._build_market_quote(symbol, quote_data, profile, api_latency)
             
             self.request_counter.labels(endpoint='quote', status='success').inc()
             self.request_duration.labels(endpoint='quote').observe(time.time() - start_time)
@@ -681,6 +2002,36 @@ class MarketDataService:
             self.logger.error("API request failed", symbol=symbol, error=str(e))
             raise e
     
+    async def _request_quote(self, symbol: str) -> Dict[str, Any]:
+        """
+        Request raw quote data from the Finnhub /quote endpoint.
+        
+        Args:
+            symbol: Stock symbol
+            
+        Returns:
+            Quote response payload
+        """
+        # Wait for rate limit token
+        await self.rate_limiter.wait_for_token(key=f"quote:{symbol}")
+        
+        quote_url = f"{self.config.market_data.finnhub_base_url}/quote"
+        quote_params = {
+            'symbol': symbol,
+            'token': self.config.market_data.finnhub_api_key
+        }
+        
+        async with self.session.get(quote_url, params=quote_params) as response:
+            if response.status == 429:
+                self.api_error_counter.labels(error_type='rate_limit').inc()
+                raise Exception("Rate limit exceeded")
+            
+            if response.status != 200:
+                self.api_error_counter.labels(error_type='http_error').inc()
+                raise Exception(f"API request failed with status {response.status}")
+            
+            return await response.json()
+    
     async def _fetch_symbol_info(self, symbol: str) -> SymbolInfo:
         """
         Fetch symbol information from Finnhub API.
@@ -698,7 +2049,7 @@ class MarketDataService:
         
         try:
             # Fetch company profile
-            url = f"https://finnhub.io/api/v1/stock/profile2"
+            url = f"{self.config.market_data.finnhub_base_url}/stock/profile2"
             params = {
                 'symbol': symbol,
                 'token': self.config.market_data.finnhub_api_key
@@ -746,7 +2097,7 @@ class MarketDataService:
         await self.rate_limiter.wait_for_token()
         
         try:
-            url = f"https://finnhub.io/api/v1/stock/market-status"
+            url = f"{self.config.market_data.finnhub_base_url}/stock/market-status"
             params = {
                 'exchange': exchange,
                 'token': self.config.market_data.finnhub_api_key
@@ -784,7 +2135,7 @@ class MarketDataService:
         await self.rate_limiter.wait_for_token()
         
         try:
-            url = f"https://finnhub.io/api/v1/search"
+            url = f"{self.config.market_data.finnhub_base_url}/search"
             params = {
                 'q': query,
                 'token': self.config.market_data.finnhub_api_key
@@ -814,14 +2165,15 @@ class MarketDataService:
             self.logger.error("Symbol search API failed", query=query, error=str(e))
             return []
     
-    def _build_market_quote(self, symbol: str, quote_data: Dict, profile_data: Dict, api_latency: float) -> MarketQuote:
+    def _build_market_quote(self, symbol: str, quote_data: Dict, profile: Optional[SymbolInfo],
+                            api_latency: float) -> MarketQuote:
         """
         Build MarketQuote object from API response data.
         
         Args:
             symbol: Stock symbol
             quote_data: Quote data from API
-            profile_data: Profile data from API
+            profile: Cached company profile, if known
             api_latency: API request latency in milliseconds
             
         Returns:
@@ -840,12 +2192,12 @@ class MarketDataService:
                 low_price=Decimal(str(quote_data.get('l', 0))) if quote_data.get('l') else None,
                 previous_close=Decimal(str(quote_data.get('pc', 0))) if quote_data.get('pc') else None,
                 volume=None,  # Not provided in basic quote
-                market_cap=profile_data.get('marketCapitalization'),
+                market_cap=profile.market_cap if profile else None,
                 timestamp=datetime.utcnow(),
-                market_status=MarketStatus.UNKNOWN,  # Would need separate call
+                market_status=self.current_market_status(),
                 data_quality=DataQuality.REAL_TIME,
-                exchange=profile_data.get('exchange', ''),
-                currency=profile_data.get('currency', 'USD'),
+                exchange=profile.exchange if profile else '',
+                currency=profile.currency if profile else 'USD',
                 source='finnhub',
                 cache_hit=False,
                 api_latency_ms=api_latency
@@ -865,35 +2217,61 @@ class MarketDataService:
         Returns:
             Cached MarketQuote or None if not found
         """
+        return (await self._get_cached_quotes([symbol])).get(symbol)
+    
+    async def _get_cached_quotes(self, symbols: List[str]) -> Dict[str, MarketQuote]:
+        """
+        Get cached quotes for several symbols with a single Redis MGET.
+        
+        Symbols missing from Redis fall back to the memory cache.
+        
+        Args:
+            symbols: Stock symbols
+            
+        Returns:
+            Dict mapping symbols to cached MarketQuote objects
+        """
+        quotes: Dict[str, MarketQuote] = {}
+        if not symbols:
+            return quotes
+        
         # Try Redis cache first
         if self.redis_client:
             try:
-                cached_data = await asyncio.get_event_loop().run_in_executor(
-                    None, self.redis_client.get, f"quote:{symbol}"
-                )
+                payloads = await self.redis_client.mget([f"quote:{symbol}" for symbol in symbols])
                 
-                if cached_data:
-                    quote_dict = json.loads(cached_data)
-                    quote = self._dict_to_market_quote(quote_dict)
+                for symbol, payload in zip(symbols, payloads):
+                    if not payload:
+                        continue
+                    try:
+                        quote = MarketQuote.unpack(payload)
+                    except ValueError as e:
+                        self.logger.debug("Ignoring unreadable cached quote", symbol=symbol, error=str(e))
+                        continue
                     quote.cache_hit = True
-                    return quote
+                    quotes[symbol] = quote
                     
             except Exception as e:
-                self.logger.warning("Redis cache read failed", symbol=symbol, error=str(e))
+                self.logger.warning("Redis cache read failed", symbols=len(symbols), error=str(e))
         
         # Try memory cache
-        if symbol in self.memory_cache:
+        hard_ttl = self.quote_ttl_policy().hard_ttl
+        now = datetime.utcnow()
+        for symbol in symbols:
+            if symbol in quotes or symbol not in self.memory_cache:
+                continue
+            
             quote, cached_time = self.memory_cache[symbol]
             
-            # Check if cache entry is still valid (5 minutes)
-            if datetime.utcnow() - cached_time < timedelta(minutes=5):
+            # Check if cache entry is still within the hard TTL
+            if now - cached_time < timedelta(seconds=hard_ttl):
                 quote.cache_hit = True
-                return quote
+                quotes[symbol] = quote
             else:
                 # Remove stale entry
                 del self.memory_cache[symbol]
         
-        return None
+        return quotes
     
     async def _cache_quote(self, symbol: str, quote: MarketQuote) -> None:
         """
@@ -903,22 +2281,33 @@ class MarketDataService:
             symbol: Stock symbol
             quote: MarketQuote to cache
         """
-        # Cache in Redis with 5-minute expiration
+        await self._cache_quotes({symbol: quote})
+    
+    async def _cache_quotes(self, quotes: Dict[str, MarketQuote]) -> None:
+        """
+        Cache several quotes in Redis with one pipelined round trip, and in memory.
+        
+        Args:
+            quotes: Dict mapping symbols to quotes to cache
+        """
+        if not quotes:
+            return
+        
+        # Cache in Redis until the session's hard TTL
+        hard_ttl = self.quote_ttl_policy().hard_ttl
         if self.redis_client:
             try:
-                quote_dict = quote.to_dict()
-                await asyncio.get_event_loop().run_in_executor(
-                    None, 
-                    self.redis_client.setex,
-                    f"quote:{symbol}",
-                    300,  # 5 minutes
-                    json.dumps(quote_dict)
-                )
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for symbol, quote in quotes.items():
+                        pipe.setex(f"quote:{symbol}", hard_ttl, quote.pack())
+                    await pipe.execute()
             except Exception as e:
-                self.logger.warning("Redis cache write failed", symbol=symbol, error=str(e))
+                self.logger.warning("Redis cache write failed", symbols=len(quotes), error=str(e))
         
         # Cache in memory as backup
-        self.memory_cache[symbol] = (quote, datetime.utcnow())
+        now = datetime.utcnow()
+        for symbol, quote in quotes.items():
+            self.memory_cache[symbol] = (quote, now)
         
         # Limit memory cache size
         if len(self.memory_cache) > 1000:
@@ -931,37 +2320,6 @@ class MarketDataService:
             for old_symbol in oldest_symbols:
                 del self.memory_cache[old_symbol]
     
-    def _dict_to_market_quote(self, data: Dict) -> MarketQuote:
-        """
-        Convert dictionary back to MarketQuote object.
-        
-        Args:
-            data: Dictionary representation of MarketQuote
-            
-        Returns:
-            MarketQuote object
-        """
-        return MarketQuote(
-            symbol=data['symbol'],
-            current_price=Decimal(str(data['current_price'])),
-            open_price=Decimal(str(data['open_price'])) if data.get('open_price') else None,
-            high_price=Decimal(str(data['high_price'])) if data.get('high_price') else None,
-            low_price=Decimal(str(data['low_price'])) if data.get('low_price') else None,
-            previous_close=Decimal(str(data['previous_close'])) if data.get('previous_close') else None,
-            volume=data.get('volume'),
-            market_cap=data.get('market_cap'),
-            pe_ratio=Decimal(str(data['pe_ratio'])) if data.get('pe_ratio') else None,
-            timestamp=datetime.fromisoformat(data['timestamp']),
-            market_status=MarketStatus(data['market_status']),
-            data_quality=DataQuality(data['data_quality']),
-            exchange=data.get('exchange', ''),
-            currency=data.get('currency', 'USD'),
-            timezone=data.get('timezone', 'America/New_York'),
-            source=data.get('source', 'finnhub'),
-            cache_hit=data.get('cache_hit', False),
-            api_latency_ms=data.get('api_latency_ms')
-        )
-    
     def _is_valid_symbol_format(self, symbol: str) -> bool:
         """
         Validate symbol format.
@@ -991,20 +2349,26 @@ class MarketDataService:
             'status': 'healthy',
             'timestamp': datetime.utcnow().isoformat(),
             'circuit_breaker_state': self.circuit_breaker.state,
+            'circuit_breakers': {
+                endpoint: breaker.get_state() for endpoint, breaker in self.circuit_breakers.items()
+            },
             'cache_status': {
                 'redis_available': self.redis_client is not None,
                 'memory_cache_size': len(self.memory_cache)
             },
-            'rate_limiter': {
-                'tokens_available': self.rate_limiter.tokens,
-                'max_requests': self.rate_limiter.max_requests
-            }
+            'rate_limiter': self.rate_limiter.get_stats(),
+            'quote_fetches': self.quote_flights.get_stats(),
+            'background_refreshes': len(self._refresh_tasks),
+            'quote_ttl': self._quote_ttl_status(),
+            'streaming': self.quote_stream.get_stats() if self.quote_stream else {'enabled': False},
+            'profile_cache': self.profile_cache.get_stats(),
+            'symbol_universe': self.symbol_universe.get_stats()
         }
         
         # Test API connectivity
         try:
             if self.session:
-                test_url = "https://finnhub.io/api/v1/quote"
+                test_url = f"{self.config.market_data.finnhub_base_url}/quote"
                 test_params = {
                     'symbol': 'AAPL',
                     'token': self.config.market_data.finnhub_api_key
@@ -0,0 +1,336 @@
+"""
+In-memory limit order book for resting simulated orders.
+
+Keeps one book per symbol with buy and sell price levels in price-time
+priority: each level is a FIFO queue of orders, and the best level on each
+side is found through a heap of level prices. Inserting an order is O(log n)
+in the number of price levels and cancelling is O(1); emptied levels are
+dropped from the heap lazily when they reach the top, and the heap is rebuilt
+once such stale entries outnumber the live levels. Cancelled stops are
+dropped from their trigger heaps the same way.
+
+An incoming limit order first matches resting orders on the other side that
+it crosses, at their prices, and rests whatever is left. Resting orders are
+also matched against market prices (quotes or trade ticks): a resting buy
+fills when the market trades at or below its limit and a resting sell when it
+trades at or above it, at the market price. Stop orders wait in trigger heaps
+and, once the market trades through their stop price, either fill at the
+market price (stop) or are submitted at their limit (stop-limit).
+
+Prices are held as integer ticks internally and converted back to Decimal
+only for reported fills.
+"""
+
+import heapq
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+# Internal price resolution: 1/10,000 of a dollar
+_TICKS_PER_UNIT = 10000
+_CENT = Decimal('0.01')
+
+
+def _to_ticks(price: Decimal) -> int:
+    return int((price * _TICKS_PER_UNIT).to_integral_value())
+
+
+def _to_price(ticks: int) -> Decimal:
+    price = Decimal(ticks).scaleb(-4)
+    # Whole-cent prices are reported in cents, finer ones at full resolution
+    return price.quantize(_CENT) if ticks % 100 == 0 else price
+
+
+@dataclass(frozen=True)
+class BookFill:
+    """A fill of a resting or triggered order."""
+    order_id: str
+    quantity: int
+    price: Decimal
+    remaining: int
+
+
+class _Order:
+    __slots__ = ('order_id', 'is_buy', 'price', 'remaining', 'limit')
+    
+    def __init__(self, order_id: str, is_buy: bool, price: int, remaining: int, limit: Optional[int] = None):
+        self.order_id = order_id
+        self.is_buy = is_buy
+        self.price = price
+        self.remaining = remaining
+        self.limit = limit
+
+
+class _Side:
+    """Price levels of one side of the book."""
+    
+    __slots__ = ('is_buy', 'levels', 'heap')
+    
+    def __init__(self, is_buy: bool):
+        self.is_buy = is_buy
+        # Level price -> orders at that price in arrival order (dicts keep insertion order)
+        self.levels: Dict[int, Dict[str, _Order]] = {}
+        # Level prices, negated for buys so the heap top is always the best price
+        self.heap: List[int] = []
+    
+    def add(self, order: _Order) -> None:
+        level = self.levels.get(order.price)
+        if level is None:
+            level = self.levels[order.price] = {}
+            heapq.heappush(self.heap, -order.price if self.is_buy else order.price)
+        level[order.order_id] = order
+    
+    def remove(self, order: _Order) -> None:
+        level = self.levels[order.price]
+        del level[order.order_id]
+        if not level:
+            del self.levels[order.price]
+            # Heap entries without a level are stale; rebuild before they dominate
+            if len(self.heap) - len(self.levels) > len(self.levels):
+                self.heap = [-price if self.is_buy else price for price in self.levels]
+                heapq.heapify(self.heap)
+    
+    def best(self) -> Optional[int]:
+        heap = self.heap
+        while heap:
+            price = -heap[0] if self.is_buy else heap[0]
+            if price in self.levels:
+                return price
+            heapq.heappop(heap)
+        return None
+    
+    def pop_best_level(self) -> None:
+        del self.levels[self.best()]
+        heapq.heappop(self.heap)
+
+
+class OrderBook:
+    """
+    Resting limit and stop orders for one symbol.
+    
+    Usage:
+        book = OrderBook('AAPL')
+        book.add_limit('O1', 'buy', Decimal('189.50'), 300)
+        fills = book.match(Decimal('189.45'), volume=100)
+    """
+    
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self._bids = _Side(is_buy=True)
+        self._asks = _Side(is_buy=False)
+        self._orders: Dict[str, _Order] = {}
+        self._stops: Dict[str, _Order] = {}
+        # Trigger heaps of (stop price, arrival, order id); buy stops trigger
+        # at or above their price, sell stops at or below
+        self._buy_stops: List[Tuple[int, int, str]] = []
+        self._sell_stops: List[Tuple[int, int, str]] = []
+        # Cancelled stops still in each trigger heap, keyed by is_buy
+        self._stale_stops = {True: 0, False: 0}
+        self._arrivals = 0
+    
+    def __len__(self) -> int:
+        return len(self._orders) + len(self._stops)
+    
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._orders or order_id in self._stops
+    
+    def add_limit(self, order_id: str, side: str, price: Decimal, quantity: int) -> List[BookFill]:
+        """
+        Submit a limit order.
+        
+        The order fills against crossing resting orders first; the remainder
+        rests at the back of its price level.
+        
+        Args:
+            order_id: Unique order identifier
+            side: 'buy' or 'sell'
+            price: Limit price
+            quantity: Order quantity
+        
+        Returns:
+            Fills of the incoming and resting orders, in execution order
+        """
+        self._check_new(order_id, quantity)
+        fills: List[BookFill] = []
+        self._submit(_Order(order_id, side.lower() == 'buy', _to_ticks(price), quantity), fills)
+        return fills
+    
+    def add_stop(self, order_id: str, side: str, stop_price: Decimal, quantity: int,
+                 limit_price: Optional[Decimal] = None) -> None:
+        """
+        Hold a stop order until the market trades through its stop price.
+        
+        Args:
+            order_id: Unique order identifier
+            side: 'buy' or 'sell'
+            stop_price: Trigger price
+            quantity: Order quantity
+            limit_price: Limit to rest at once triggered (None for a stop-market order)
+        """
+        self._check_new(order_id, quantity)
+        order = _Order(order_id, side.lower() == 'buy', _to_ticks(stop_price), quantity,
+                       _to_ticks(limit_price) if limit_price is not None else None)
+        self._stops[order_id] = order
+        self._arrivals += 1
+        if order.is_buy:
+            heapq.heappush(self._buy_stops, (order.price, self._arrivals, order_id))
+        else:
+            heapq.heappush(self._sell_stops, (-order.price, self._arrivals, order_id))
+    
+    def cancel(self, order_id: str) -> Optional[int]:
+        """
+        Remove an order from the book.
+        
+        Args:
+            order_id: Order to cancel
+        
+        Returns:
+            Quantity that was still open, or None if the order is not in the book
+        """
+        order = self._orders.pop(order_id, None)
+        if order is not None:
+            (self._bids if order.is_buy else self._asks).remove(order)
+            return order.remaining
+        
+        order = self._stops.pop(order_id, None)
+        if order is None:
+            return None
+        
+        # Cancelled stops leave stale trigger heap entries behind; drop them
+        # once they outnumber the live stops on that side
+        heap = self._buy_stops if order.is_buy else self._sell_stops
+        self._stale_stops[order.is_buy] += 1
+        if self._stale_stops[order.is_buy] > len(heap) - self._stale_stops[order.is_buy]:
+            heap[:] = [entry for entry in heap if entry[2] in self._stops]
+            heapq.heapify(heap)
+            self._stale_stops[order.is_buy] = 0
+        return order.remaining
+    
+    def match(self, price: Decimal, volume: Optional[int] = None) -> List[BookFill]:
+        """
+        Match the book against a market trade or quote.
+        
+        Stops triggered by the price are handled first, then resting orders
+        that the price crosses fill in price-time priority. Crossed orders
+        fill at the market price, which is at or better than their limit.
+        
+        Args:
+            price: Market price
+            volume: Quantity available at that price (None for unlimited)
+        
+        Returns:
+            Fills in execution order
+        """
+        ticks = _to_ticks(price)
+        available = volume if volume is not None else -1
+        fills: List[BookFill] = []
+        
+        for stop in self._triggered_stops(ticks):
+            del self._stops[stop.order_id]
+            if stop.limit is not None:
+                stop.price, stop.limit = stop.limit, None
+            else:
+                if available:
+                    quantity = stop.remaining if available < 0 else min(stop.remaining, available)
+                    available = self._fill(stop, quantity, ticks, fills, available)
+                if not stop.remaining:
+                    continue
+                # Stop-market quantity the market could not absorb becomes a
+                # limit order at the triggering price
+                stop.price = ticks
+            self._submit(stop, fills)
+        
+        for side in (self._bids, self._asks):
+            while available:
+                best = side.best()
+                if best is None or (best < ticks if side.is_buy else best > ticks):
+                    break
+                level = side.levels[best]
+                while level and available:
+                    order = next(iter(level.values()))
+                    quantity = order.remaining if available < 0 else min(order.remaining, available)
+                    available = self._fill(order, quantity, ticks, fills, available)
+                    if not order.remaining:
+                        del level[order.order_id]
+                        del self._orders[order.order_id]
+                if not level:
+                    side.pop_best_level()
+        
+        return fills
+    
+    def best_bid(self) -> Optional[Decimal]:
+        """Highest resting buy price."""
+        best = self._bids.best()
+        return _to_price(best) if best is not None else None
+    
+    def best_ask(self) -> Optional[Decimal]:
+        """Lowest resting sell price."""
+        best = self._asks.best()
+        return _to_price(best) if best is not None else None
+    
+    def depth(self, levels: int = 5) -> Dict[str, List[Tuple[Decimal, int]]]:
+        """
+        Aggregated open quantity at the best price levels.
+        
+        Args:
+            levels: Number of levels per side
+        
+        Returns:
+            Dict with 'bids' and 'asks' lists of (price, quantity), best first
+        """
+        def side_depth(side: _Side) -> List[Tuple[Decimal, int]]:
+            prices = sorted(side.levels, reverse=side.is_buy)[:levels]
+            return [(_to_price(p), sum(o.remaining for o in side.levels[p].values())) for p in prices]
+        
+        return {'bids': side_depth(self._bids), 'asks': side_depth(self._asks)}
+    
+    def _check_new(self, order_id: str, quantity: int) -> None:
+        if quantity <= 0:
+            raise ValueError(f"Order quantity must be positive: {quantity}")
+        if order_id in self:
+            raise ValueError(f"Duplicate order id: {order_id}")
+    
+    def _submit(self, order: _Order, fills: List[BookFill]) -> None:
+        """Cross an order against the other side of the book, then rest the remainder."""
+        opposite = self._asks if order.is_buy else self._bids
+        while order.remaining:
+            best = opposite.best()
+            if best is None or (best > order.price if order.is_buy else best < order.price):
+                break
+            level = opposite.levels[best]
+            while level and order.remaining:
+                resting = next(iter(level.values()))
+                quantity = min(order.remaining, resting.remaining)
+                self._fill(order, quantity, best, fills, -1)
+                self._fill(resting, quantity, best, fills, -1)
+                if not resting.remaining:
+                    del level[resting.order_id]
+                    del self._orders[resting.order_id]
+            if not level:
+                opposite.pop_best_level()
+        
+        if order.remaining:
+            self._orders[order.order_id] = order
+            (self._bids if order.is_buy else self._asks).add(order)
+    
+    def _fill(self, order: _Order, quantity: int, ticks: int, fills: List[BookFill], available: int) -> int:
+        order.remaining -= quantity
+        fills.append(BookFill(order.order_id, quantity, _to_price(ticks), order.remaining))
+        return available if available < 0 else available - quantity
+    
+    def _triggered_stops(self, ticks: int) -> List[_Order]:
+        triggered = []
+        for heap, is_buy in ((self._buy_stops, True), (self._sell_stops, False)):
+            while heap:
+                stop_ticks = heap[0][0] if is_buy else -heap[0][0]
+                if (stop_ticks > ticks) if is_buy else (stop_ticks < ticks):
+                    break
+                _, arrival, order_id = heapq.heappop(heap)
+                order = self._stops.get(order_id)
+                if order is not None:
+                    triggered.append((arrival, order))
+                elif self._stale_stops[is_buy]:
+                    self._stale_stops[is_buy] -= 1
+        
+        # Stops triggered by the same price keep their arrival order
+        return [order for _, order in sorted(triggered, key=lambda item: item[0])]
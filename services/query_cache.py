@@ -0,0 +1,253 @@
+"""
+Bounded TTL + LRU query cache for the database service.
+
+This module provides the in-process cache used by DatabaseService to hold
+query results. All lookups, inserts and evictions are O(1): entries live in an
+insertion-ordered dictionary that doubles as the LRU list, and a secondary index
+maps each user ID to the cache keys holding that user's data so that write paths
+can invalidate a single user's entries without scanning the whole cache.
+"""
+
+import logging
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Set
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """Single cached value with expiry and accounting metadata."""
+    value: Any
+    expires_at: float
+    size_bytes: int
+    operation: str
+    user_id: Optional[str] = None
+
+
+class QueryCache:
+    """
+    In-memory query result cache with per-entry TTL and LRU eviction.
+
+    Features:
+    - O(1) get, put, delete and eviction
+    - Per-entry TTL with a configurable default
+    - Bounds on both entry count and approximate size in bytes
+    - user_id -> keys index for targeted invalidation
+    - Per-operation hit/miss counters
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 16 * 1024 * 1024,
+                 default_ttl: float = 300):
+        """
+        Initialize the query cache.
+
+        Args:
+            max_entries: Maximum number of cached entries
+            max_bytes: Maximum approximate total size of cached values in bytes
+            default_ttl: Default time-to-live in seconds
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._user_index: Dict[str, Set[str]] = {}
+        self._total_bytes = 0
+
+        self._operation_stats: Dict[str, Dict[str, int]] = {}
+        self._stats = {
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        """Approximate size of all cached values in bytes."""
+        return self._total_bytes
+
+    def get(self, key: str, operation: Optional[str] = None) -> Optional[Any]:
+        """
+        Get a cached value and mark it as most recently used.
+
+        Args:
+            key: Cache key
+            operation: Operation name used for hit/miss accounting
+
+        Returns:
+            Cached value, or None on miss or expiry
+        """
+        operation = operation or 'unknown'
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._record(operation, 'hits')
+                return entry.value
+
+            self._remove(key)
+            self._stats['expirations'] += 1
+
+        self._record(operation, 'misses')
+        return None
+
+    def put(self, key: str, value: Any, operation: Optional[str] = None,
+            user_id: Optional[str] = None, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting least recently used entries if over budget.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            operation: Operation that produced the value
+            user_id: Owning user, indexed for invalidation
+            ttl: Time-to-live in seconds (defaults to default_ttl)
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        size_bytes = _estimate_size(value)
+        if size_bytes > self.max_bytes:
+            logger.debug(f"Skipping cache for {key}: {size_bytes} bytes exceeds cache budget")
+            return
+
+        entry = CacheEntry(
+            value=value,
+            expires_at=time.monotonic() + (self.default_ttl if ttl is None else ttl),
+            size_bytes=size_bytes,
+            operation=operation or 'unknown',
+            user_id=user_id
+        )
+        self._entries[key] = entry
+        self._total_bytes += size_bytes
+
+        if user_id is not None:
+            self._user_index.setdefault(user_id, set()).add(key)
+
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._stats['evictions'] += 1
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Remove a single key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was removed
+        """
+        if key not in self._entries:
+            return False
+
+        self._remove(key)
+        self._stats['invalidations'] += 1
+        return True
+
+    def invalidate_user(self, user_id: str, operations: Optional[Iterable[str]] = None) -> int:
+        """
+        Remove all entries indexed under a user.
+
+        Args:
+            user_id: User whose entries should be removed
+            operations: Restrict invalidation to these operations
+
+        Returns:
+            Number of entries removed
+        """
+        keys = self._user_index.get(user_id)
+        if not keys:
+            return 0
+
+        operation_filter = set(operations) if operations is not None else None
+        removed = 0
+
+        for key in list(keys):
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            if operation_filter is not None and entry.operation not in operation_filter:
+                continue
+
+            self._remove(key)
+            removed += 1
+
+        self._stats['invalidations'] += removed
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._user_index.clear()
+        self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, eviction and per-operation hit/miss counts
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self._total_bytes,
+            'max_entries': self.max_entries,
+            'max_bytes': self.max_bytes,
+            'indexed_users': len(self._user_index),
+            **self._stats,
+            'operations': {op: counts.copy() for op, counts in self._operation_stats.items()}
+        }
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and its index bookkeeping."""
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size_bytes
+
+        if entry.user_id is not None:
+            user_keys = self._user_index.get(entry.user_id)
+            if user_keys is not None:
+                user_keys.discard(key)
+                if not user_keys:
+                    del self._user_index[entry.user_id]
+
+    def _record(self, operation: str, outcome: str) -> None:
+        """Increment a per-operation hit or miss counter."""
+        counts = self._operation_stats.get(operation)
+        if counts is None:
+            counts = self._operation_stats[operation] = {'hits': 0, 'misses': 0}
+        counts[outcome] += 1
+
+
+def _estimate_size(value: Any) -> int:
+    """
+    Approximate the in-memory size of a cached value in bytes.
+
+    Walks dicts, lists, tuples, sets and the attributes of model objects;
+    other objects contribute their shallow size.
+    """
+    size = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += _estimate_size(k) + _estimate_size(v)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _estimate_size(item)
+    elif hasattr(value, '__dict__') and not isinstance(value, type):
+        size += _estimate_size(vars(value))
+
+    return size
@@ -0,0 +1,259 @@
+"""
+Streaming trade feed client for real-time quotes.
+
+Maintains a WebSocket connection to a Finnhub-style trade feed: the client
+sends ``{"type": "subscribe", "symbol": ...}`` and ``{"type": "unsubscribe",
+"symbol": ...}`` frames and receives ``{"type": "trade", "data": [...]}``
+messages whose entries carry symbol ``s``, price ``p``, epoch milliseconds
+``t`` and volume ``v``. Server ``ping`` messages are ignored.
+
+The connection is re-established with jittered exponential backoff after any
+failure. Every (re)connect resubscribes the full symbol set and asks the
+owner to backfill those symbols, since trades published while disconnected
+are never replayed by the feed.
+"""
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+import aiohttp
+import structlog
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass(frozen=True)
+class StreamTick:
+    """Latest trade for a symbol received from the feed."""
+    symbol: str
+    price: Decimal
+    timestamp: datetime
+    volume: Optional[int] = None
+
+
+class QuoteStream:
+    """
+    Reconnecting WebSocket subscription to a trade feed.
+    
+    Trades in one feed message are reduced to the latest tick per symbol and
+    delivered together to ``on_ticks``. ``on_backfill`` is awaited with the
+    symbols that may have missed trades: everything after a (re)connect and
+    newly added symbols while connected.
+    """
+    
+    def __init__(self, url: str, api_key: str,
+                 on_ticks: Callable[[List[StreamTick]], Awaitable[None]],
+                 on_backfill: Callable[[Set[str]], Awaitable[None]],
+                 reconnect_initial_seconds: float = 1.0,
+                 reconnect_max_seconds: float = 30.0,
+                 heartbeat_seconds: float = 30.0):
+        """
+        Initialize quote stream.
+        
+        Args:
+            url: WebSocket feed URL
+            api_key: API token sent as the ``token`` query parameter
+            on_ticks: Coroutine function receiving ticks from one feed message
+            on_backfill: Coroutine function receiving symbols to backfill
+            reconnect_initial_seconds: First reconnect delay
+            reconnect_max_seconds: Upper bound for the reconnect delay
+            heartbeat_seconds: Interval of client WebSocket pings
+        """
+        self.url = url
+        self.api_key = api_key
+        self.on_ticks = on_ticks
+        self.on_backfill = on_backfill
+        self.reconnect_initial_seconds = reconnect_initial_seconds
+        self.reconnect_max_seconds = reconnect_max_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        self.logger = structlog.get_logger(__name__)
+        
+        self.symbols: Set[str] = set()
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._task: Optional[asyncio.Task] = None
+        self._backfills: Set[asyncio.Task] = set()
+        self._connected = asyncio.Event()
+        
+        self.connects = 0
+        self.messages = 0
+        self.ticks = 0
+        self.last_message_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+    
+    @property
+    def is_connected(self) -> bool:
+        """Whether the feed connection is currently open."""
+        return self._connected.is_set()
+    
+    def start(self, session: aiohttp.ClientSession) -> None:
+        """
+        Start the connection loop.
+        
+        Args:
+            session: HTTP session used to open the WebSocket
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(session))
+    
+    async def stop(self) -> None:
+        """Close the connection and stop reconnecting."""
+        tasks = [task for task in [self._task, *self._backfills] if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+    
+    async def wait_connected(self, timeout: Optional[float] = None) -> None:
+        """Wait until the feed connection is open."""
+        await asyncio.wait_for(self._connected.wait(), timeout)
+    
+    async def set_symbols(self, symbols: Iterable[str]) -> None:
+        """
+        Replace the subscribed symbol set.
+        
+        Only the difference is sent to the feed. Newly added symbols are
+        backfilled because the feed only publishes trades from now on.
+        
+        Args:
+            symbols: Symbols to stream
+        """
+        wanted = {symbol.upper() for symbol in symbols}
+        added = wanted - self.symbols
+        removed = self.symbols - wanted
+        self.symbols = wanted
+        
+        if not self.is_connected:
+            return
+        
+        try:
+            for symbol in sorted(added):
+                await self._send('subscribe', symbol)
+            for symbol in sorted(removed):
+                await self._send('unsubscribe', symbol)
+        except (aiohttp.ClientError, ConnectionError, RuntimeError) as e:
+            # The connection loop resubscribes everything after reconnecting
+            self.logger.warning("Quote stream subscription update failed", error=str(e))
+            return
+        
+        if added:
+            self._schedule_backfill(added)
+    
+    async def _run(self, session: aiohttp.ClientSession) -> None:
+        """Connect, read until the connection drops, and reconnect with backoff."""
+        delay = self.reconnect_initial_seconds
+        
+        while True:
+            try:
+                async with session.ws_connect(
+                    self.url, params={'token': self.api_key}, heartbeat=self.heartbeat_seconds
+                ) as ws:
+                    self._ws = ws
+                    self.connects += 1
+                    self._connected.set()
+                    delay = self.reconnect_initial_seconds
+                    self.logger.info("Quote stream connected", url=self.url,
+                                     symbols=len(self.symbols), connects=self.connects)
+                    
+                    for symbol in sorted(self.symbols):
+                        await self._send('subscribe', symbol)
+                    if self.symbols:
+                        self._schedule_backfill(set(self.symbols))
+                    
+                    await self._read(ws)
+                    self.last_error = f"closed with code {ws.close_code}"
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e) or type(e).__name__
+            finally:
+                self._ws = None
+                self._connected.clear()
+            
+            self.logger.warning("Quote stream disconnected, reconnecting",
+                                error=self.last_error, delay_seconds=round(delay, 2))
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            delay = min(delay * 2, self.reconnect_max_seconds)
+    
+    async def _read(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Dispatch feed messages until the socket closes."""
+        async for message in ws:
+            if message.type != aiohttp.WSMsgType.TEXT:
+                if message.type == aiohttp.WSMsgType.ERROR:
+                    raise ws.exception() or ConnectionError("WebSocket error")
+                continue
+            
+            self.messages += 1
+            self.last_message_at = time.time()
+            
+            try:
+                payload = json.loads(message.data)
+            except ValueError:
+                self.logger.warning("Ignoring malformed quote stream message")
+                continue
+            
+            if payload.get('type') == 'trade':
+                ticks = self._parse_trades(payload.get('data') or [])
+                if ticks:
+                    self.ticks += len(ticks)
+                    await self.on_ticks(ticks)
+            elif payload.get('type') == 'error':
+                self.logger.warning("Quote stream error message", error=payload.get('msg'))
+    
+    def _parse_trades(self, trades: List[Dict[str, Any]]) -> List[StreamTick]:
+        """Reduce trade entries to the latest tick per subscribed symbol."""
+        latest: Dict[str, StreamTick] = {}
+        
+        for trade in trades:
+            symbol = str(trade.get('s', '')).upper()
+            if symbol not in self.symbols:
+                continue
+            try:
+                price = Decimal(str(trade['p']))
+                timestamp = _EPOCH + timedelta(milliseconds=int(trade['t']))
+            except (KeyError, TypeError, ValueError, InvalidOperation):
+                continue
+            if price <= 0:
+                continue
+            
+            previous = latest.get(symbol)
+            if previous is None or timestamp >= previous.timestamp:
+                volume = trade.get('v')
+                latest[symbol] = StreamTick(symbol, price, timestamp, int(volume) if volume is not None else None)
+        
+        return list(latest.values())
+    
+    async def _send(self, action: str, symbol: str) -> None:
+        if self._ws is None:
+            raise ConnectionError("Quote stream is not connected")
+        await self._ws.send_str(json.dumps({'type': action, 'symbol': symbol}))
+    
+    def _schedule_backfill(self, symbols: Set[str]) -> None:
+        task = asyncio.create_task(self._backfill(symbols))
+        self._backfills.add(task)
+        task.add_done_callback(self._backfills.discard)
+    
+    async def _backfill(self, symbols: Set[str]) -> None:
+        try:
+            await self.on_backfill(symbols)
+        except Exception as e:
+            self.logger.warning("Quote stream backfill failed", symbols=len(symbols), error=str(e))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Connection state and counters for monitoring."""
+        return {
+            'connected': self.is_connected,
+            'symbols': len(self.symbols),
+            'connects': self.connects,
+            'messages': self.messages,
+            'ticks': self.ticks,
+            'seconds_since_message': round(time.time() - self.last_message_at, 1)
+            if self.last_message_at else None,
+            'last_error': self.last_error
+        }
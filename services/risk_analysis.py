@@ -37,7 +37,7 @@ import structlog
 from config.settings import get_config
 from models.trade import Trade
 from models.portfolio import Portfolio, Position
-from services.market_data import MarketQuote, get_market_data_service
+from services.market_data import MarketQuote, RequestPriority, get_market_data_service
 
 
 class RiskAnalysisError(Exception):
@@ -408,7 +408,9 @@ class RiskAnalysisService:
             # Fetch market data if not provided
             if market_quote is None:
                 market_data_service = await get_market_data_service()
-                market_quote = await market_data_service.get_quote(trade.symbol)
+                market_quote = await market_data_service.get_quote(
+                    trade.symbol, priority=RequestPriority.RISK_ANALYSIS
+                )
             
             # Perform comprehensive analysis
             analysis = await self._perform_comprehensive_analysis(trade, portfolio, market_quote)
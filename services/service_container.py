@@ -553,9 +553,16 @@ def get_container() -> ServiceContainer:
 def _configure_default_services(container: ServiceContainer) -> None:
     """Configure default services in the container."""
     
+    def _create_database_service() -> DatabaseService:
+        service = DatabaseService()
+        # Drain buffered audit entries once all services have stopped
+        container.register_shutdown_handler(service.flush_audit_log)
+        return service
+    
     # Database service (highest priority - other services depend on it)
     container.register(
         DatabaseService,
+        factory=_create_database_service,
         startup_priority=10,
         shutdown_priority=90,
         health_check=lambda service: service.health_check() if hasattr(service, 'health_check') else True
@@ -0,0 +1,240 @@
+"""
+Offline symbol universe for symbol search and validation.
+
+Loads a symbol master file, such as a dump of Finnhub's ``/stock/symbol``
+endpoint (a JSON list of objects with ``symbol``, ``displaySymbol``,
+``description``, ``type``, ``mic`` and ``currency``), into an in-memory
+index: a hash map for exact lookups and sorted arrays of symbols and
+description words for prefix search by binary search. Searches never touch
+the network.
+
+Each load builds a complete new index and swaps it in with a single
+assignment, so readers see either the old or the new universe, never a
+partially loaded one.
+"""
+
+import asyncio
+import json
+import os
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import structlog
+
+_WORD = re.compile(r"[A-Z0-9]+")
+
+
+@dataclass(frozen=True)
+class SymbolRecord:
+    """A listed security from the symbol master."""
+    symbol: str
+    display_symbol: str
+    description: str
+    type: str
+    mic: str = ""
+    currency: str = "USD"
+    
+    @classmethod
+    def from_finnhub(cls, item: Dict[str, Any]) -> 'SymbolRecord':
+        """Create a record from a Finnhub ``/stock/symbol`` entry."""
+        symbol = str(item['symbol']).upper().strip()
+        return cls(
+            symbol=symbol,
+            display_symbol=item.get('displaySymbol') or symbol,
+            description=item.get('description') or '',
+            type=item.get('type') or '',
+            mic=item.get('mic') or '',
+            currency=item.get('currency') or 'USD'
+        )
+
+
+class _SymbolIndex:
+    """Immutable lookup structures over one version of the symbol master."""
+    
+    def __init__(self, records: Iterable[SymbolRecord]):
+        self.by_symbol: Dict[str, SymbolRecord] = {}
+        for record in records:
+            self.by_symbol.setdefault(record.symbol, record)
+        
+        self.symbols: List[str] = sorted(self.by_symbol)
+        self.words: List[Tuple[str, str]] = sorted({
+            (word, record.symbol)
+            for record in self.by_symbol.values()
+            for word in _WORD.findall(record.description.upper())
+        })
+    
+    def symbols_with_prefix(self, prefix: str) -> Iterator[str]:
+        """Symbols starting with a prefix, in sorted order."""
+        for i in range(bisect_left(self.symbols, prefix), len(self.symbols)):
+            if not self.symbols[i].startswith(prefix):
+                return
+            yield self.symbols[i]
+    
+    def symbols_with_word_prefix(self, prefix: str) -> Iterator[str]:
+        """Symbols whose description has a word starting with a prefix."""
+        for i in range(bisect_left(self.words, (prefix, '')), len(self.words)):
+            word, symbol = self.words[i]
+            if not word.startswith(prefix):
+                return
+            yield symbol
+
+
+class SymbolUniverse:
+    """
+    In-memory symbol master with exact and prefix lookups.
+    
+    Exact lookups are a dict access and prefix searches a binary search over
+    sorted arrays, so both take microseconds even for the full US listing.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize symbol universe.
+        
+        Args:
+            path: Symbol master JSON file (None to keep the universe empty)
+        """
+        self.path = path
+        self.logger = structlog.get_logger(__name__)
+        
+        self._index: Optional[_SymbolIndex] = None
+        self._loaded_mtime: Optional[float] = None
+        self._load_lock = asyncio.Lock()
+    
+    @property
+    def is_loaded(self) -> bool:
+        """Whether a symbol master has been loaded."""
+        return self._index is not None
+    
+    def __len__(self) -> int:
+        return len(self._index.by_symbol) if self._index else 0
+    
+    def __contains__(self, symbol: str) -> bool:
+        return self.get(symbol) is not None
+    
+    def get(self, symbol: str) -> Optional[SymbolRecord]:
+        """
+        Look up a symbol exactly.
+        
+        Args:
+            symbol: Stock symbol (case-insensitive)
+        
+        Returns:
+            SymbolRecord or None if the symbol is not listed
+        """
+        index = self._index
+        if index is None:
+            return None
+        return index.by_symbol.get(symbol.upper().strip())
+    
+    def search(self, query: str, limit: int = 10) -> List[SymbolRecord]:
+        """
+        Search symbols by symbol prefix and description word prefixes.
+        
+        The exact symbol ranks first, then symbols starting with the query,
+        then securities whose description contains a word starting with each
+        query word.
+        
+        Args:
+            query: Search query (symbol or company name)
+            limit: Maximum number of results
+        
+        Returns:
+            Matching SymbolRecord objects
+        """
+        index = self._index
+        query = query.upper().strip()
+        if index is None or not query or limit <= 0:
+            return []
+        
+        results: Dict[str, SymbolRecord] = {}
+        
+        def add(symbol: str) -> bool:
+            results.setdefault(symbol, index.by_symbol[symbol])
+            return len(results) >= limit
+        
+        if query in index.by_symbol and add(query):
+            return list(results.values())
+        
+        for symbol in index.symbols_with_prefix(query):
+            if add(symbol):
+                return list(results.values())
+        
+        words = _WORD.findall(query)
+        if not words:
+            return list(results.values())
+        
+        for symbol in index.symbols_with_word_prefix(words[0]):
+            if symbol in results:
+                continue
+            description_words = _WORD.findall(index.by_symbol[symbol].description.upper())
+            if all(any(word.startswith(prefix) for word in description_words) for prefix in words[1:]):
+                if add(symbol):
+                    break
+        
+        return list(results.values())
+    
+    async def load(self) -> int:
+        """
+        Load the symbol master file and swap it in.
+        
+        A file that cannot be read or parsed leaves the current universe in
+        place.
+        
+        Returns:
+            Number of symbols loaded
+        """
+        if not self.path:
+            return 0
+        
+        async with self._load_lock:
+            try:
+                index, mtime = await asyncio.get_event_loop().run_in_executor(None, self._read_index)
+            except Exception as e:
+                self.logger.warning("Symbol universe file unreadable", path=self.path, error=str(e))
+                return 0
+            
+            self._index = index
+            self._loaded_mtime = mtime
+        
+        self.logger.info("Symbol universe loaded", path=self.path, symbols=len(index.by_symbol))
+        return len(index.by_symbol)
+    
+    async def reload_if_changed(self) -> bool:
+        """
+        Reload the symbol master if the file changed since the last load.
+        
+        Returns:
+            Whether a new universe was loaded
+        """
+        if not self.path:
+            return False
+        
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return False
+        
+        if mtime == self._loaded_mtime:
+            return False
+        return await self.load() > 0
+    
+    def _read_index(self) -> Tuple[_SymbolIndex, float]:
+        mtime = os.stat(self.path).st_mtime
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        # Accept a bare /stock/symbol response or one wrapped as {"result": [...]}
+        items = data.get('result', []) if isinstance(data, dict) else data
+        records = [SymbolRecord.from_finnhub(item) for item in items if item.get('symbol')]
+        return _SymbolIndex(records), mtime
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Universe size and source for monitoring."""
+        return {
+            'loaded': self.is_loaded,
+            'symbols': len(self),
+            'path': self.path
+        }
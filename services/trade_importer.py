@@ -0,0 +1,378 @@
+"""
+Bulk trade importer for the Slack Trading Bot.
+
+Streams trades from JSONL or CSV files into the trades table. Rows are read in
+chunks, parsed and validated in a process pool, and written with concurrent
+BatchWriteItem requests spread across partition keys. Only a bounded number
+of chunks is held in memory at once, so files of any size import in constant
+memory. A throughput report (items/s, consumed WCU) is produced at the end.
+
+Usage:
+    python -m services.trade_importer trades.jsonl [--concurrency 16]
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from models.trade import Trade
+from services.database import DatabaseService, build_trade_item, trade_ttl
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+SUPPORTED_FORMATS = ('jsonl', 'csv')
+
+_TRADE_FIELDS = frozenset(f.name for f in fields(Trade))
+_JSON_FIELDS = ('market_data', 'risk_analysis')
+
+# A row is (line number, raw JSONL line or parsed CSV record)
+Row = Tuple[int, Union[str, Dict[str, Any]]]
+
+
+@dataclass
+class ImportReport:
+    """Outcome and throughput of a bulk import."""
+    source: str
+    rows_read: int = 0
+    imported: int = 0
+    invalid: int = 0
+    unprocessed: int = 0
+    duplicates: int = 0
+    retries: int = 0
+    consumed_wcu: float = 0.0
+    elapsed_seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def items_per_second(self) -> float:
+        """Items written per second of wall-clock time."""
+        return self.imported / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def wcu_per_second(self) -> float:
+        """Write capacity units consumed per second."""
+        return self.consumed_wcu / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert report to dictionary."""
+        return {
+            'source': self.source,
+            'rows_read': self.rows_read,
+            'imported': self.imported,
+            'invalid': self.invalid,
+            'unprocessed': self.unprocessed,
+            'duplicates': self.duplicates,
+            'retries': self.retries,
+            'consumed_wcu': round(self.consumed_wcu, 2),
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+            'items_per_second': round(self.items_per_second, 1),
+            'wcu_per_second': round(self.wcu_per_second, 1),
+            'errors': self.errors
+        }
+
+    def summary(self) -> str:
+        """One-line human readable summary."""
+        return (f"Imported {self.imported}/{self.rows_read} trades from {self.source} "
+                f"in {self.elapsed_seconds:.2f}s ({self.items_per_second:.0f} items/s, "
+                f"{self.consumed_wcu:.0f} WCU, {self.wcu_per_second:.0f} WCU/s); "
+                f"{self.invalid} invalid, {self.unprocessed} unprocessed, {self.duplicates} duplicates, "
+                f"{self.retries} retries")
+
+
+class TradeImporter:
+    """
+    Pipelined bulk importer writing through DatabaseService.write_trade_items.
+
+    Reading, validation and writing overlap: while one chunk is being written,
+    up to ``max_in_flight_chunks`` further chunks are parsed in the worker pool.
+    """
+
+    def __init__(self, db_service: DatabaseService, chunk_size: int = 2000,
+                 validation_workers: Optional[int] = None, max_concurrency: int = 16,
+                 max_in_flight_chunks: int = 4, max_retries: int = 5, max_errors: int = 100):
+        """
+        Initialize the importer.
+
+        Args:
+            db_service: Database service used for writes
+            chunk_size: Rows per validation/write chunk
+            validation_workers: Worker processes for parsing and validation
+                (None for one per CPU, 0 to validate in the event loop thread)
+            max_concurrency: Maximum BatchWriteItem requests in flight
+            max_in_flight_chunks: Maximum chunks buffered between stages
+            max_retries: Attempts per batch for unprocessed items
+            max_errors: Maximum error messages kept in the report
+        """
+        self.db_service = db_service
+        self.chunk_size = chunk_size
+        self.validation_workers = (os.cpu_count() or 1) if validation_workers is None else validation_workers
+        self.max_concurrency = max_concurrency
+        self.max_in_flight_chunks = max(1, max_in_flight_chunks)
+        self.max_retries = max_retries
+        self.max_errors = max_errors
+
+    async def import_file(self, path: Union[str, Path], file_format: Optional[str] = None) -> ImportReport:
+        """
+        Import all trades in a JSONL or CSV file.
+
+        Args:
+            path: File to import
+            file_format: 'jsonl' or 'csv' (detected from the extension if omitted)
+
+        Returns:
+            ImportReport with counts, errors and throughput
+
+        Raises:
+            ValueError: If the file format is not supported
+        """
+        path = Path(path)
+        file_format = file_format or detect_format(path)
+        if file_format not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported import format: {file_format}")
+
+        report = ImportReport(source=str(path))
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        ttl = trade_ttl()
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_in_flight_chunks)
+        writer = asyncio.create_task(self._write_chunks(queue, report))
+        executor = ProcessPoolExecutor(max_workers=self.validation_workers) if self.validation_workers > 0 else None
+
+        try:
+            chunks = _read_chunks(path, file_format, self.chunk_size)
+            pending = set()
+
+            while True:
+                rows = await loop.run_in_executor(None, next, chunks, None)
+                if rows is None:
+                    break
+                report.rows_read += len(rows)
+
+                pending.add(self._validate(loop, executor, rows, ttl))
+                if len(pending) >= self.max_in_flight_chunks:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        await self._enqueue(queue, task.result(), writer)
+
+            for result in await asyncio.gather(*pending):
+                await self._enqueue(queue, result, writer)
+
+            await self._enqueue(queue, None, writer)
+            await writer
+
+        finally:
+            if not writer.done():
+                writer.cancel()
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        report.elapsed_seconds = time.monotonic() - started
+        logger.info(report.summary())
+        return report
+
+    def _validate(self, loop: asyncio.AbstractEventLoop, executor: Optional[Executor],
+                  rows: List[Row], ttl: int) -> asyncio.Future:
+        """Schedule parsing and validation of a chunk."""
+        if executor is None:
+            future = loop.create_future()
+            future.set_result(prepare_chunk(rows, ttl))
+            return future
+        return asyncio.ensure_future(loop.run_in_executor(executor, prepare_chunk, rows, ttl))
+
+    async def _enqueue(self, queue: asyncio.Queue, item: Any, writer: asyncio.Task) -> None:
+        """Hand a chunk to the writer, surfacing writer failures instead of blocking."""
+        put = asyncio.ensure_future(queue.put(item))
+        await asyncio.wait({put, writer}, return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            writer.result()
+            raise RuntimeError("Import writer stopped unexpectedly")
+
+    async def _write_chunks(self, queue: asyncio.Queue, report: ImportReport) -> None:
+        """Write validated chunks as they arrive until the end-of-input marker."""
+        while True:
+            result = await queue.get()
+            if result is None:
+                return
+
+            items, errors = result
+            report.invalid += len(errors)
+            self._record_errors(report, errors)
+
+            if not items:
+                continue
+
+            write_results = await self.db_service.write_trade_items(
+                items, max_concurrency=self.max_concurrency, max_retries=self.max_retries
+            )
+            report.imported += write_results['written']
+            report.unprocessed += len(write_results['unprocessed'])
+            report.duplicates += write_results['duplicates']
+            report.retries += write_results['retries']
+            report.consumed_wcu += write_results['consumed_wcu']
+            self._record_errors(report, [
+                f"trade {item.get('trade_id')}: unprocessed after {self.max_retries} attempts"
+                for item in write_results['unprocessed']
+            ])
+
+    def _record_errors(self, report: ImportReport, errors: List[str]) -> None:
+        """Keep at most max_errors messages in the report."""
+        room = self.max_errors - len(report.errors)
+        if room > 0:
+            report.errors.extend(errors[:room])
+
+
+def detect_format(path: Path) -> str:
+    """
+    Infer the import format from a file extension.
+
+    Args:
+        path: File path
+
+    Returns:
+        'jsonl' or 'csv'
+    """
+    suffix = path.suffix.lower()
+    if suffix in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if suffix == '.csv':
+        return 'csv'
+    raise ValueError(f"Cannot infer import format from extension '{path.suffix}'")
+
+
+def prepare_chunk(rows: List[Row], ttl: int) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Parse and validate a chunk of rows into trades-table items.
+
+    Runs in worker processes, so it only takes and returns picklable data.
+
+    Args:
+        rows: (line number, raw row) pairs
+        ttl: Expiry epoch seconds applied to every item
+
+    Returns:
+        Tuple of (items, error messages)
+    """
+    items = []
+    errors = []
+
+    for line_number, raw in rows:
+        try:
+            trade = row_to_trade(raw)
+            items.append(build_trade_item(trade, ttl))
+        except Exception as e:
+            errors.append(f"line {line_number}: {str(e)}")
+
+    return items, errors
+
+
+def row_to_trade(raw: Union[str, Dict[str, Any]]) -> Trade:
+    """
+    Convert a JSONL line or CSV record to a validated Trade.
+
+    Empty values are treated as missing, unknown columns are ignored, and
+    JSON-encoded market_data/risk_analysis columns are decoded.
+
+    Args:
+        raw: JSON text or dictionary of column values
+
+    Returns:
+        Trade instance
+    """
+    row = json.loads(raw, parse_float=Decimal) if isinstance(raw, str) else raw
+    if not isinstance(row, dict):
+        raise ValueError("Row must be a JSON object")
+
+    data = {k: v for k, v in row.items() if k in _TRADE_FIELDS and v not in ('', None)}
+
+    if 'quantity' in data and not isinstance(data['quantity'], int):
+        quantity = Decimal(str(data['quantity']))
+        if quantity != quantity.to_integral_value():
+            raise ValueError(f"Quantity must be a whole number: {data['quantity']}")
+        data['quantity'] = int(quantity)
+
+    for key in _JSON_FIELDS:
+        if isinstance(data.get(key), str):
+            data[key] = json.loads(data[key], parse_float=Decimal)
+
+    return Trade.from_dict(data)
+
+
+def _read_chunks(path: Path, file_format: str, chunk_size: int) -> Iterator[List[Row]]:
+    """Yield lists of up to chunk_size rows from a file."""
+    chunk: List[Row] = []
+    for row in _read_rows(path, file_format):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _read_rows(path: Path, file_format: str) -> Iterator[Row]:
+    """Yield (line number, row) pairs; JSONL lines are parsed by the workers."""
+    with open(path, newline='' if file_format == 'csv' else None, encoding='utf-8') as f:
+        if file_format == 'csv':
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield reader.line_num, record
+        else:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if line:
+                    yield line_number, line
+
+
+async def _run(args: argparse.Namespace) -> ImportReport:
+    """Run an import from parsed command line arguments."""
+    db_service = DatabaseService()
+    try:
+        importer = TradeImporter(
+            db_service,
+            chunk_size=args.chunk_size,
+            validation_workers=args.workers,
+            max_concurrency=args.concurrency
+        )
+        return await importer.import_file(args.path, args.format)
+    finally:
+        await db_service.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Bulk import trades from JSONL or CSV")
+    parser.add_argument('path', help="File to import")
+    parser.add_argument('--format', choices=SUPPORTED_FORMATS, help="Input format (default: from extension)")
+    parser.add_argument('--concurrency', type=int, default=16, help="BatchWriteItem requests in flight")
+    parser.add_argument('--chunk-size', type=int, default=2000, help="Rows per validation chunk")
+    parser.add_argument('--workers', type=int, default=None, help="Validation worker processes")
+    parser.add_argument('--json', action='store_true', help="Print the full report as JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    report = asyncio.run(_run(args))
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print(report.summary())
+        for error in report.errors:
+            print(f"  {error}")
+
+    return 0 if report.invalid == 0 and report.unprocessed == 0 else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -15,12 +15,14 @@ import time
 import uuid
 from datetime import datetime, timedelta
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, List, Optional, Any, Tuple, Union
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Any, Set, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 import random
 
+import numpy as np
 from tenacity import (
     retry, 
     stop_after_attempt, 
@@ -32,8 +34,11 @@ from prometheus_client import Counter, Histogram, Gauge
 import structlog
 
 from config.settings import get_config
-from models.trade import Trade, TradeStatus
-from services.market_data import MarketQuote, get_market_data_service
+from models.trade import Trade, TradeStatus, TradeType
+from services.execution_stats import ExecutionStatistics
+from services.execution_store import ExecutionStore, JsonlSpill
+from services.market_data import MarketQuote, RequestPriority, SymbolInfo, get_market_data_service
+from services.order_book import BookFill, OrderBook
 
 
 class TradingError(Exception):
@@ -261,6 +266,17 @@ class ExecutionReport:
         }
 
 
+@dataclass
+class SimulationOrder:
+    """An order to simulate in a batch."""
+    symbol: str
+    trade_type: str
+    quantity: int
+    market_quote: MarketQuote
+    symbol_info: Optional[SymbolInfo] = None
+    order_id: Optional[str] = None
+
+
 class MarketSimulator:
     """
     Sophisticated market simulation engine for realistic execution modeling.
@@ -269,9 +285,18 @@ class MarketSimulator:
     partial fills, and venue-specific execution characteristics.
     """
     
-    def __init__(self):
-        """Initialize market simulator with realistic parameters."""
+    # Most venues a single order is split across
+    MAX_FILLS = 5
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize market simulator with realistic parameters.
+        
+        Args:
+            seed: Seed for the batch simulation random generator
+        """
         self.logger = structlog.get_logger(__name__)
+        self.rng = np.random.default_rng(seed)
         
         # Market microstructure parameters
         self.bid_ask_spread_bps = {
@@ -301,7 +326,8 @@ class MarketSimulator:
         trade_type: str, 
         quantity: int, 
         market_quote: MarketQuote,
-        order_type: OrderType = OrderType.MARKET
+        order_type: OrderType = OrderType.MARKET,
+        symbol_info: Optional[SymbolInfo] = None
     ) -> Tuple[List[OrderFill], Dict[str, Any]]:
         """
         Simulate realistic order execution with market microstructure effects.
@@ -312,12 +338,13 @@ class MarketSimulator:
             quantity: Order quantity
             market_quote: Current market data
             order_type: Type of order
+            symbol_info: Cached company profile, if available
             
         Returns:
             Tuple of (fills, execution_metrics)
         """
         # Determine stock category for simulation parameters
-        stock_category = self._classify_stock(symbol, market_quote)
+        stock_category = self._classify_stock(symbol, market_quote, symbol_info)
         
         # Calculate bid-ask spread
         spread_bps = self.bid_ask_spread_bps[stock_category]
@@ -351,16 +378,148 @@ class MarketSimulator:
         
         return fills, execution_metrics
     
-    def _classify_stock(self, symbol: str, market_quote: MarketQuote) -> str:
+    def simulate_batch(
+        self,
+        orders: List[SimulationOrder]
+    ) -> List[Tuple[List[OrderFill], Dict[str, Any]]]:
+        """
+        Simulate many orders at once.
+        
+        Applies the same spread, square-root market impact, fill split and
+        venue model as simulate_execution, computed over NumPy arrays with
+        the simulator's seeded generator. Prices stay in floating point until
+        fills are built, where they are rounded to the tick and converted to
+        Decimal.
+        
+        Args:
+            orders: Orders to simulate
+            
+        Returns:
+            List of (fills, execution_metrics) tuples, one per order in order
+        """
+        if not orders:
+            return []
+        
+        n = len(orders)
+        rng = self.rng
+        categories = ['large_cap', 'mid_cap', 'small_cap']
+        venues = list(ExecutionVenue)
+        
+        # Per-order inputs
+        category_index = np.array([
+            categories.index(self._classify_stock(order.symbol, order.market_quote, order.symbol_info))
+            for order in orders
+        ])
+        price = np.array([float(order.market_quote.current_price) for order in orders])
+        quantity = np.array([order.quantity for order in orders], dtype=np.int64)
+        side = np.array([1.0 if order.trade_type.lower() == 'buy' else -1.0 for order in orders])
+        estimated_adv = np.array([
+            order.market_quote.volume * 10 if order.market_quote.volume else 1000000 for order in orders
+        ], dtype=np.float64)
+        
+        # Spread and market impact
+        spread_bps = np.array([self.bid_ask_spread_bps[c] for c in categories])[category_index]
+        linear = np.array([self.market_impact_params[c]['linear'] for c in categories])[category_index]
+        sqrt = np.array([self.market_impact_params[c]['sqrt'] for c in categories])[category_index]
+        
+        participation_rate = quantity / estimated_adv
+        impact_bps = np.minimum((linear * participation_rate + sqrt * np.sqrt(participation_rate)) * 10000, 50.0)
+        slippage_bps = side * (spread_bps / 2 + impact_bps)
+        execution_price = price * (1 + slippage_bps / 10000)
+        
+        # Number of fills: one below 100 shares, 1-3 below 1,000, else 2-5
+        num_fills = np.where(
+            quantity < 100, 1,
+            np.where(quantity < 1000, rng.integers(1, 4, n), rng.integers(2, 6, n))
+        )
+        
+        # Distinct venues per order: the first num_fills of a random permutation
+        venue_index = np.argsort(rng.random((n, len(venues))), axis=1)[:, :self.MAX_FILLS]
+        
+        # Fill sizes: each fill takes 20-60% of what remains, the last takes the rest
+        fill_quantity = np.zeros((n, self.MAX_FILLS), dtype=np.int64)
+        remaining = quantity.copy()
+        for i in range(self.MAX_FILLS):
+            active = (i < num_fills) & (remaining > 0)
+            last = i == num_fills - 1
+            min_fill = np.maximum(1, (remaining * 0.2).astype(np.int64))
+            max_fill = np.maximum(min_fill, (remaining * 0.6).astype(np.int64))
+            split = rng.integers(min_fill, max_fill + 1)
+            size = np.where(last, remaining, split)
+            fill_quantity[:, i] = np.where(active, size, 0)
+            remaining -= fill_quantity[:, i]
+        
+        # Per-fill price variation of up to 2 basis points, rounded to a whole
+        # number of ticks (cents, or tenths of a cent below $1)
+        fill_price = execution_price[:, None] * (1 + rng.uniform(-0.0002, 0.0002, (n, self.MAX_FILLS)))
+        tick_exponent = np.where(fill_price >= 1, -2, -3)
+        fill_ticks = np.floor(fill_price * 10.0 ** -tick_exponent + 0.5).astype(np.int64)
+        
+        # Build fills; Decimal and object construction happen only here
+        now = datetime.utcnow()
+        batch_id = uuid.uuid4().hex
+        commission_rate = {
+            venue: Decimal(str(chars['commission_bps'])) / 10000
+            for venue, chars in self.venue_characteristics.items()
+        }
+        latency = {
+            venue: timedelta(milliseconds=chars['latency_ms'])
+            for venue, chars in self.venue_characteristics.items()
+        }
+        rows = zip(
+            orders, category_index.tolist(), spread_bps.tolist(), impact_bps.tolist(), slippage_bps.tolist(),
+            fill_quantity.tolist(), venue_index.tolist(), fill_ticks.tolist(), tick_exponent.tolist()
+        )
+        
+        results = []
+        for row, (order, category, spread, impact, slippage, sizes, venue_row, ticks, exponents) in enumerate(rows):
+            order_id = order.order_id or f"{batch_id}-{row}"
+            fills = []
+            for i, qty in enumerate(sizes):
+                if not qty:
+                    continue
+                venue = venues[venue_row[i]]
+                fill_price_decimal = Decimal(ticks[i]).scaleb(exponents[i])
+                fills.append(OrderFill(
+                    fill_id=f"{order_id}-{i}",
+                    order_id=order_id,
+                    symbol=order.symbol,
+                    quantity=qty,
+                    price=fill_price_decimal,
+                    venue=venue,
+                    timestamp=now + latency[venue],
+                    commission=qty * fill_price_decimal * commission_rate[venue]
+                ))
+            
+            results.append((fills, {
+                'stock_category': categories[category],
+                'spread_bps': spread,
+                'market_impact_bps': impact,
+                'slippage_bps': slippage,
+                'total_fills': len(fills),
+                'venues_used': list(set(fill.venue for fill in fills))
+            }))
+        
+        return results
+    
+    def _classify_stock(
+        self, 
+        symbol: str, 
+        market_quote: MarketQuote, 
+        symbol_info: Optional[SymbolInfo] = None
+    ) -> str:
         """Classify stock by market cap for simulation parameters."""
         # Simple classification based on common symbols
         large_cap_symbols = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA', 'META', 'NVDA']
         
+        # Prefer the cached company profile over whatever the quote carried
+        market_cap = symbol_info.market_cap if symbol_info and symbol_info.market_cap else market_quote.market_cap
+        
         if symbol in large_cap_symbols:
             return 'large_cap'
-        elif market_quote.market_cap and market_quote.market_cap > 10000000000:  # $10B
+        elif market_cap and market_cap > 10000000000:  # $10B
             return 'large_cap'
-        elif market_quote.market_cap and market_quote.market_cap > 2000000000:   # $2B
+        elif market_cap and market_cap > 2000000000:   # $2B
             return 'mid_cap'
         else:
             return 'small_cap'
@@ -484,7 +643,32 @@ class TradingAPIService:
         
         # Execution tracking
         self.active_orders: Dict[str, ExecutionReport] = {}
-        self.execution_history: List[ExecutionReport] = []
+        spill_path = self.config.trading.execution_spill_path
+        self.execution_history = ExecutionStore(
+            max_reports=self.config.trading.execution_history_size,
+            spill=JsonlSpill(spill_path) if spill_path else None
+        )
+        self.execution_stats = ExecutionStatistics()
+        
+        # Limit and stop orders rest in per-symbol books until market prices
+        # cross them; each keeps its trade and the price when it was placed
+        self.order_books: Dict[str, OrderBook] = {}
+        self._book_orders: Dict[str, Tuple[Trade, Decimal]] = {}
+        self._unsubscribe_quotes: Optional[Callable[[], None]] = None
+        
+        # Order intake: queued orders per symbol, executed by a worker pool
+        # one at a time per symbol so each symbol keeps submission order
+        self._symbol_queues: Dict[str, Deque[Tuple[Trade, ExecutionReport]]] = {}
+        self._ready_symbols: Optional[asyncio.Queue] = None
+        self._order_slots: Optional[asyncio.Semaphore] = None
+        self._order_workers: List[asyncio.Task] = []
+        self.queued_orders = 0
+        
+        # Order update listeners and waiters
+        self._order_listeners: Dict[int, Tuple[Callable[[ExecutionReport], Any], Optional[str]]] = {}
+        self._listener_ids = 0
+        self._listener_tasks: Set[asyncio.Task] = set()
+        self._order_waiters: Dict[str, List[asyncio.Future]] = {}
         
         # Metrics
         self.execution_counter = Counter(
@@ -549,7 +733,111 @@ class TradingAPIService:
         await self._validate_trade(trade)
         
         # Create execution report
-        execution_report = ExecutionReport(
+        execution_report = self._create_execution_report(trade, order_type)
+        
+        # Add to active orders
+        self.active_orders[execution_report.order_id] = execution_report
+        
+        return await self._execute_order(trade, execution_report, start_time)
+    
+    async def submit_order(self, trade: Trade, order_type: OrderType = OrderType.MARKET) -> str:
+        """
+        Queue a trade for execution and return its order ID at once.
+        
+        Orders are executed by a pool of workers, at most
+        ``order_workers`` at a time and one at a time per symbol in
+        submission order. When ``order_queue_size`` orders are already queued
+        or executing, the caller waits for space. Use wait_for_order or
+        subscribe_order_updates to follow the order.
+        
+        Args:
+            trade: Trade object to execute
+            order_type: Type of order (market, limit, etc.)
+            
+        Returns:
+            str: Order ID of the queued order
+            
+        Raises:
+            ValueError: If trade validation fails
+        """
+        await self._validate_trade(trade)
+        
+        self._ensure_order_workers()
+        await self._order_slots.acquire()
+        
+        execution_report = self._create_execution_report(trade, order_type)
+        execution_report.audit_trail.append(f"Order queued at {execution_report.order_received_at}")
+        self.active_orders[execution_report.order_id] = execution_report
+        
+        # A symbol with queued or executing orders is already scheduled
+        queue = self._symbol_queues.get(trade.symbol)
+        if queue is None:
+            queue = self._symbol_queues[trade.symbol] = deque()
+            self._ready_symbols.put_nowait(trade.symbol)
+        queue.append((trade, execution_report))
+        self.queued_orders += 1
+        
+        self._publish_order_update(execution_report)
+        
+        self.logger.info("Order queued",
+                        trade_id=trade.trade_id,
+                        order_id=execution_report.order_id,
+                        symbol=trade.symbol,
+                        queued_orders=self.queued_orders)
+        
+        return execution_report.order_id
+    
+    async def wait_for_order(self, order_id: str, timeout: Optional[float] = None) -> Optional[ExecutionReport]:
+        """
+        Wait until an order is filled, cancelled or rejected.
+        
+        Args:
+            order_id: Order ID returned by submit_order or execute_trade
+            timeout: Maximum seconds to wait (None to wait indefinitely)
+            
+        Returns:
+            The finished ExecutionReport, or None for an unknown order
+            
+        Raises:
+            asyncio.TimeoutError: If the order is still open after the timeout
+        """
+        if order_id not in self.active_orders:
+            return self.execution_history.get_by_order(order_id)
+        
+        future = asyncio.get_running_loop().create_future()
+        waiters = self._order_waiters.setdefault(order_id, [])
+        waiters.append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            if future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    self._order_waiters.pop(order_id, None)
+    
+    def subscribe_order_updates(self, callback: Callable[[ExecutionReport], Any],
+                                order_id: Optional[str] = None) -> Callable[[], None]:
+        """
+        Register a listener for execution report updates.
+        
+        Listeners are called when an order is queued, placed, filled,
+        cancelled or rejected.
+        
+        Args:
+            callback: Function or coroutine function called with the updated report
+            order_id: Order to follow, or None for all orders
+            
+        Returns:
+            Function that removes the listener
+        """
+        self._listener_ids += 1
+        listener_id = self._listener_ids
+        self._order_listeners[listener_id] = (callback, order_id)
+        
+        return lambda: self._order_listeners.pop(listener_id, None)
+    
+    def _create_execution_report(self, trade: Trade, order_type: OrderType) -> ExecutionReport:
+        return ExecutionReport(
             execution_id=str(uuid.uuid4()),
             trade_id=trade.trade_id,
             order_id=str(uuid.uuid4()),
@@ -561,8 +849,16 @@ class TradingAPIService:
             status=OrderStatus.PENDING
         )
         
-        # Add to active orders
-        self.active_orders[execution_report.order_id] = execution_report
+    async def _execute_order(self, trade: Trade, execution_report: ExecutionReport,
+                             start_time: float) -> ExecutionReport:
+        """
+        Run an active order through compliance, pricing and execution.
+        
+        cancel_order may take the order while this is awaiting; the report
+        is then already recorded as cancelled, so execution stops at the next
+        check instead of placing, simulating or recording it again.
+        """
+        order_type = execution_report.order_type
         
         try:
             # Perform compliance checks
@@ -570,15 +866,25 @@ class TradingAPIService:
             
             # Get current market data
             market_data_service = await get_market_data_service()
-            market_quote = await market_data_service.get_quote(trade.symbol)
+            market_quote = await market_data_service.get_quote(
+                trade.symbol, require_fresh=True, priority=RequestPriority.EXECUTION
+            )
+            symbol_info = await market_data_service.get_cached_profile(trade.symbol)
+            if self._cancelled_in_flight(trade, execution_report):
+                return execution_report
             
             # Start execution
             execution_report.execution_started_at = datetime.utcnow()
             execution_report.audit_trail.append(f"Execution started at {execution_report.execution_started_at}")
             
+            if order_type != OrderType.MARKET:
+                return await self._place_book_order(trade, execution_report, market_quote)
+            
             # Simulate execution delay
             if self.config.trading.execution_delay_seconds > 0:
                 await asyncio.sleep(self.config.trading.execution_delay_seconds)
+                if self._cancelled_in_flight(trade, execution_report):
+                    return execution_report
             
             # Simulate execution
             fills, execution_metrics = self.market_simulator.simulate_execution(
@@ -586,7 +892,8 @@ class TradingAPIService:
                 trade.trade_type,
                 abs(trade.quantity),
                 market_quote,
-                order_type
+                order_type,
+                symbol_info
             )
             
             # Process fills
@@ -634,13 +941,15 @@ class TradingAPIService:
                 self.slippage_gauge.labels(symbol=trade.symbol).set(execution_report.slippage_bps)
             
             # Move to execution history
-            self.execution_history.append(execution_report)
+            self._record_execution(execution_report)
             if execution_report.order_id in self.active_orders:
                 del self.active_orders[execution_report.order_id]
             
             # Update daily trade count
             self._update_daily_trade_count()
             
+            self._publish_order_update(execution_report)
+            
             self.logger.info("Trade execution completed",
                            trade_id=trade.trade_id,
                            execution_id=execution_report.execution_id,
@@ -653,6 +962,10 @@ class TradingAPIService:
             return execution_report
             
         except Exception as e:
+            # A cancelled order was already recorded; the failure no longer matters
+            if self._cancelled_in_flight(trade, execution_report):
+                return execution_report
+            
             # Handle execution failure
             execution_report.status = OrderStatus.REJECTED
             execution_report.audit_trail.append(f"Execution failed: {str(e)}")
@@ -670,6 +983,8 @@ class TradingAPIService:
             # Clean up
             if execution_report.order_id in self.active_orders:
                 del self.active_orders[execution_report.order_id]
+            self._record_execution(execution_report)
+            self._publish_order_update(execution_report)
             
             self.logger.error("Trade execution failed",
                             trade_id=trade.trade_id,
@@ -678,6 +993,17 @@ class TradingAPIService:
             
             raise e
     
+    def _cancelled_in_flight(self, trade: Trade, execution_report: ExecutionReport) -> bool:
+        """Check whether cancel_order took an order while it was executing."""
+        if execution_report.status != OrderStatus.CANCELLED:
+            return False
+        
+        trade.status = TradeStatus.CANCELLED
+        self.logger.info("Order cancelled during execution",
+                        trade_id=trade.trade_id,
+                        order_id=execution_report.order_id)
+        return True
+    
     async def cancel_order(self, order_id: str) -> bool:
         """
         Cancel an active order.
@@ -705,13 +1031,232 @@ class TradingAPIService:
         execution_report.status = OrderStatus.CANCELLED
         execution_report.audit_trail.append(f"Order cancelled at {datetime.utcnow()}")
         
+        # Take resting orders out of their book
+        book = self.order_books.get(execution_report.symbol)
+        if book is not None:
+            book.cancel(order_id)
+        book_order = self._book_orders.pop(order_id, None)
+        if book_order is not None:
+            book_order[0].status = TradeStatus.CANCELLED
+        
         # Move to history
-        self.execution_history.append(execution_report)
+        self._record_execution(execution_report)
         del self.active_orders[order_id]
         
+        if book_order is not None and not book:
+            await self._update_book_subscription()
+        
+        self._publish_order_update(execution_report)
+        
         self.logger.info("Order cancelled successfully", order_id=order_id)
         return True
     
+    async def _place_book_order(self, trade: Trade, execution_report: ExecutionReport,
+                                market_quote: MarketQuote) -> ExecutionReport:
+        """
+        Place a limit, stop or stop-limit order in its symbol's book.
+        
+        Uses the trade price as the limit or stop price. The order is matched
+        against the current market price at once and otherwise stays in
+        active_orders until later prices cross it or it is cancelled.
+        
+        Args:
+            trade: Trade being executed
+            execution_report: Pending report for the order
+            market_quote: Fresh quote at placement
+        
+        Returns:
+            ExecutionReport: Report reflecting any immediate fills
+        """
+        order_id = execution_report.order_id
+        side = 'buy' if trade.trade_type == TradeType.BUY else 'sell'
+        book = self.order_books.setdefault(trade.symbol, OrderBook(trade.symbol))
+        self._book_orders[order_id] = (trade, market_quote.current_price)
+        
+        if execution_report.order_type == OrderType.LIMIT:
+            fills = book.add_limit(order_id, side, trade.price, execution_report.requested_quantity)
+        else:
+            limit_price = trade.price if execution_report.order_type == OrderType.STOP_LIMIT else None
+            book.add_stop(order_id, side, trade.price, execution_report.requested_quantity, limit_price)
+            fills = []
+        
+        execution_report.audit_trail.append(
+            f"{execution_report.order_type.value} order placed in book at {trade.price}"
+        )
+        trade.status = TradeStatus.PENDING
+        self._update_daily_trade_count()
+        
+        self._apply_book_fills(trade.symbol, fills + book.match(market_quote.current_price))
+        
+        if order_id in self._book_orders:
+            await self._update_book_subscription()
+        
+        # Fills have already been published
+        if not execution_report.fills:
+            self._publish_order_update(execution_report)
+        
+        self.logger.info("Order placed in book",
+                        trade_id=trade.trade_id,
+                        order_id=order_id,
+                        symbol=trade.symbol,
+                        order_type=execution_report.order_type.value,
+                        price=float(trade.price),
+                        status=execution_report.status.value)
+        
+        return execution_report
+    
+    def process_market_price(self, symbol: str, price: Decimal, volume: Optional[int] = None) -> int:
+        """
+        Match a symbol's resting orders against a market price.
+        
+        Args:
+            symbol: Trading symbol
+            price: Traded or quoted price
+            volume: Quantity traded at that price (None to fill all crossed orders)
+        
+        Returns:
+            Number of fills
+        """
+        book = self.order_books.get(symbol)
+        if not book:
+            return 0
+        
+        fills = book.match(price, volume)
+        self._apply_book_fills(symbol, fills)
+        return len(fills)
+    
+    def _on_market_quote(self, quote: MarketQuote) -> None:
+        """Match resting orders against streamed quote updates."""
+        if self.process_market_price(quote.symbol, quote.current_price) and not self.order_books.get(quote.symbol):
+            asyncio.ensure_future(self._update_book_subscription())
+    
+    def _apply_book_fills(self, symbol: str, fills: List[BookFill]) -> None:
+        """Record book fills on their execution reports and complete filled orders."""
+        venue = ExecutionVenue.NASDAQ
+        commission_rate = Decimal(str(self.market_simulator.venue_characteristics[venue]['commission_bps'])) / 10000
+        
+        for book_fill in fills:
+            execution_report = self.active_orders.get(book_fill.order_id)
+            if execution_report is None:
+                continue
+            
+            execution_report.add_fill(OrderFill(
+                fill_id=str(uuid.uuid4()),
+                order_id=book_fill.order_id,
+                symbol=symbol,
+                quantity=book_fill.quantity,
+                price=book_fill.price,
+                venue=venue,
+                timestamp=datetime.utcnow(),
+                commission=book_fill.quantity * book_fill.price * commission_rate
+            ))
+            
+            trade, arrival_price = self._book_orders[book_fill.order_id]
+            execution_report.slippage_bps = float(
+                (execution_report.average_fill_price - arrival_price) / arrival_price * 10000
+            )
+            
+            if execution_report.remaining_quantity:
+                trade.status = TradeStatus.PARTIALLY_FILLED
+                self._publish_order_update(execution_report)
+                continue
+            
+            execution_report.execution_time_ms = (
+                execution_report.execution_completed_at - execution_report.order_received_at
+            ).total_seconds() * 1000
+            trade.mark_executed(
+                execution_report.execution_id,
+                execution_report.average_fill_price,
+                execution_report.execution_completed_at
+            )
+            
+            self.execution_counter.labels(
+                symbol=symbol,
+                trade_type=trade.trade_type,
+                status=execution_report.status.value
+            ).inc()
+            self.execution_value.labels(
+                trade_type=trade.trade_type
+            ).observe(float(execution_report.total_execution_value))
+            
+            self._record_execution(execution_report)
+            del self.active_orders[book_fill.order_id]
+            del self._book_orders[book_fill.order_id]
+            self._publish_order_update(execution_report)
+    
+    def _ensure_order_workers(self) -> None:
+        """Create loop-bound primitives and the worker pool on first use."""
+        if self._order_slots is None:
+            self._order_slots = asyncio.Semaphore(self.config.trading.order_queue_size)
+            self._ready_symbols = asyncio.Queue()
+        
+        self._order_workers = [worker for worker in self._order_workers if not worker.done()]
+        while len(self._order_workers) < self.config.trading.order_workers:
+            self._order_workers.append(asyncio.create_task(self._order_worker()))
+    
+    async def _order_worker(self) -> None:
+        """Execute queued orders, taking the next order of a ready symbol."""
+        while True:
+            symbol = await self._ready_symbols.get()
+            queue = self._symbol_queues[symbol]
+            trade, execution_report = queue.popleft()
+            self.queued_orders -= 1
+            
+            try:
+                # Orders cancelled while queued have already left active_orders
+                if execution_report.order_id in self.active_orders:
+                    await self._execute_order(trade, execution_report, time.time())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Already logged and recorded as rejected
+                pass
+            finally:
+                self._order_slots.release()
+                if queue:
+                    self._ready_symbols.put_nowait(symbol)
+                else:
+                    del self._symbol_queues[symbol]
+    
+    def _publish_order_update(self, execution_report: ExecutionReport) -> None:
+        """Notify listeners of a report change and wake waiters once it is final."""
+        for callback, wanted in list(self._order_listeners.values()):
+            if wanted is not None and wanted != execution_report.order_id:
+                continue
+            try:
+                result = callback(execution_report)
+                if asyncio.iscoroutine(result):
+                    task = asyncio.ensure_future(result)
+                    self._listener_tasks.add(task)
+                    task.add_done_callback(self._listener_tasks.discard)
+            except Exception as e:
+                self.logger.warning("Order listener failed", order_id=execution_report.order_id, error=str(e))
+        
+        if execution_report.order_id not in self.active_orders:
+            for future in self._order_waiters.pop(execution_report.order_id, []):
+                if not future.done():
+                    future.set_result(execution_report)
+    
+    def _record_execution(self, execution_report: ExecutionReport) -> None:
+        """Move a finished report into the execution history and statistics."""
+        self.execution_history.add(execution_report)
+        self.execution_stats.record(execution_report)
+    
+    async def _update_book_subscription(self) -> None:
+        """Stream quotes for symbols with resting orders while any exist."""
+        market_data_service = await get_market_data_service()
+        symbols = [symbol for symbol, book in self.order_books.items() if book]
+        
+        if symbols:
+            if self._unsubscribe_quotes is None:
+                self._unsubscribe_quotes = market_data_service.subscribe_quotes(self._on_market_quote)
+            await market_data_service.watch_symbols("orders", symbols)
+        else:
+            if self._unsubscribe_quotes is not None:
+                self._unsubscribe_quotes()
+                self._unsubscribe_quotes = None
+            await market_data_service.unwatch_symbols("orders")
+    
     async def get_execution_status(self, execution_id: str) -> Optional[ExecutionReport]:
         """
         Get execution status by execution ID.
@@ -728,11 +1273,7 @@ class TradingAPIService:
                 return report
         
         # Check execution history
-        for report in self.execution_history:
-            if report.execution_id == execution_id:
-                return report
-        
-        return None
+        return self.execution_history.get(execution_id)
     
     async def get_order_status(self, order_id: str) -> Optional[ExecutionReport]:
         """
@@ -749,11 +1290,23 @@ class TradingAPIService:
             return self.active_orders[order_id]
         
         # Check execution history
-        for report in self.execution_history:
-            if report.order_id == order_id:
+        return self.execution_history.get_by_order(order_id)
+    
+    async def get_trade_execution(self, trade_id: str) -> Optional[ExecutionReport]:
+        """
+        Get the latest execution report for a trade.
+        
+        Args:
+            trade_id: Trade ID to query
+            
+        Returns:
+            ExecutionReport if found, None otherwise
+        """
+        for report in self.active_orders.values():
+            if report.trade_id == trade_id:
                 return report
         
-        return None
+        return self.execution_history.get_by_trade(trade_id)
     
     async def get_execution_history(
         self, 
@@ -770,16 +1323,8 @@ class TradingAPIService:
         Returns:
             List of ExecutionReport objects
         """
-        history = self.execution_history.copy()
-        
-        # Filter by symbol if specified
-        if symbol:
-            history = [report for report in history if report.symbol == symbol.upper()]
-        
-        # Sort by execution time (most recent first)
-        history.sort(key=lambda r: r.order_received_at, reverse=True)
-        
-        return history[:limit]
+        # Most recently finished first
+        return self.execution_history.recent(symbol.upper() if symbol else None, limit)
     
     async def _validate_trade(self, trade: Trade) -> None:
         """
@@ -886,62 +1431,21 @@ class TradingAPIService:
         """
         Get comprehensive trading statistics.
         
+        Statistics are maintained as executions finish, so this is cheap
+        enough to poll.
+        
         Returns:
             Dict containing trading statistics
         """
-        # Calculate statistics from execution history
-        total_executions = len(self.execution_history)
-        successful_executions = len([r for r in self.execution_history if r.is_complete])
-        partial_executions = len([r for r in self.execution_history if r.is_partial])
-        failed_executions = len([r for r in self.execution_history if r.status == OrderStatus.REJECTED])
-        
-        # Calculate average execution time
-        execution_times = [r.execution_time_ms for r in self.execution_history if r.execution_time_ms]
-        avg_execution_time = sum(execution_times) / len(execution_times) if execution_times else 0
-        
-        # Calculate total volume
-        total_volume = sum(r.total_execution_value for r in self.execution_history)
-        
-        # Calculate average slippage
-        slippages = [r.slippage_bps for r in self.execution_history if r.slippage_bps]
-        avg_slippage = sum(slippages) / len(slippages) if slippages else 0
-        
-        # Symbol breakdown
-        symbol_stats = {}
-        for report in self.execution_history:
-            symbol = report.symbol
-            if symbol not in symbol_stats:
-                symbol_stats[symbol] = {'count': 0, 'volume': 0, 'avg_slippage': 0}
-            
-            symbol_stats[symbol]['count'] += 1
-            symbol_stats[symbol]['volume'] += float(report.total_execution_value)
-            
-            if report.slippage_bps:
-                symbol_stats[symbol]['avg_slippage'] = (
-                    symbol_stats[symbol]['avg_slippage'] + report.slippage_bps
-                ) / 2
-        
-        return {
-            'execution_summary': {
-                'total_executions': total_executions,
-                'successful_executions': successful_executions,
-                'partial_executions': partial_executions,
-                'failed_executions': failed_executions,
-                'success_rate': (successful_executions / total_executions * 100) if total_executions > 0 else 0
-            },
-            'performance_metrics': {
-                'average_execution_time_ms': avg_execution_time,
-                'total_volume': float(total_volume),
-                'average_slippage_bps': avg_slippage,
-                'daily_trade_count': self.daily_trade_count
-            },
-            'symbol_breakdown': symbol_stats,
-            'active_orders': len(self.active_orders),
-            'daily_limits': {
-                'trades_used': self.daily_trade_count,
-                'trades_remaining': max(0, self.position_limits['daily_trade_limit'] - self.daily_trade_count)
-            }
+        statistics = self.execution_stats.get_summary()
+        statistics['performance_metrics']['daily_trade_count'] = self.daily_trade_count
+        statistics['active_orders'] = len(self.active_orders)
+        statistics['daily_limits'] = {
+            'trades_used': self.daily_trade_count,
+            'trades_remaining': max(0, self.position_limits['daily_trade_limit'] - self.daily_trade_count)
         }
+        
+        return statistics
     
     async def simulate_market_conditions(
         self, 
@@ -983,7 +1487,7 @@ class TradingAPIService:
             Dict containing health status information
         """
         # Calculate recent execution success rate
-        recent_executions = [r for r in self.execution_history[-50:]]  # Last 50 executions
+        recent_executions = self.execution_history.recent(limit=50)  # Last 50 executions
         recent_success_rate = 0
         if recent_executions:
             successful = len([r for r in recent_executions if r.is_complete])
@@ -999,9 +1503,12 @@ class TradingAPIService:
             'timestamp': datetime.utcnow().isoformat(),
             'mock_execution_enabled': self.config.trading.mock_execution_enabled,
             'active_orders': len(self.active_orders),
-            'total_executions': len(self.execution_history),
+            'total_executions': self.execution_history.total_recorded,
+            'execution_store': self.execution_history.get_stats(),
             'daily_trade_count': self.daily_trade_count,
             'daily_limit': self.position_limits['daily_trade_limit'],
+            'queued_orders': self.queued_orders,
+            'order_workers': len(self._order_workers),
             'recent_success_rate': recent_success_rate,
             'average_execution_time_ms': avg_recent_time
         }
@@ -1019,6 +1526,16 @@ class TradingAPIService:
     
     async def cleanup(self) -> None:
         """Clean up service resources."""
+        # Stop the order workers; orders still queued are cancelled below
+        for worker in self._order_workers:
+            worker.cancel()
+        await asyncio.gather(*self._order_workers, return_exceptions=True)
+        self._order_workers = []
+        self._symbol_queues.clear()
+        self._ready_symbols = None
+        self._order_slots = None
+        self.queued_orders = 0
+        
         # Cancel any active orders
         for order_id in list(self.active_orders.keys()):
             await self.cancel_order(order_id)
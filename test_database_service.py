@@ -7,8 +7,10 @@ consistency validation.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 import uuid
+import json
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
@@ -19,11 +21,17 @@ from botocore.exceptions import ClientError, BotoCoreError
 # Import the service and models
 from services.database import (
     DatabaseService, DatabaseError, ConnectionError, ValidationError,
-    NotFoundError, ConflictError
+    NotFoundError, ConflictError, POSITION_TRADE_HISTORY_LIMIT
 )
+from services.database import _known_tables as known_tables
+from services.local_dynamodb import LocalDynamoDB
+from services.query_cache import QueryCache
+from services.audit_writer import AuditWriter
+from services.trade_importer import TradeImporter, prepare_chunk, row_to_trade
 from models.trade import Trade, TradeType, TradeStatus, RiskLevel, TradeValidationError
 from models.user import User, UserRole, UserStatus, Permission, UserProfile, UserValidationError
 from models.portfolio import Portfolio, Position, PortfolioStatus, PositionType, PortfolioValidationError
+from models.snapshot import FrozenSnapshotError
 
 
 class TestDatabaseServiceInitialization:
@@ -78,13 +86,59 @@ class TestDatabaseServiceInitialization:
             
             assert "Failed to initialize DynamoDB connection" in str(exc_info.value)
             assert exc_info.value.error_code == "CONNECTION_FAILED"
+    
+    def test_lazy_init_defers_describe_table(self):
+        """Test that lazy mode describes each table once, on first use."""
+        known_tables.clear()
+        with patch('services.database.boto3.client') as mock_client, \
+             patch('services.database.boto3.resource'):
+            
+            service = DatabaseService(table_init_mode='lazy')
+            mock_client.return_value.describe_table.assert_not_called()
+            
+            service._get_table(service.trades_table_name)
+            service._get_table(service.trades_table_name)
+            
+            mock_client.return_value.describe_table.assert_called_once_with(TableName=service.trades_table_name)
+            timings = service.get_cold_start_timings()
+            assert timings['table_init_mode'] == 'lazy'
+            assert timings['tables'][service.trades_table_name]['phase'] == 'first_use'
+            assert 'constructor_ms' in timings
+    
+    def test_parallel_init_describes_all_tables(self):
+        """Test that parallel mode resolves every table during init."""
+        known_tables.clear()
+        with patch('services.database.boto3.client') as mock_client, \
+             patch('services.database.boto3.resource'):
+            
+            def describe_table(TableName):
+                if TableName.endswith('portfolios'):
+                    raise ClientError({'Error': {'Code': 'ResourceNotFoundException', 'Message': 'missing'}},
+                                      'DescribeTable')
+                return {}
+            
+            mock_client.return_value.describe_table.side_effect = describe_table
+            
+            service = DatabaseService(table_init_mode='parallel')
+            
+            assert mock_client.return_value.describe_table.call_count == 6
+            assert set(service._tables) == set(service.table_names)
+            with pytest.raises(ConnectionError) as exc_info:
+                service._get_table(service.portfolios_table_name)
+            assert exc_info.value.error_code == "TABLE_NOT_FOUND"
+            
+            # A second instance in the same process reuses the describe results
+            second = DatabaseService(table_init_mode='parallel')
+            sources = {info['source'] for name, info in second.get_cold_start_timings()['tables'].items()
+                       if name != service.portfolios_table_name}
+            assert sources == {'cache'}
 
 
 class TestDatabaseServiceTradeOperations:
     """Test trade-related database operations."""
     
-    @pytest.fixture
-    def mock_service(self):
+    @pytest_asyncio.fixture
+    async def mock_service(self):
         """Create a mocked database service for testing."""
         with patch('services.database.boto3.client') as mock_client, \
              patch('services.database.boto3.resource') as mock_resource:
@@ -101,7 +155,8 @@ class TestDatabaseServiceTradeOperations:
             service._tables[service.portfolios_table_name] = mock_table
             service._tables[service.audit_table_name] = mock_table
             
-            return service, mock_table
+            yield service, mock_table
+            await service.close()
     
     @pytest.fixture
     def sample_trade(self):
@@ -185,13 +240,230 @@ class TestDatabaseServiceTradeOperations:
         result = await service.get_trade("U12345", "nonexistent-trade-id")
         
         assert result is None
+    
+    @pytest.mark.asyncio
+    async def test_update_trade_status_invalidates_user_cache(self, mock_service, sample_trade):
+        """Test that a status update evicts only the owning user's trade queries."""
+        service, mock_table = mock_service
+        mock_table.query.return_value = {'Items': [sample_trade.to_dict()]}
+        mock_table.update_item.return_value = {}
+        
+        await service.get_user_trades(sample_trade.user_id)
+        await service.get_user_trades("U99999")
+        assert len(service._query_cache) == 2
+        
+        await service.update_trade_status(sample_trade.user_id, sample_trade.trade_id, TradeStatus.EXECUTED)
+        
+        assert len(service._query_cache) == 1
+        metrics = service.get_metrics()
+        assert metrics['cache']['operations']['get_user_trades']['misses'] == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_user_trades_follows_last_evaluated_key(self, mock_service):
+        """Test that iteration pages through the user index with sort-key date bounds."""
+        service, mock_table = mock_service
+        trades = [Trade(user_id="U12345", symbol="AAPL", quantity=i + 1,
+                        trade_type=TradeType.BUY, price=Decimal("150.00")) for i in range(3)]
+        mock_table.query.side_effect = [
+            {'Items': [trades[0].to_dict(), trades[1].to_dict()], 'LastEvaluatedKey': {'pk': 'USER#U12345'}},
+            {'Items': [trades[2].to_dict()]}
+        ]
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        result = [trade async for trade in service.iter_user_trades("U12345", page_size=2, start_date=start)]
+
+        assert [trade.quantity for trade in result] == [1, 2, 3]
+        assert mock_table.query.call_count == 2
+        first_call = mock_table.query.call_args_list[0][1]
+        assert first_call['IndexName'] == 'gsi2'
+        assert first_call['KeyConditionExpression'] == 'gsi2pk = :pk AND gsi2sk >= :start_date'
+        assert 'FilterExpression' not in first_call
+        assert mock_table.query.call_args_list[1][1]['ExclusiveStartKey'] == {'pk': 'USER#U12345'}
+
+    @pytest.mark.asyncio
+    async def test_get_user_trades_fills_limit_across_pages(self, mock_service):
+        """Test that status filtering no longer produces short pages."""
+        service, mock_table = mock_service
+        executed = Trade(user_id="U12345", symbol="AAPL", quantity=10,
+                         trade_type=TradeType.BUY, price=Decimal("150.00"), status=TradeStatus.EXECUTED)
+        mock_table.query.side_effect = [
+            {'Items': [], 'LastEvaluatedKey': {'pk': 'USER#U12345'}},
+            {'Items': [executed.to_dict()]}
+        ]
+
+        result = await service.get_user_trades("U12345", limit=1, status_filter=TradeStatus.EXECUTED)
+
+        assert len(result) == 1
+        assert mock_table.query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_user_trades_cursor(self, mock_service, sample_trade):
+        """Test resuming from a trade cursor and rejecting foreign or malformed cursors."""
+        service, mock_table = mock_service
+        mock_table.query.return_value = {'Items': []}
+        cursor = service.trade_cursor(sample_trade)
+
+        [trade async for trade in service.iter_user_trades(sample_trade.user_id, cursor=cursor)]
+
+        start_key = mock_table.query.call_args[1]['ExclusiveStartKey']
+        assert start_key['sk'] == f"TRADE#{sample_trade.trade_id}"
+        assert start_key['gsi2pk'] == f"USER#{sample_trade.user_id}"
+
+        with pytest.raises(ValidationError) as exc_info:
+            [trade async for trade in service.iter_user_trades("U99999", cursor=cursor)]
+        assert exc_info.value.error_code == "INVALID_CURSOR"
+
+        with pytest.raises(ValidationError):
+            [trade async for trade in service.iter_user_trades(sample_trade.user_id, cursor="not-a-cursor")]
+
+    @pytest.mark.asyncio
+    async def test_get_trades_by_symbol_uses_symbol_index(self, mock_service, sample_trade):
+        """Test that symbol queries use the GSI with sort-key date bounds."""
+        service, mock_table = mock_service
+        mock_table.query.return_value = {'Items': [sample_trade.to_dict()]}
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+        result = await service.get_trades_by_symbol("aapl", start, end)
+
+        assert len(result) == 1
+        call_kwargs = mock_table.query.call_args[1]
+        assert call_kwargs['IndexName'] == 'gsi1'
+        assert call_kwargs['KeyConditionExpression'] == 'gsi1pk = :pk AND gsi1sk BETWEEN :start_date AND :end_date'
+        assert call_kwargs['ExpressionAttributeValues'][':pk'] == 'SYMBOL#AAPL'
+        mock_table.scan.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_trades_by_symbols_merges_by_timestamp(self, mock_service):
+        """Test that per-symbol results are merged newest first and truncated to the limit."""
+        service, mock_table = mock_service
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        def make_trade(symbol, hour):
+            return Trade(user_id="U12345", symbol=symbol, quantity=hour + 1, trade_type=TradeType.BUY,
+                         price=Decimal("10.00"), timestamp=base + timedelta(hours=hour))
+
+        per_symbol = {
+            'SYMBOL#AAPL': [make_trade("AAPL", h).to_dict() for h in (5, 3, 0)],
+            'SYMBOL#MSFT': [make_trade("MSFT", h).to_dict() for h in (4, 2, 1)]
+        }
+        mock_table.query.side_effect = lambda **kwargs: {
+            'Items': per_symbol[kwargs['ExpressionAttributeValues'][':pk']]
+        }
+
+        result = await service.get_trades_by_symbols(["AAPL", "MSFT", "aapl"], limit=4)
+
+        assert [(trade.symbol, trade.quantity) for trade in result] == [
+            ("AAPL", 6), ("MSFT", 5), ("AAPL", 4), ("MSFT", 3)
+        ]
+        assert mock_table.query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_settle_executed_trade_single_transaction(self, mock_service, sample_trade):
+        """Test that an executed trade and its position change share one transaction."""
+        service, mock_table = mock_service
+        service._dynamodb_client.transact_write_items.return_value = {}
+        sample_trade.mark_executed("EXEC123", Decimal("151.00"))
+
+        result = await service.settle_trade(sample_trade)
+
+        assert result is True
+        service._dynamodb_client.transact_write_items.assert_called_once()
+        call_kwargs = service._dynamodb_client.transact_write_items.call_args[1]
+        items = call_kwargs['TransactItems']
+        assert len(items) == 2
+        assert items[0]['Put']['TableName'] == service.trades_table_name
+        assert items[0]['Put']['Item']['status'] == {'S': 'executed'}
+        assert items[1]['Update']['TableName'] == service.positions_table_name
+        assert items[1]['Update']['ConditionExpression'] == "attribute_not_exists(pk)"
+        mock_table.put_item.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_settle_failed_trade_writes_only_trade(self, mock_service, sample_trade):
+        """Test that a failed trade is recorded without touching the position."""
+        service, _ = mock_service
+        service._dynamodb_client.transact_write_items.return_value = {}
+        sample_trade.mark_failed("Rejected by broker")
+
+        await service.settle_trade(sample_trade)
+
+        items = service._dynamodb_client.transact_write_items.call_args[1]['TransactItems']
+        assert len(items) == 1
+        assert 'Put' in items[0]
+
+    @pytest.mark.asyncio
+    async def test_settle_duplicate_trade(self, mock_service, sample_trade):
+        """Test that settling the same trade twice raises a conflict."""
+        service, _ = mock_service
+        service._dynamodb_client.transact_write_items.side_effect = ClientError(
+            {
+                'Error': {'Code': 'TransactionCanceledException', 'Message': 'Transaction cancelled'},
+                'CancellationReasons': [{'Code': 'ConditionalCheckFailed'}, {'Code': 'None'}]
+            },
+            'TransactWriteItems'
+        )
+        sample_trade.mark_executed("EXEC123", Decimal("151.00"))
+
+        with pytest.raises(ConflictError) as exc_info:
+            await service.settle_trade(sample_trade)
+
+        assert exc_info.value.error_code == "DUPLICATE_TRADE"
+
+    @pytest.mark.asyncio
+    async def test_settle_retries_position_conflict(self, mock_service, sample_trade):
+        """Test that a concurrent position change rebuilds and retries the transaction."""
+        service, mock_table = mock_service
+        service._dynamodb_client.transact_write_items.side_effect = [
+            ClientError(
+                {
+                    'Error': {'Code': 'TransactionCanceledException', 'Message': 'Transaction cancelled'},
+                    'CancellationReasons': [{'Code': 'None'}, {'Code': 'ConditionalCheckFailed'}]
+                },
+                'TransactWriteItems'
+            ),
+            {}
+        ]
+        sample_trade.mark_executed("EXEC123", Decimal("151.00"))
+
+        assert await service.settle_trade(sample_trade) is True
+
+        calls = service._dynamodb_client.transact_write_items.call_args_list
+        assert len(calls) == 2
+        assert mock_table.get_item.call_count == 2
+        assert calls[0][1]['ClientRequestToken'] != calls[1][1]['ClientRequestToken']
+
+    @pytest.mark.asyncio
+    async def test_update_position_is_versioned_write(self, mock_service):
+        """Test that position updates are conditioned on the version that was read."""
+        service, mock_table = mock_service
+        mock_table.get_item.return_value = {'Item': {
+            'pk': 'USER#U12345', 'sk': 'SYMBOL#AAPL',
+            'user_id': 'U12345', 'symbol': 'AAPL',
+            'quantity': Decimal('100'), 'average_cost': Decimal('150.00'),
+            'current_price': Decimal('150.00'), 'version': Decimal('3'),
+            'trade_history': ['T1']
+        }}
+        mock_table.update_item.return_value = {}
+
+        await service.update_position("U12345", "AAPL", -40, Decimal("160.00"), "T2")
+
+        mock_table.update_item.assert_called_once()
+        call_kwargs = mock_table.update_item.call_args[1]
+        values = call_kwargs['ExpressionAttributeValues']
+        assert call_kwargs['ConditionExpression'] == "#version = :expected_version"
+        assert values[':expected_version'] == 3
+        assert values[':version'] == 4
+        assert values[':quantity'] == 60
+        assert values[':average_cost'] == Decimal('150.00')
+        assert values[':realized_pnl'] == Decimal('400.00')
+        assert values[':trade_history'] == ['T1', 'T2']
 
 
 class TestDatabaseServiceUserOperations:
     """Test user-related database operations."""
     
-    @pytest.fixture
-    def mock_service(self):
+    @pytest_asyncio.fixture
+    async def mock_service(self):
         """Create a mocked database service for testing."""
         with patch('services.database.boto3.client') as mock_client, \
              patch('services.database.boto3.resource') as mock_resource:
@@ -208,7 +480,8 @@ class TestDatabaseServiceUserOperations:
             service._tables[service.portfolios_table_name] = mock_table
             service._tables[service.audit_table_name] = mock_table
             
-            return service, mock_table
+            yield service, mock_table
+            await service.close()
     
     @pytest.fixture
     def sample_user(self):
@@ -268,8 +541,8 @@ class TestDatabaseServiceUserOperations:
 class TestDatabaseServiceChannelOperations:
     """Test channel-related database operations."""
     
-    @pytest.fixture
-    def mock_service(self):
+    @pytest_asyncio.fixture
+    async def mock_service(self):
         """Create a mocked database service for testing."""
         with patch('services.database.boto3.client') as mock_client, \
              patch('services.database.boto3.resource') as mock_resource:
@@ -286,7 +559,8 @@ class TestDatabaseServiceChannelOperations:
             service._tables[service.portfolios_table_name] = mock_table
             service._tables[service.audit_table_name] = mock_table
             
-            return service, mock_table
+            yield service, mock_table
+            await service.close()
     
     @pytest.mark.asyncio
     async def test_is_channel_approved_true(self, mock_service):
@@ -329,8 +603,8 @@ class TestDatabaseServiceChannelOperations:
 class TestDatabaseServiceErrorHandling:
     """Test error handling and edge cases."""
     
-    @pytest.fixture
-    def mock_service(self):
+    @pytest_asyncio.fixture
+    async def mock_service(self):
         """Create a mocked database service for testing."""
         with patch('services.database.boto3.client') as mock_client, \
              patch('services.database.boto3.resource') as mock_resource:
@@ -347,7 +621,8 @@ class TestDatabaseServiceErrorHandling:
             service._tables[service.portfolios_table_name] = mock_table
             service._tables[service.audit_table_name] = mock_table
             
-            return service, mock_table
+            yield service, mock_table
+            await service.close()
     
     @pytest.mark.asyncio
     async def test_throttling_error_handling(self, mock_service):
@@ -394,8 +669,8 @@ class TestDatabaseServiceErrorHandling:
 class TestDatabaseServiceHealthAndMonitoring:
     """Test health check and monitoring functionality."""
     
-    @pytest.fixture
-    def mock_service(self):
+    @pytest_asyncio.fixture
+    async def mock_service(self):
         """Create a mocked database service for testing."""
         with patch('services.database.boto3.client') as mock_client, \
              patch('services.database.boto3.resource') as mock_resource:
@@ -412,7 +687,8 @@ class TestDatabaseServiceHealthAndMonitoring:
             service._tables[service.portfolios_table_name] = mock_table
             service._tables[service.audit_table_name] = mock_table
             
-            return service, mock_table
+            yield service, mock_table
+            await service.close()
     
     def test_get_health_status_healthy(self, mock_service):
         """Test health status when all tables are healthy."""
@@ -429,6 +705,7 @@ class TestDatabaseServiceHealthAndMonitoring:
         assert 'metrics' in health
         assert 'cache_size' in health
         assert 'timestamp' in health
+        assert 'cold_start' in health
         
         # All tables should be healthy
         for table_status in health['tables'].values():
@@ -454,6 +731,697 @@ class TestDatabaseServiceHealthAndMonitoring:
         assert service._metrics['queries_executed'] == 10
 
 
+class TestQueryCache:
+    """Test the TTL + LRU query cache used by the database service."""
+    
+    def test_lru_eviction_by_entry_count(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = QueryCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        
+        # Touch 'a' so 'b' becomes least recently used
+        assert cache.get('a') == 1
+        cache.put('c', 3)
+        
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+        assert cache.get_stats()['evictions'] == 1
+    
+    def test_eviction_by_byte_budget(self):
+        """Test that entries are evicted to stay within the byte bound."""
+        cache = QueryCache(max_entries=100, max_bytes=2000)
+        for i in range(20):
+            cache.put(f'key{i}', 'x' * 200)
+        
+        assert cache.total_bytes <= 2000
+        assert len(cache) < 20
+        assert 'key19' in cache
+    
+    def test_entry_expires_after_ttl(self):
+        """Test per-entry TTL expiry."""
+        cache = QueryCache(default_ttl=300)
+        
+        with patch('services.query_cache.time.monotonic', return_value=1000.0):
+            cache.put('short', 'value', ttl=1)
+            cache.put('long', 'value')
+        
+        with patch('services.query_cache.time.monotonic', return_value=1002.0):
+            assert cache.get('short') is None
+            assert cache.get('long') == 'value'
+        
+        assert cache.get_stats()['expirations'] == 1
+    
+    def test_invalidate_user_only_touches_that_user(self):
+        """Test user-indexed invalidation with an operation filter."""
+        cache = QueryCache()
+        cache.put('get_user_trades:user_id:U1', [], operation='get_user_trades', user_id='U1')
+        cache.put('get_user_positions:user_id:U1', [], operation='get_user_positions', user_id='U1')
+        cache.put('get_user_trades:user_id:U2', [], operation='get_user_trades', user_id='U2')
+        
+        removed = cache.invalidate_user('U1', operations=['get_user_trades'])
+        
+        assert removed == 1
+        assert 'get_user_trades:user_id:U1' not in cache
+        assert 'get_user_positions:user_id:U1' in cache
+        assert 'get_user_trades:user_id:U2' in cache
+    
+    def test_per_operation_hit_miss_counts(self):
+        """Test that hits and misses are tracked per operation."""
+        cache = QueryCache()
+        cache.put('k', 'v', operation='get_user')
+        
+        cache.get('k', operation='get_user')
+        cache.get('missing', operation='get_user')
+        cache.get('missing', operation='get_trade')
+        
+        operations = cache.get_stats()['operations']
+        assert operations['get_user'] == {'hits': 1, 'misses': 1}
+        assert operations['get_trade'] == {'hits': 0, 'misses': 1}
+
+
+class TestAuditWriter:
+    """Test the buffered, batched audit writer."""
+    
+    @pytest.mark.asyncio
+    async def test_flushes_in_batches_of_25(self):
+        """Test that buffered entries are written in BatchWriteItem-sized chunks."""
+        batches = []
+        
+        async def write_batch(items):
+            batches.append(list(items))
+            return []
+        
+        writer = AuditWriter(write_batch, flush_interval=60)
+        for i in range(60):
+            await writer.submit({'audit_id': str(i)})
+        
+        await writer.close()
+        
+        assert [len(batch) for batch in batches] == [25, 25, 10]
+        assert writer.get_metrics()['entries_written'] == 60
+        assert writer.pending == 0
+    
+    @pytest.mark.asyncio
+    async def test_retries_unprocessed_items(self):
+        """Test that unprocessed items are retried until written."""
+        calls = []
+        
+        async def write_batch(items):
+            calls.append(len(items))
+            # First attempt leaves the last two items unprocessed
+            return list(items[-2:]) if len(calls) == 1 else []
+        
+        writer = AuditWriter(write_batch, flush_interval=60, base_backoff=0)
+        for i in range(5):
+            await writer.submit({'audit_id': str(i)})
+        
+        await writer.close()
+        
+        assert calls == [5, 2]
+        metrics = writer.get_metrics()
+        assert metrics['entries_written'] == 5
+        assert metrics['retries'] == 1
+        assert metrics['entries_dropped'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_backpressure_when_buffer_full(self):
+        """Test that producers wait for a flush when the buffer is full."""
+        written = []
+        
+        async def write_batch(items):
+            written.extend(items)
+            return []
+        
+        writer = AuditWriter(write_batch, batch_size=5, flush_interval=60, max_buffer_size=5)
+        for i in range(12):
+            await writer.submit({'audit_id': str(i)})
+        
+        assert writer.get_metrics()['backpressure_waits'] > 0
+        assert writer.pending <= 5
+        
+        await writer.close()
+        assert len(written) == 12
+    
+    @pytest.mark.asyncio
+    async def test_close_stops_flush_task(self):
+        """Test that closing right after a batch fills leaves no flush task running."""
+        written = []
+        
+        async def write_batch(items):
+            written.extend(items)
+            return []
+        
+        writer = AuditWriter(write_batch, flush_interval=60)
+        for i in range(25):
+            await writer.submit({'audit_id': str(i)})
+        flush_task = writer._flush_task
+        
+        await writer.close()
+        
+        assert flush_task.done()
+        assert writer._flush_task is None
+        assert len(written) == 25
+    
+    @pytest.mark.asyncio
+    async def test_service_audit_events_use_batch_write(self):
+        """Test that DatabaseService audit events go through BatchWriteItem."""
+        with patch('services.database.boto3.client'), \
+             patch('services.database.boto3.resource') as mock_resource:
+            
+            mock_table = Mock()
+            mock_resource.return_value.Table.return_value = mock_table
+            mock_resource.return_value.batch_write_item.return_value = {'UnprocessedItems': {}}
+            
+            service = DatabaseService()
+            
+            for i in range(30):
+                await service._log_audit_event('trade_created', 'U12345', {'n': i})
+            await service.close()
+            
+            calls = mock_resource.return_value.batch_write_item.call_args_list
+            assert len(calls) == 2
+            request_items = calls[0][1]['RequestItems'][service.audit_table_name]
+            assert len(request_items) == 25
+            assert request_items[0]['PutRequest']['Item']['event_type'] == 'trade_created'
+            mock_table.put_item.assert_not_called()
+
+
+class TestTradeImporter:
+    """Test the bulk trade import pipeline."""
+    
+    @pytest_asyncio.fixture
+    async def mock_service(self):
+        """Create a database service whose resource records BatchWriteItem calls."""
+        with patch('services.database.boto3.client'), \
+             patch('services.database.boto3.resource') as mock_resource:
+            
+            mock_table = Mock()
+            mock_resource.return_value.Table.return_value = mock_table
+            
+            service = DatabaseService()
+            yield service, mock_resource.return_value
+            await service.close()
+    
+    def test_row_to_trade_coerces_csv_values(self):
+        """Test that CSV strings, empty cells and JSON columns are converted."""
+        trade = row_to_trade({
+            'user_id': 'U12345', 'symbol': 'AAPL', 'quantity': '100', 'trade_type': 'buy',
+            'price': '150.25', 'notes': '', 'market_data': '{"bid": 150.2}', 'unknown_column': 'x'
+        })
+        
+        assert trade.quantity == 100
+        assert trade.price == Decimal('150.25')
+        assert trade.notes is None
+        assert trade.market_data == {'bid': Decimal('150.2')}
+    
+    def test_prepare_chunk_reports_invalid_rows(self):
+        """Test that invalid rows are reported with their line numbers."""
+        valid = json.dumps({'user_id': 'U12345', 'symbol': 'AAPL', 'quantity': 10,
+                            'trade_type': 'buy', 'price': '150.00'})
+        rows = [(1, valid), (2, '{not json'), (3, valid.replace('10', '-10'))]
+        
+        items, errors = prepare_chunk(rows, ttl=123)
+        
+        assert len(items) == 1
+        assert items[0]['pk'] == 'USER#U12345'
+        assert items[0]['ttl'] == 123
+        assert [error.split(':')[0] for error in errors] == ['line 2', 'line 3']
+    
+    @pytest.mark.asyncio
+    async def test_write_trade_item_batch_retries_unprocessed(self, mock_service):
+        """Test unprocessed items are retried and consumed capacity is summed."""
+        service, resource = mock_service
+        items = [{'pk': f'USER#U{i}', 'sk': f'TRADE#{i}'} for i in range(3)]
+        resource.batch_write_item.side_effect = [
+            {'UnprocessedItems': {service.trades_table_name: [{'PutRequest': {'Item': items[2]}}]},
+             'ConsumedCapacity': [{'CapacityUnits': 2.0}]},
+            {'UnprocessedItems': {}, 'ConsumedCapacity': [{'CapacityUnits': 1.0}]}
+        ]
+        
+        result = await service.write_trade_item_batch(items, base_backoff=0)
+        
+        assert result == {'written': 3, 'unprocessed': [], 'consumed_wcu': 3.0, 'retries': 1}
+        retry_request = resource.batch_write_item.call_args_list[1][1]['RequestItems']
+        assert retry_request[service.trades_table_name] == [{'PutRequest': {'Item': items[2]}}]
+    
+    @pytest.mark.asyncio
+    async def test_write_trade_items_spreads_partitions(self, mock_service):
+        """Test that batches interleave partition keys and respect the 25-item limit."""
+        service, resource = mock_service
+        resource.batch_write_item.return_value = {'UnprocessedItems': {}}
+        items = [{'pk': f'USER#U{i % 2}', 'sk': f'TRADE#{i}'} for i in range(30)]
+        
+        result = await service.write_trade_items(items, max_concurrency=4)
+        
+        assert result['written'] == 30
+        batches = [call[1]['RequestItems'][service.trades_table_name]
+                   for call in resource.batch_write_item.call_args_list]
+        assert [len(batch) for batch in batches] == [25, 5]
+        assert [request['PutRequest']['Item']['pk'] for request in batches[0][:2]] == ['USER#U0', 'USER#U1']
+    
+    @pytest.mark.asyncio
+    async def test_write_trade_items_counts_duplicates(self, mock_service):
+        """Test that items repeating a key are dropped and counted so totals reconcile."""
+        service, resource = mock_service
+        resource.batch_write_item.return_value = {'UnprocessedItems': {}}
+        items = [{'pk': 'USER#U1', 'sk': f'TRADE#{i % 4}', 'n': i} for i in range(6)]
+        
+        result = await service.write_trade_items(items)
+        
+        assert result['written'] == 4
+        assert result['duplicates'] == 2
+        assert result['written'] + len(result['unprocessed']) + result['duplicates'] == len(items)
+        written = resource.batch_write_item.call_args[1]['RequestItems'][service.trades_table_name]
+        assert sorted(request['PutRequest']['Item']['n'] for request in written) == [2, 3, 4, 5]
+    
+    @pytest.mark.asyncio
+    async def test_import_file_reports_throughput(self, tmp_path):
+        """Test importing a JSONL file end to end through write_trade_items."""
+        path = tmp_path / "trades.jsonl"
+        with open(path, 'w') as f:
+            for i in range(5):
+                f.write(json.dumps({'user_id': f'U{i}', 'symbol': 'AAPL', 'quantity': i + 1,
+                                    'trade_type': 'buy', 'price': '150.00'}) + '\n')
+            f.write('\n{"user_id": "U1"}\n')
+        
+        db_service = Mock()
+        db_service.write_trade_items = AsyncMock(side_effect=lambda items, **kwargs: {
+            'written': len(items), 'unprocessed': [], 'duplicates': 0,
+            'consumed_wcu': float(len(items)), 'retries': 0
+        })
+        importer = TradeImporter(db_service, chunk_size=2, validation_workers=0)
+        
+        report = await importer.import_file(path)
+        
+        assert report.rows_read == 6
+        assert report.imported == 5
+        assert report.invalid == 1
+        assert report.consumed_wcu == 5.0
+        assert report.errors[0].startswith('line 7:')
+        assert report.to_dict()['items_per_second'] > 0
+
+
+class TestModelSnapshots:
+    """Test immutable model snapshots served from the query cache."""
+    
+    @pytest_asyncio.fixture
+    async def mock_service(self):
+        """Create a mocked database service for testing."""
+        with patch('services.database.boto3.client'), \
+             patch('services.database.boto3.resource') as mock_resource:
+            
+            mock_table = Mock()
+            mock_resource.return_value.Table.return_value = mock_table
+            
+            service = DatabaseService()
+            service._tables[service.trades_table_name] = mock_table
+            service._tables[service.positions_table_name] = mock_table
+            service._tables[service.users_table_name] = mock_table
+            yield service, mock_table
+            await service.close()
+    
+    def test_frozen_snapshot_rejects_mutation(self):
+        """Test that frozen models reject attribute and container writes."""
+        position = Position(user_id="U12345", symbol="AAPL", quantity=10,
+                            average_cost=Decimal("100.00"), current_price=Decimal("110.00"),
+                            trade_history=["T1"])
+        position.freeze()
+        
+        with pytest.raises(FrozenSnapshotError):
+            position.quantity = 20
+        with pytest.raises(FrozenSnapshotError):
+            position.trade_history.append("T2")
+        with pytest.raises(FrozenSnapshotError):
+            position.add_trade("T2", 5, Decimal("120.00"))
+    
+    def test_add_trade_copies_on_write(self):
+        """Test that mutating a thawed copy leaves the snapshot untouched."""
+        snapshot = Position(user_id="U12345", symbol="AAPL", quantity=10,
+                            average_cost=Decimal("100.00"), current_price=Decimal("110.00"),
+                            trade_history=["T1"]).freeze()
+        
+        position = snapshot.thaw()
+        assert position.trade_history is snapshot.trade_history
+        
+        position.add_trade("T2", 10, Decimal("120.00"))
+        
+        assert position.quantity == 20
+        assert position.trade_history == ["T1", "T2"]
+        assert snapshot.quantity == 10
+        assert snapshot.trade_history == ["T1"]
+    
+    def test_thawed_user_nested_profile_is_independent(self):
+        """Test that nested snapshots are thawed and containers copied on write."""
+        user = User(user_id="user-1", slack_user_id="U12345", role=UserRole.EXECUTION_TRADER,
+                    profile=UserProfile(display_name="Trader", email="t@example.com",
+                                        department="Trading"))
+        snapshot = user.freeze()
+        
+        copy = snapshot.thaw()
+        copy.record_login()
+        copy.add_channel_access("C123")
+        
+        assert snapshot.profile.last_login is None
+        assert "C123" not in snapshot.channel_restrictions
+        assert len(snapshot.audit_trail) == len(user.audit_trail)
+        assert copy.to_dict()['channel_restrictions'] == ["C123"]
+    
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_rehydration(self, mock_service):
+        """Test that cache hits hand out snapshots without calling from_dict."""
+        service, mock_table = mock_service
+        trade = Trade(user_id="U12345", symbol="AAPL", quantity=100,
+                      trade_type=TradeType.BUY, price=Decimal("150.00"))
+        mock_table.query.return_value = {'Items': [trade.to_dict()]}
+        
+        first = await service.get_user_trades("U12345")
+        with patch.object(Trade, 'from_dict', side_effect=AssertionError("rehydrated")):
+            second = await service.get_user_trades("U12345")
+        
+        assert second[0].trade_id == first[0].trade_id
+        assert second[0] is not first[0]
+        
+        second[0].mark_executed("EXEC1", Decimal("151.00"))
+        third = await service.get_user_trades("U12345")
+        assert third[0].status == TradeStatus.PENDING
+        assert mock_table.query.call_count == 1
+
+
+class TestDatabaseServiceAsyncClient:
+    """Test the aioboto3 async data path."""
+    
+    @pytest_asyncio.fixture
+    async def async_service(self):
+        """Create a database service in async mode with awaitable table mocks."""
+        with patch('services.database.boto3.client') as mock_client, \
+             patch('services.database.boto3.resource') as mock_resource:
+            
+            mock_table = Mock()
+            mock_table.load.return_value = None
+            mock_resource.return_value.Table.return_value = mock_table
+            
+            service = DatabaseService(use_async_client=True)
+            
+            async_table = AsyncMock()
+            for table_name in service.table_names:
+                service._async_tables[table_name] = async_table
+            
+            yield service, mock_table, async_table
+            await service.close()
+    
+    def test_async_client_falls_back_without_aioboto3(self):
+        """Test that async mode falls back to sync when aioboto3 is missing."""
+        with patch('services.database.boto3.client'), \
+             patch('services.database.boto3.resource') as mock_resource, \
+             patch('services.database.AIOBOTO3_AVAILABLE', False):
+            
+            mock_resource.return_value.Table.return_value = Mock()
+            
+            service = DatabaseService(use_async_client=True)
+            
+            assert service.use_async_client is False
+    
+    @pytest.mark.asyncio
+    async def test_log_trade_uses_async_table(self, async_service):
+        """Test that writes are awaited on the async table, not the sync one."""
+        service, sync_table, async_table = async_service
+        async_table.put_item.return_value = {}
+        
+        trade = Trade(
+            user_id="U12345",
+            symbol="AAPL",
+            quantity=100,
+            trade_type=TradeType.BUY,
+            price=Decimal("150.00")
+        )
+        
+        result = await service.log_trade(trade)
+        
+        assert result is True
+        async_table.put_item.assert_awaited()
+        sync_table.put_item.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_get_user_uses_async_table(self, async_service):
+        """Test that reads return parsed models from the async table."""
+        service, _, async_table = async_service
+        
+        user = User(
+            user_id=str(uuid.uuid4()),
+            slack_user_id="U12345",
+            role=UserRole.EXECUTION_TRADER,
+            profile=UserProfile(display_name="John Doe", email="john.doe@example.com", department="Trading")
+        )
+        async_table.get_item.return_value = {'Item': user.to_dict()}
+        
+        result = await service.get_user(user.user_id)
+        
+        assert result is not None
+        assert result.user_id == user.user_id
+        async_table.get_item.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_async_client_error_mapping(self, async_service):
+        """Test that ClientErrors raised by awaited operations are mapped."""
+        service, _, async_table = async_service
+        async_table.get_item.side_effect = ClientError(
+            {'Error': {'Code': 'ValidationException', 'Message': 'Invalid key'}},
+            'GetItem'
+        )
+        
+        with pytest.raises(DatabaseError):
+            await service.get_trade("U12345", "T123")
+        
+        assert service._metrics['errors'] > 0
+
+
+
+class TestLocalBackend:
+    """Test the service end to end on the embedded local backend."""
+    
+    @pytest_asyncio.fixture
+    async def local_service(self):
+        """Create a database service backed by the in-process store."""
+        service = DatabaseService(backend='local')
+        yield service
+        await service.close()
+    
+    @staticmethod
+    def make_trade(trade_id, symbol="AAPL", trade_type=TradeType.BUY, quantity=10, minutes=0,
+                   price=Decimal("150.00")):
+        trade = Trade(
+            trade_id=trade_id,
+            user_id="U12345",
+            symbol=symbol,
+            quantity=quantity,
+            trade_type=trade_type,
+            price=price,
+            timestamp=datetime(2026, 1, 5, 15, 0, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+        )
+        trade.mark_executed(f"EXEC-{trade_id}", price)
+        return trade
+    
+    def test_mock_credentials_select_local_backend(self):
+        """Test that development mock credentials run on the local backend."""
+        with patch.dict('os.environ', {'ENVIRONMENT': 'development', 'AWS_ACCESS_KEY_ID': 'mock-access-key-id'}):
+            service = DatabaseService()
+        
+        assert service.is_mock_mode is True
+        assert service.backend == 'local'
+        assert service.use_async_client is False
+        assert service.get_health_status()['status'] == 'healthy'
+    
+    @pytest.mark.asyncio
+    async def test_settle_trades_updates_positions(self, local_service):
+        """Test settlement transactions, aggregate positions and duplicate detection."""
+        buy = self.make_trade("T1", quantity=100)
+        sell = self.make_trade("T2", trade_type=TradeType.SELL, quantity=40, minutes=1)
+        
+        assert await local_service.settle_trade(buy) is True
+        assert await local_service.settle_trade(sell) is True
+        
+        positions = await local_service.get_user_positions("U12345")
+        assert len(positions) == 1
+        assert positions[0].symbol == "AAPL"
+        assert positions[0].quantity == 60
+        
+        stored = await local_service.get_trade("U12345", "T1")
+        assert stored.status == TradeStatus.EXECUTED
+        assert stored.quantity == 100
+        
+        with pytest.raises(ConflictError):
+            await local_service.settle_trade(self.make_trade("T1", quantity=5))
+    
+    @pytest.mark.asyncio
+    async def test_position_cost_basis_resets_when_flat(self, local_service):
+        """Test that closing a position realizes P&L and reopening starts a new cost basis."""
+        await local_service.settle_trade(self.make_trade("T1", quantity=100, price=Decimal("10.00")))
+        await local_service.settle_trade(
+            self.make_trade("T2", trade_type=TradeType.SELL, quantity=100, minutes=1, price=Decimal("12.00"))
+        )
+        assert await local_service.get_user_positions("U12345") == []
+        
+        await local_service.settle_trade(self.make_trade("T3", quantity=100, minutes=2, price=Decimal("20.00")))
+        
+        positions = await local_service.get_user_positions("U12345")
+        assert len(positions) == 1
+        assert positions[0].quantity == 100
+        assert positions[0].average_cost == Decimal("20.00")
+        assert positions[0].realized_pnl == Decimal("200.00")
+        assert positions[0].trade_history == ["T1", "T2", "T3"]
+    
+    @pytest.mark.asyncio
+    async def test_update_position_caps_trade_history(self, local_service):
+        """Test that only the most recent trade IDs are kept on the position item."""
+        for i in range(POSITION_TRADE_HISTORY_LIMIT + 5):
+            await local_service.update_position("U12345", "AAPL", 1, Decimal("10.00"), f"T{i}")
+        
+        positions = await local_service.get_user_positions("U12345")
+        assert positions[0].quantity == POSITION_TRADE_HISTORY_LIMIT + 5
+        assert len(positions[0].trade_history) == POSITION_TRADE_HISTORY_LIMIT
+        assert positions[0].trade_history[-1] == f"T{POSITION_TRADE_HISTORY_LIMIT + 4}"
+    
+    @pytest.mark.asyncio
+    async def test_backfill_user_trade_index(self, local_service):
+        """Test that trades stored without gsi2 attributes become visible to user queries."""
+        for i in range(3):
+            await local_service.log_trade(self.make_trade(f"T{i}", minutes=i))
+        
+        table = local_service.local_store.resource.Table(local_service.trades_table_name)
+        for i in range(2):
+            table.update_item(Key={'pk': 'USER#U12345', 'sk': f"TRADE#T{i}"},
+                              UpdateExpression='REMOVE gsi2pk, gsi2sk')
+        assert [t.trade_id for t in await local_service.get_user_trades("U12345")] == ["T2"]
+        
+        assert await local_service.backfill_user_trade_index(page_size=2) == 2
+        assert await local_service.backfill_user_trade_index() == 0
+        
+        trades = [t.trade_id async for t in local_service.iter_user_trades("U12345")]
+        assert trades == ["T2", "T1", "T0"]
+    
+    @pytest.mark.asyncio
+    async def test_trade_indexes_and_pagination(self, local_service):
+        """Test the per-user and per-symbol indexes with paginated reads."""
+        for i in range(12):
+            await local_service.log_trade(self.make_trade(f"T{i:02d}", symbol="AAPL" if i % 2 else "MSFT", minutes=i))
+        
+        newest = await local_service.get_user_trades("U12345", limit=5)
+        assert [t.trade_id for t in newest] == ["T11", "T10", "T09", "T08", "T07"]
+        
+        oldest_first = [t.trade_id async for t in local_service.iter_user_trades("U12345", page_size=4, newest_first=False)]
+        assert oldest_first == [f"T{i:02d}" for i in range(12)]
+        
+        start = datetime(2026, 1, 5, 15, 2, tzinfo=timezone.utc)
+        symbol_trades = await local_service.get_trades_by_symbol(
+            "AAPL", start_date=start, end_date=start + timedelta(minutes=4), newest_first=False
+        )
+        assert [t.trade_id for t in symbol_trades] == ["T03", "T05"]
+        
+        await local_service.update_trade_status("U12345", "T03", TradeStatus.CANCELLED)
+        assert (await local_service.get_trade("U12345", "T03")).status == TradeStatus.CANCELLED
+        
+        with pytest.raises(DatabaseError):
+            await local_service.update_trade_status("U12345", "missing", TradeStatus.CANCELLED)
+    
+    @pytest.mark.asyncio
+    async def test_users_channels_and_audit(self, local_service):
+        """Test user lookups, channel approval and buffered audit writes."""
+        user = User(
+            user_id=str(uuid.uuid4()),
+            slack_user_id="U67890",
+            role=UserRole.EXECUTION_TRADER,
+            profile=UserProfile(display_name="Jane Roe", email="jane.roe@example.com", department="Trading")
+        )
+        
+        assert await local_service.create_user(user) is True
+        assert (await local_service.get_user(user.user_id)).slack_user_id == "U67890"
+        assert (await local_service.get_user_by_slack_id("U67890")).user_id == user.user_id
+        
+        assert await local_service.is_channel_approved("C123") is False
+        await local_service.add_approved_channel("C123", "trading", user.user_id)
+        assert await local_service.is_channel_approved("C123") is True
+        
+        result = await local_service.batch_write_trades([self.make_trade(f"B{i}", minutes=i) for i in range(30)])
+        assert result['success'] == 30
+        assert result['consumed_wcu'] > 0
+        
+        await local_service.flush_audit_log()
+        stats = local_service.local_store.get_stats()
+        assert stats[local_service.audit_table_name]['item_count'] >= 2
+        assert stats[local_service.trades_table_name]['item_count'] == 30
+    
+    def test_local_table_expression_semantics(self):
+        """Test DynamoDB semantics of the embedded table implementation."""
+        store = LocalDynamoDB()
+        table = store.resource.Table('slack-trading-bot-positions')
+        
+        for i in range(5):
+            table.update_item(
+                Key={'pk': 'USER#1', 'sk': f'SYMBOL#S{i}'},
+                UpdateExpression='SET #h = list_append(if_not_exists(#h, :empty), :ids) ADD #q :q',
+                ExpressionAttributeNames={'#h': 'history', '#q': 'quantity'},
+                ExpressionAttributeValues={':empty': [], ':ids': ['T1'], ':q': i}
+            )
+        table.update_item(
+            Key={'pk': 'USER#1', 'sk': 'SYMBOL#S1'},
+            UpdateExpression='ADD quantity :q',
+            ExpressionAttributeValues={':q': 10}
+        )
+        
+        page = table.query(KeyConditionExpression='pk = :pk', ExpressionAttributeValues={':pk': 'USER#1'}, Limit=2)
+        assert [item['sk'] for item in page['Items']] == ['SYMBOL#S0', 'SYMBOL#S1']
+        assert page['Items'][1]['quantity'] == Decimal('11')
+        assert page['LastEvaluatedKey'] == {'pk': 'USER#1', 'sk': 'SYMBOL#S1'}
+        
+        rest = table.query(
+            KeyConditionExpression='pk = :pk AND begins_with(sk, :prefix)',
+            FilterExpression='quantity > :min',
+            ExpressionAttributeValues={':pk': 'USER#1', ':prefix': 'SYMBOL#', ':min': 2},
+            ExclusiveStartKey=page['LastEvaluatedKey']
+        )
+        assert [item['sk'] for item in rest['Items']] == ['SYMBOL#S3', 'SYMBOL#S4']
+        assert rest['ScannedCount'] == 3
+        
+        with pytest.raises(ClientError) as exc_info:
+            table.put_item(
+                Item={'pk': 'USER#1', 'sk': 'SYMBOL#S0'},
+                ConditionExpression='attribute_not_exists(pk)'
+            )
+        assert exc_info.value.response['Error']['Code'] == 'ConditionalCheckFailedException'
+        
+        with pytest.raises(ClientError) as exc_info:
+            table.query(KeyConditionExpression='pk = :pk', ExpressionAttributeValues={':pk': 'USER#1', ':unused': 1})
+        assert exc_info.value.response['Error']['Code'] == 'ValidationException'
+        
+        with pytest.raises(TypeError):
+            table.put_item(Item={'pk': 'USER#1', 'sk': 'SYMBOL#S9', 'price': 1.5})
+    
+    def test_local_transaction_is_atomic(self):
+        """Test that a cancelled transaction writes nothing and reports reasons."""
+        store = LocalDynamoDB()
+        trades = store.resource.Table('slack-trading-bot-trades')
+        trades.put_item(Item={'pk': 'USER#1', 'sk': 'TRADE#1'})
+        
+        with pytest.raises(ClientError) as exc_info:
+            store.client.transact_write_items(TransactItems=[
+                {'Put': {
+                    'TableName': 'slack-trading-bot-positions',
+                    'Item': {'pk': {'S': 'USER#1'}, 'sk': {'S': 'SYMBOL#AAPL'}}
+                }},
+                {'Put': {
+                    'TableName': 'slack-trading-bot-trades',
+                    'Item': {'pk': {'S': 'USER#1'}, 'sk': {'S': 'TRADE#1'}},
+                    'ConditionExpression': 'attribute_not_exists(pk)'
+                }}
+            ])
+        
+        response = exc_info.value.response
+        assert response['Error']['Code'] == 'TransactionCanceledException'
+        assert [reason['Code'] for reason in response['CancellationReasons']] == ['None', 'ConditionalCheckFailed']
+        assert store.get_stats()['slack-trading-bot-positions']['item_count'] == 0
+
 if __name__ == '__main__':
     # Run tests
     pytest.main([__file__, '-v', '--tb=short'])
\ No newline at end of file
@@ -273,8 +273,7 @@ class TestCompleteUserWorkflows:
         
         # Verify trade was executed
         service_container._trading_api_service.execute_trade.assert_called_once()
-        service_container._database_service.log_trade.assert_called_once()
-        service_container._database_service.update_position.assert_called_once()
+        service_container._database_service.settle_trade.assert_called_once()
         
         # Verify success notification was sent
         assert mock_slack_client.chat_postMessage.called or mock_slack_client.chat_postEphemeral.called
@@ -290,8 +289,7 @@ class TestCompleteUserWorkflows:
             'get_quote',
             'analyze_trade_risk',
             'execute_trade',
-            'log_trade',
-            'update_position'
+            'settle_trade'
         ]
         
         # Check that all expected operations completed successfully
@@ -573,12 +571,29 @@ class TestCompleteUserWorkflows:
         # Verify failure notification was sent
         assert mock_slack_client.chat_postMessage.called or mock_slack_client.chat_postEphemeral.called
         
-        # Verify trade was logged with failed status
-        service_container._database_service.log_trade.assert_called()
-        logged_trade = service_container._database_service.log_trade.call_args[0][0]
-        # Note: Status might be updated after logging, so we check the update call
-        service_container._database_service.update_trade_status.assert_called()
-    
+        # Verify trade was settled with failed status
+        service_container._database_service.settle_trade.assert_called()
+        settled_trade = service_container._database_service.settle_trade.call_args[0][0]
+        assert settled_trade.status == TradeStatus.FAILED
+        
+        # Test 5: Trading API raising still leaves a failed trade record
+        service_container._database_service.settle_trade.reset_mock()
+        service_container._trading_api_service.execute_trade.return_value = None
+        service_container._trading_api_service.execute_trade.side_effect = Exception("Broker connection lost")
+        
+        await action_handler.process_action(
+            ActionType.SUBMIT_TRADE,
+            trade_submission,
+            mock_slack_client,
+            AsyncMock(),
+            MagicMock()
+        )
+        
+        service_container._database_service.settle_trade.assert_called_once()
+        settled_trade = service_container._database_service.settle_trade.call_args[0][0]
+        assert settled_trade.status == TradeStatus.FAILED
+        assert "Broker connection lost" in settled_trade.notes
+
     @pytest.mark.asyncio
     async def test_role_based_workflow_variations(self, service_container, mock_slack_client, test_users):
         """
@@ -24,6 +24,7 @@ import gc
 from listeners.commands import CommandHandler, CommandType
 from listeners.actions import ActionHandler, ActionType
 from services.service_container import ServiceContainer
+from services.database import DatabaseService
 from models.user import User, UserRole, Permission
 from models.trade import Trade, TradeType, TradeStatus
 
@@ -691,8 +692,8 @@ class TestPerformanceAndLoad:
         Tests database operations with increasing data volumes and
         concurrent access patterns to identify scaling bottlenecks.
         """
-        # Use real mock database service for this test
-        db_service = MockDatabaseService()
+        # Run the real DatabaseService code paths on the embedded local backend
+        db_service = DatabaseService(backend='local')
         
         # Pre-populate database with test data
         bulk_data = create_bulk_test_data(
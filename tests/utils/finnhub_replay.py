@@ -0,0 +1,353 @@
+"""
+Record/Replay Harness for Finnhub REST Traffic
+
+Captures real ``/quote``, ``/stock/profile2``, ``/search`` and
+``/stock/market-status`` responses into a compact cassette file and serves
+them back from a local aiohttp app, so the full MarketDataService stack
+(cache, rate limiter, circuit breakers, retries) can be exercised and
+benchmarked without network access.
+
+Recording runs a local proxy in front of the real API; point
+``FINNHUB_BASE_URL`` (or ``MarketDataConfig.finnhub_base_url``) at it and
+drive any workload, or record a symbol list from the command line:
+
+    python -m tests.utils.finnhub_replay record --out finnhub.json.gz AAPL MSFT
+
+Replay serves the recorded responses with configurable latency, jitter and
+injected 429/5xx rates. Injection uses a seeded RNG so a run is repeatable.
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+from aiohttp import web
+
+FINNHUB_API_URL = "https://finnhub.io/api/v1"
+RECORDED_PATHS = ('/quote', '/stock/profile2', '/search', '/stock/market-status')
+
+_CASSETTE_VERSION = 1
+
+
+class FinnhubCassette:
+    """
+    Recorded Finnhub responses keyed by path and query.
+    
+    The API token is never part of a key or stored. Several responses for
+    the same request are replayed in turn, so a recording of a moving price
+    replays as a moving price.
+    """
+    
+    def __init__(self):
+        self.entries: Dict[str, List[Tuple[int, Any]]] = {}
+    
+    @staticmethod
+    def key(path: str, params: Dict[str, str]) -> str:
+        """Canonical request key without the API token."""
+        query = '&'.join(f"{name}={params[name]}" for name in sorted(params) if name != 'token')
+        return f"{path}?{query}"
+    
+    def add(self, path: str, params: Dict[str, str], status: int, body: Any) -> None:
+        """Record a response."""
+        self.entries.setdefault(self.key(path, params), []).append((status, body))
+    
+    def responses(self, path: str, params: Dict[str, str]) -> List[Tuple[int, Any]]:
+        """Recorded responses for a request, in recording order."""
+        return self.entries.get(self.key(path, params), [])
+    
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self.entries.values())
+    
+    def save(self, path: str) -> None:
+        """Write the cassette as gzipped JSON."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        payload = {'version': _CASSETTE_VERSION, 'entries': self.entries}
+        temp_path = f"{path}.tmp"
+        with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+            json.dump(payload, f, separators=(',', ':'))
+        os.replace(temp_path, path)
+    
+    @classmethod
+    def load(cls, path: str) -> 'FinnhubCassette':
+        """Read a cassette written by save()."""
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            payload = json.load(f)
+        if payload.get('version') != _CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {payload.get('version')}")
+        
+        cassette = cls()
+        cassette.entries = {
+            key: [(status, body) for status, body in responses]
+            for key, responses in payload['entries'].items()
+        }
+        return cassette
+
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+class _LocalServer:
+    """Runs an aiohttp app on a free local port, answering every GET with one handler."""
+    
+    def __init__(self, handler: Handler):
+        self.url: Optional[str] = None
+        self._handler = handler
+        self._runner: Optional[web.AppRunner] = None
+    
+    async def start(self, port: int = 0) -> str:
+        """Start serving and return the base URL to use as ``finnhub_base_url``."""
+        app = web.Application()
+        app.router.add_get('/{path:.*}', self._handler)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', port)
+        await site.start()
+        
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+    
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+
+class FinnhubRecordingProxy(_LocalServer):
+    """
+    Local proxy that forwards requests to Finnhub and records the responses.
+    
+    Usage:
+        async with FinnhubRecordingProxy() as proxy:
+            # run MarketDataService with finnhub_base_url=proxy.url
+            ...
+        proxy.cassette.save('finnhub.json.gz')
+    """
+    
+    def __init__(self, upstream_url: str = FINNHUB_API_URL,
+                 cassette: Optional[FinnhubCassette] = None):
+        super().__init__(self._handle)
+        self.upstream_url = upstream_url.rstrip('/')
+        self.cassette = cassette or FinnhubCassette()
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def start(self, port: int = 0) -> str:
+        self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        return await super().start(port)
+    
+    async def stop(self) -> None:
+        await super().stop()
+        if self._session:
+            await self._session.close()
+            self._session = None
+    
+    async def _handle(self, request: web.Request) -> web.Response:
+        path = '/' + request.match_info['path']
+        params = dict(request.query)
+        
+        async with self._session.get(f"{self.upstream_url}{path}", params=params) as response:
+            body = await response.read()
+            status = response.status
+        
+        # Only successful payloads of the replayable endpoints are kept;
+        # failures are injected at replay time instead
+        if path in RECORDED_PATHS and status == 200:
+            self.cassette.add(path, params, status, json.loads(body))
+        
+        return web.Response(status=status, body=body, content_type='application/json')
+
+
+class FinnhubReplayServer(_LocalServer):
+    """
+    Local Finnhub stand-in serving recorded responses.
+    
+    Unrecorded requests get a 404. Failure injection is applied before the
+    recorded response is looked up.
+    
+    Usage:
+        server = FinnhubReplayServer(FinnhubCassette.load('finnhub.json.gz'),
+                                     latency_ms=40, jitter_ms=20, error_rate=0.01)
+        base_url = await server.start()
+        ...
+        await server.stop()
+    """
+    
+    def __init__(self, cassette: FinnhubCassette, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 rate_limit_rate: float = 0.0, error_rate: float = 0.0, seed: int = 0):
+        """
+        Initialize replay server.
+        
+        Args:
+            cassette: Recorded responses to serve
+            latency_ms: Base response delay
+            jitter_ms: Maximum extra random delay
+            rate_limit_rate: Fraction of requests answered with 429
+            error_rate: Fraction of requests answered with a 5xx status
+            seed: Seed for latency jitter and failure injection
+        """
+        super().__init__(self._handle)
+        if not 0 <= rate_limit_rate + error_rate <= 1:
+            raise ValueError("Injected failure rates must sum to between 0 and 1")
+        
+        self.cassette = cassette
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._positions: Dict[str, int] = {}
+        
+        self.requests = 0
+        self.status_counts: Dict[int, int] = {}
+        self.unmatched: List[str] = []
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Request counts by response status."""
+        return {
+            'requests': self.requests,
+            'status_counts': dict(self.status_counts),
+            'unmatched': len(self.unmatched)
+        }
+    
+    async def _handle(self, request: web.Request) -> web.Response:
+        path = '/' + request.match_info['path']
+        params = dict(request.query)
+        self.requests += 1
+        
+        delay = self.latency_ms + self._random.uniform(0, self.jitter_ms)
+        roll = self._random.random()
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        
+        if roll < self.rate_limit_rate:
+            return self._respond(429, {'error': 'API limit reached. Please try again later.'})
+        if roll < self.rate_limit_rate + self.error_rate:
+            return self._respond(self._random.choice((500, 502, 503)), {'error': 'Injected server error'})
+        
+        responses = self.cassette.responses(path, params)
+        if not responses:
+            self.unmatched.append(self.cassette.key(path, params))
+            return self._respond(404, {'error': 'No recorded response'})
+        
+        key = self.cassette.key(path, params)
+        position = self._positions.get(key, 0)
+        self._positions[key] = position + 1
+        status, body = responses[position % len(responses)]
+        return self._respond(status, body)
+    
+    def _respond(self, status: int, body: Any) -> web.Response:
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        return web.json_response(body, status=status)
+
+
+async def record_symbols(symbols: Sequence[str], api_key: str, out_path: str,
+                         queries: Sequence[str] = (), exchanges: Sequence[str] = ('US',),
+                         samples: int = 1, interval_seconds: float = 1.0,
+                         upstream_url: str = FINNHUB_API_URL) -> FinnhubCassette:
+    """
+    Record quotes, profiles, searches and market status through the proxy.
+    
+    Args:
+        symbols: Symbols to record quotes and profiles for
+        api_key: Finnhub API key
+        out_path: Cassette file to write
+        queries: Symbol search queries to record
+        exchanges: Exchanges to record market status for
+        samples: Quote samples per symbol
+        interval_seconds: Delay between quote samples
+        upstream_url: Finnhub REST base URL
+    
+    Returns:
+        FinnhubCassette: The recorded cassette
+    """
+    async with FinnhubRecordingProxy(upstream_url) as proxy, aiohttp.ClientSession() as session:
+        async def fetch(path: str, **params: str) -> None:
+            async with session.get(f"{proxy.url}{path}", params={**params, 'token': api_key}) as response:
+                await response.read()
+        
+        for symbol in symbols:
+            await fetch('/stock/profile2', symbol=symbol)
+        for query in queries:
+            await fetch('/search', q=query)
+        for exchange in exchanges:
+            await fetch('/stock/market-status', exchange=exchange)
+        
+        for sample in range(samples):
+            if sample:
+                await asyncio.sleep(interval_seconds)
+            for symbol in symbols:
+                await fetch('/quote', symbol=symbol)
+    
+    proxy.cassette.save(out_path)
+    return proxy.cassette
+
+
+async def _serve(cassette_path: str, port: int, **options: Any) -> None:
+    server = FinnhubReplayServer(FinnhubCassette.load(cassette_path), **options)
+    url = await server.start(port)
+    print(f"Replaying {cassette_path} at {url}")
+    
+    started = time.monotonic()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        print(f"Served {server.requests} requests in {time.monotonic() - started:.0f}s: {server.get_stats()}")
+        await server.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record or replay Finnhub REST traffic")
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    record = commands.add_parser('record', help="Record responses for symbols from the real API")
+    record.add_argument('symbols', nargs='+')
+    record.add_argument('--out', required=True)
+    record.add_argument('--query', action='append', default=[])
+    record.add_argument('--samples', type=int, default=1)
+    record.add_argument('--interval', type=float, default=1.0)
+    
+    serve = commands.add_parser('serve', help="Serve a cassette on a local port")
+    serve.add_argument('cassette')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--latency-ms', type=float, default=0.0)
+    serve.add_argument('--jitter-ms', type=float, default=0.0)
+    serve.add_argument('--rate-limit-rate', type=float, default=0.0)
+    serve.add_argument('--error-rate', type=float, default=0.0)
+    serve.add_argument('--seed', type=int, default=0)
+    
+    args = parser.parse_args()
+    if args.command == 'record':
+        cassette = asyncio.run(record_symbols(
+            [symbol.upper() for symbol in args.symbols], os.environ['FINNHUB_API_KEY'], args.out,
+            queries=args.query, samples=args.samples, interval_seconds=args.interval
+        ))
+        print(f"Recorded {len(cassette)} responses to {args.out}")
+    else:
+        try:
+            asyncio.run(_serve(
+                args.cassette, args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                rate_limit_rate=args.rate_limit_rate, error_rate=args.error_rate, seed=args.seed
+            ))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Local Stand-in for the Streaming Trade Feed
+
+Serves the Finnhub-style WebSocket trade protocol on a local port so the
+streaming quote client can be tested end to end: clients subscribe and
+unsubscribe per symbol, published trades are delivered to subscribed
+connections only, and connections can be dropped to exercise reconnects.
+"""
+
+import asyncio
+import json
+import time
+from decimal import Decimal
+from typing import Dict, List, Optional, Set, Union
+
+from aiohttp import web, WSMsgType
+
+
+class MockQuoteFeedServer:
+    """
+    In-process WebSocket trade feed for testing.
+    
+    Usage:
+        server = MockQuoteFeedServer(api_key='test')
+        url = await server.start()
+        await server.publish('AAPL', '190.10')
+        await server.stop()
+    """
+    
+    def __init__(self, api_key: str = 'test_api_key'):
+        self.api_key = api_key
+        self.url: Optional[str] = None
+        self.connections: Dict[web.WebSocketResponse, Set[str]] = {}
+        self.total_connections = 0
+        self.rejected_connections = 0
+        self.subscription_log: List[tuple] = []
+        self._runner: Optional[web.AppRunner] = None
+        self._subscribed = asyncio.Condition()
+    
+    async def start(self) -> str:
+        """Start serving on a free local port and return the feed URL."""
+        app = web.Application()
+        app.router.add_get('/', self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}/"
+        return self.url
+    
+    async def stop(self) -> None:
+        """Close all connections and stop the server."""
+        await self.drop_connections()
+        if self._runner:
+            await self._runner.cleanup()
+    
+    @property
+    def subscriptions(self) -> Set[str]:
+        """Symbols subscribed on any open connection."""
+        return set().union(*self.connections.values()) if self.connections else set()
+    
+    async def wait_for_subscriptions(self, symbols: Set[str], timeout: float = 2.0) -> None:
+        """Wait until the given symbols are subscribed on an open connection."""
+        async with self._subscribed:
+            await asyncio.wait_for(
+                self._subscribed.wait_for(lambda: symbols <= self.subscriptions), timeout
+            )
+    
+    async def publish(self, symbol: str, price: Union[str, Decimal, float],
+                      volume: int = 100, timestamp_ms: Optional[int] = None) -> int:
+        """
+        Send a trade to every connection subscribed to the symbol.
+        
+        Returns:
+            Number of connections the trade was delivered to
+        """
+        return await self.publish_trades([{
+            's': symbol,
+            'p': float(price),
+            't': timestamp_ms if timestamp_ms is not None else int(time.time() * 1000),
+            'v': volume
+        }])
+    
+    async def publish_trades(self, trades: List[Dict]) -> int:
+        """Send trade entries, each to the connections subscribed to its symbol."""
+        delivered = 0
+        for ws, symbols in list(self.connections.items()):
+            data = [trade for trade in trades if trade['s'] in symbols]
+            if data and not ws.closed:
+                await ws.send_str(json.dumps({'type': 'trade', 'data': data}))
+                delivered += 1
+        return delivered
+    
+    async def send_ping(self) -> None:
+        """Send a protocol-level ping message to every connection."""
+        for ws in list(self.connections):
+            await ws.send_str(json.dumps({'type': 'ping'}))
+    
+    async def drop_connections(self) -> None:
+        """Close every open connection from the server side."""
+        for ws in list(self.connections):
+            await ws.close()
+        self.connections.clear()
+    
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        if request.query.get('token') != self.api_key:
+            self.rejected_connections += 1
+            raise web.HTTPUnauthorized()
+        
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections[ws] = set()
+        self.total_connections += 1
+        
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                payload = json.loads(message.data)
+                symbol = payload.get('symbol', '').upper()
+                self.subscription_log.append((payload.get('type'), symbol))
+                
+                async with self._subscribed:
+                    if payload.get('type') == 'subscribe':
+                        self.connections.get(ws, set()).add(symbol)
+                    elif payload.get('type') == 'unsubscribe':
+                        self.connections.get(ws, set()).discard(symbol)
+                    self._subscribed.notify_all()
+        finally:
+            self.connections.pop(ws, None)
+        
+        return ws
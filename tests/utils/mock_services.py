@@ -248,7 +248,24 @@ class MockDatabaseService:
         
         position.last_updated = datetime.now(timezone.utc)
         return True
-    
+
+    async def settle_trade(self, trade: Trade) -> bool:
+        """Store a trade and apply its position change in one call."""
+        self.call_log.append(('settle_trade', trade.trade_id, trade.status))
+        self._maybe_raise_error('settle_trade')
+
+        key = f"{trade.user_id}:{trade.trade_id}"
+        self.trades[key] = trade
+
+        if trade.status == TradeStatus.EXECUTED:
+            quantity = trade.quantity if trade.trade_type == TradeType.BUY else -trade.quantity
+            await self.update_position(
+                trade.user_id, trade.symbol, quantity,
+                trade.execution_price or trade.price, trade.trade_id
+            )
+
+        return True
+
     async def is_channel_approved(self, channel_id: str) -> bool:
         """Check if channel is approved."""
         self.call_log.append(('is_channel_approved', channel_id))
@@ -304,7 +321,8 @@ class MockMarketDataService:
             if random.random() < self.error_probability:
                 raise MarketDataError(f"Simulated market data error in {operation}", "SIMULATED_ERROR")
     
-    async def get_quote(self, symbol: str) -> MarketQuote:
+    async def get_quote(self, symbol: str, use_cache: bool = True, require_fresh: bool = False,
+                        priority: Any = None) -> MarketQuote:
         """Get market quote for symbol."""
         self.call_log.append(('get_quote', symbol))
         
@@ -320,7 +338,8 @@ class MockMarketDataService:
             # Generate random quote for unknown symbols
             return create_test_market_quote(symbol, Decimal('100.00'))
     
-    async def get_multiple_quotes(self, symbols: List[str]) -> Dict[str, MarketQuote]:
+    async def get_multiple_quotes(self, symbols: List[str], use_cache: bool = True, require_fresh: bool = False,
+                                  priority: Any = None) -> Dict[str, MarketQuote]:
         """Get quotes for multiple symbols."""
         self.call_log.append(('get_multiple_quotes', symbols))
         
@@ -338,6 +357,14 @@ class MockMarketDataService:
         
         return quotes
     
+    async def watch_symbols(self, source: str, symbols: List[str], ttl_seconds: Optional[float] = None):
+        """Record streaming interest."""
+        self.call_log.append(('watch_symbols', source, list(symbols)))
+    
+    async def unwatch_symbols(self, source: str):
+        """Record withdrawn streaming interest."""
+        self.call_log.append(('unwatch_symbols', source))
+    
     def set_quote(self, symbol: str, quote: MarketQuote):
         """Set specific quote for testing."""
         self.market_data[symbol.upper()] = quote
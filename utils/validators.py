@@ -96,6 +96,20 @@ class SymbolValidator:
         '.AS': 'Euronext Amsterdam'
     }
     
+    # Optional listing of tradable symbols; anything supporting ``symbol in
+    # universe`` (e.g. the market data service's symbol universe)
+    symbol_universe: Optional[Any] = None
+    
+    @classmethod
+    def set_symbol_universe(cls, universe: Optional[Any]) -> None:
+        """
+        Check symbols against a listing in addition to their format.
+        
+        Args:
+            universe: Container of listed symbols, or None to check format only
+        """
+        cls.symbol_universe = universe
+    
     @classmethod
     def validate_symbol(cls, symbol: str, allow_international: bool = True) -> ValidationResult:
         """
@@ -163,6 +177,14 @@ class SymbolValidator:
             )
             return result
         
+        # The universe lists the home market; exchange-suffixed international
+        # symbols are checked by format only
+        is_suffixed_international = allow_international and '.' in cleaned_symbol
+        if (cls.symbol_universe is not None and not is_suffixed_international and
+                cleaned_symbol not in cls.symbol_universe):
+            result.add_error(f"Symbol '{cleaned_symbol}' is not listed", "symbol", "UNKNOWN_SYMBOL")
+            return result
+        
         # Additional checks for specific patterns
         if re.search(r'[0-9]', base_symbol):
             result.add_warning("Symbol contains numbers, which is unusual for stock symbols")